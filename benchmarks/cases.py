@@ -0,0 +1,96 @@
+"""
+Benchmark cases for the solvers and material models.
+
+Each case is a zero-argument callable that performs one timed unit of work.
+Setup that should not be timed happens when the case is built.
+"""
+import contextlib
+import io
+import warnings
+import numpy as np
+from root_finding_methods import BisectionSolver, NewtonMethodSolver
+from elasto_plastic_models import KinematicHardeningModel, IsotropicHardeningModel
+
+NEWTON_SIZES = (2, 10, 50, 100, 500)
+
+
+def bisection_scalar():
+    solver = BisectionSolver(max_iterations=100, tolerance=1e-10)
+    targets = np.linspace(1.0, 9.0, 200).tolist()
+
+    def run():
+        for target in targets:
+            solver.solve(lambda x: x**3 - x - target, 0.0, 3.0)
+    return run
+
+
+def newton_system(n):
+    # Diagonally dominant tridiagonal system with a cubic nonlinearity
+    def residual(x):
+        r = 4 * x + 0.1 * x**3 - 1
+        r[1:] -= x[:-1]
+        r[:-1] -= x[1:]
+        return r
+
+    solver = NewtonMethodSolver(tolerance=1e-10)
+    initial_guess = np.zeros(n)
+
+    def run():
+        solver.solve(residual, initial_guess)
+    return run
+
+
+def cyclic_strains(cycles, points_per_cycle=200, amplitude=0.02):
+    return amplitude * np.sin(np.linspace(0, 2 * np.pi * cycles, cycles * points_per_cycle))
+
+
+def single_point(model_class, *args):
+    strains = cyclic_strains(50).tolist()
+
+    def run():
+        model = model_class(*args)
+        for strain in strains:
+            model.calculate_stress(strain)
+    return run
+
+
+def cyclic_history(model_class, *args):
+    strains = cyclic_strains(5000)
+    model_class(*args).calculate_stress_path(strains[:10])  # compile the kernel outside the timing
+
+    def run():
+        model_class(*args).calculate_stress_path(strains)
+    return run
+
+
+def example_script(module_name):
+    def run():
+        import importlib
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        module = importlib.import_module(f"examples.{module_name}")
+        with contextlib.redirect_stdout(io.StringIO()), warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            if hasattr(module, "run_tutorial_examples"):
+                module.run_tutorial_examples()
+            else:
+                for name in sorted(dir(module)):
+                    if name.startswith("example_"):
+                        getattr(module, name)()
+                        plt.close("all")
+    return run
+
+
+def build_cases():
+    """Return the benchmark cases as an ordered {name: callable} mapping."""
+    cases = {"bisection_scalar": bisection_scalar()}
+    for n in NEWTON_SIZES:
+        cases[f"newton_system_{n}"] = newton_system(n)
+    cases["kinematic_single_point"] = single_point(KinematicHardeningModel, 200e3, 250, 10e3)
+    cases["isotropic_single_point"] = single_point(IsotropicHardeningModel, 200e3, 250, 500, 0.1)
+    cases["kinematic_cyclic_history"] = cyclic_history(KinematicHardeningModel, 200e3, 250, 10e3)
+    cases["isotropic_cyclic_history"] = cyclic_history(IsotropicHardeningModel, 200e3, 250, 500, 0.1)
+    for module_name in ("bisection_examples", "newton_examples", "elasto_model_examples"):
+        cases[f"example_{module_name}"] = example_script(module_name)
+    return cases
@@ -0,0 +1,114 @@
+"""
+Run the benchmark suite, write JSON results and compare them against a baseline.
+
+Usage:
+    python -m benchmarks.run_benchmarks --output results.json
+    python -m benchmarks.run_benchmarks --baseline baseline.json --threshold 1.25
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from .cases import build_cases
+
+def run_benchmarks(cases: Dict[str, Callable[[], None]], repeat: int = 5) -> Dict:
+    """
+    Time every case `repeat` times.
+
+    Args:
+        cases (Dict[str, Callable[[], None]]): Benchmark cases by name
+        repeat (int): Number of timed runs per case
+
+    Returns:
+        Dict: JSON-serializable results with per-case best and mean wall times in seconds
+    """
+    if repeat <= 0:
+        raise ValueError("Repeat must be a positive integer")
+
+    results = {}
+    for name, case in cases.items():
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            case()
+            times.append(time.perf_counter() - start)
+        results[name] = {"best": min(times), "mean": sum(times) / len(times), "repeat": repeat}
+    return {
+        "metadata": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare_results(results: Dict, baseline: Dict, threshold: float = 1.25,
+                    case_thresholds: Optional[Dict[str, float]] = None) -> List[Dict]:
+    """
+    Compare best times against a baseline.
+
+    Args:
+        results (Dict): Output of run_benchmarks
+        baseline (Dict): Stored output of an earlier run
+        threshold (float): Allowed slowdown ratio before a case counts as a regression
+        case_thresholds (Optional[Dict[str, float]]): Per-case overrides of threshold
+
+    Returns:
+        List[Dict]: One entry per case present in both runs, with its ratio and regression flag
+    """
+    case_thresholds = case_thresholds or {}
+    comparison = []
+    for name, current in results["results"].items():
+        if name not in baseline["results"]:
+            continue
+        limit = case_thresholds.get(name, threshold)
+        ratio = current["best"] / baseline["results"][name]["best"]
+        comparison.append({"name": name, "ratio": ratio, "threshold": limit, "regression": ratio > limit})
+    return comparison
+
+
+def _parse_case_threshold(text: str):
+    name, _, value = text.partition("=")
+    if not value:
+        raise argparse.ArgumentTypeError("Expected NAME=RATIO")
+    return name, float(value)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default="benchmark_results.json", help="Where to write the JSON results")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Allowed slowdown ratio (default 1.25)")
+    parser.add_argument("--case-threshold", type=_parse_case_threshold, action="append", default=[],
+                        metavar="NAME=RATIO", help="Per-case slowdown ratio, may be repeated")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case (default 5)")
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this text")
+    args = parser.parse_args(argv)
+
+    cases = {name: case for name, case in build_cases().items() if args.filter in name}
+    results = run_benchmarks(cases, args.repeat)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    for name, timing in results["results"].items():
+        print(f"{name:32s} best {timing['best'] * 1e3:10.3f} ms   mean {timing['mean'] * 1e3:10.3f} ms")
+
+    if args.baseline is None:
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    comparison = compare_results(results, baseline, args.threshold, dict(args.case_threshold))
+    print("\nComparison against baseline")
+    for entry in comparison:
+        flag = "REGRESSION" if entry["regression"] else "ok"
+        print(f"{entry['name']:32s} x{entry['ratio']:6.2f} (limit x{entry['threshold']:.2f})  {flag}")
+    return 1 if any(entry["regression"] for entry in comparison) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
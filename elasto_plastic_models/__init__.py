@@ -1,6 +1,17 @@
-from .kinematic_hardening import KinematicHardeningModel
-from .isotropic_hardening import IsotropicHardeningModel
+from .kinematic_hardening import KinematicHardeningModel, BatchKinematicHardeningModel, KinematicState
+from .isotropic_hardening import (IsotropicHardeningModel, BatchIsotropicHardeningModel, ReturnMappingStatus,
+                                  IsotropicState)
+from .j2_plasticity import J2PlasticityModel
+from .calibration import HardeningModelCalibrator, ExperimentalCurve, CalibrationResult
+from .strain_sources import iter_strain_chunks
+from .result_store import ResultWriter, ResultReader, record_stress_stream
+from .bar_finite_elements import ElastoPlasticBar, BarSolution
 
-__all__ = ['KinematicHardeningModel', 'IsotropicHardeningModel']
+__all__ = ['KinematicHardeningModel', 'BatchKinematicHardeningModel', 'KinematicState',
+           'IsotropicHardeningModel', 'BatchIsotropicHardeningModel', 'ReturnMappingStatus', 'IsotropicState',
+           'J2PlasticityModel',
+           'HardeningModelCalibrator', 'ExperimentalCurve', 'CalibrationResult',
+           'iter_strain_chunks', 'ResultWriter', 'ResultReader', 'record_stress_stream',
+           'ElastoPlasticBar', 'BarSolution']
 
 __version__ = "0.1.0"
\ No newline at end of file
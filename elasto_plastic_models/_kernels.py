@@ -0,0 +1,147 @@
+"""
+Tight per-step loops shared by the hardening models.
+
+The kernels are plain Python on floats. When numba is installed they are
+compiled with `numba.njit`; otherwise they run interpreted over Python lists,
+which still avoids the per-step method-call and NumPy scalar overhead of
+calling `calculate_stress` in a loop.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def kernel_input(strains):
+    """Convert a strain history to the fastest input type for the active backend."""
+    strains = np.ascontiguousarray(strains, dtype=float).ravel()
+    return strains if HAS_NUMBA else strains.tolist()
+
+
+def linearized_increment(E, sigma_y, n, trial_stress, yield_stress, plastic_strain):
+    """
+    Starting increment of `newton_return_mapping`: one Newton step from d = 0,
+    with the hardening modulus n K alpha**(n - 1) = n (yield_stress - sigma_y) / alpha
+    of the committed state so that no power has to be evaluated.
+    """
+    h = n * (yield_stress - sigma_y) / plastic_strain if plastic_strain > 0 else 0.0
+    return (abs(trial_stress) - yield_stress) / (E + h)
+
+
+_linearized_increment = njit(cache=True)(linearized_increment)
+
+
+def newton_return_mapping(E, sigma_y, K, n, strain_excess, plastic_strain, initial_increment,
+                           tolerance, max_iterations):
+    """
+    Safeguarded scalar Newton iteration on the consistency condition
+
+        g(d) = E * (strain_excess - d) - (sigma_y + K * (plastic_strain + d)**n) = 0
+
+    for the plastic increment magnitude d in [0, strain_excess], where
+    strain_excess = |total_strain - plastic_strain| and plastic_strain is the
+    accumulated (equivalent) plastic strain. g is strictly decreasing, so every evaluation shrinks the bracket
+    and any Newton step leaving it is replaced by bisection.
+
+    The hardening K * (plastic_strain + d)**n of the returned increment is
+    returned too, so callers need not evaluate the power again.
+
+    Returns:
+        tuple: (increment, hardening, function evaluations, converged)
+    """
+    lower, upper = 0.0, strain_excess
+    d = min(max(initial_increment, lower), upper)
+    for evaluations in range(1, max_iterations + 1):
+        accumulated = plastic_strain + d
+        hardening = K * accumulated**n if accumulated > 0 else 0.0
+        g = E * (strain_excess - d) - (sigma_y + hardening)
+        if abs(g) < tolerance:
+            return d, hardening, evaluations, True
+        if g > 0:
+            lower = d
+        else:
+            upper = d
+
+        if accumulated > 0:
+            d_new = d + g / (E + n * hardening / accumulated)
+        else:
+            d_new = lower - 1.0  # infinite slope at the origin, force a bisection step
+        if not lower < d_new < upper:
+            d_new = 0.5 * (lower + upper)
+        if d_new == d:
+            return d, hardening, evaluations, True
+        d = d_new
+    return d, K * (plastic_strain + d)**n, max_iterations, False
+
+
+_newton_return_mapping = njit(cache=True)(newton_return_mapping)
+
+
+@njit(cache=True)
+def kinematic_path(E, sigma_y, H, strains, plastic_strain, back_stress,
+                   stresses, plastic_strains, back_stresses):
+    """
+    Run KinematicHardeningModel.calculate_stress over a whole strain history.
+
+    Writes into the preallocated output arrays and returns the final
+    (plastic_strain, back_stress).
+    """
+    for i in range(len(strains)):
+        total_strain = strains[i]
+        trial_stress = E * (total_strain - plastic_strain)
+        effective_stress = trial_stress - back_stress
+        if abs(effective_stress) <= sigma_y:
+            stresses[i] = trial_stress
+        else:
+            sign = 1.0 if effective_stress > 0 else -1.0
+            plastic_strain_increment = (abs(effective_stress) - sigma_y) / (E + H)
+            plastic_strain += sign * plastic_strain_increment
+            back_stress += H * sign * plastic_strain_increment
+            stresses[i] = E * (total_strain - plastic_strain)
+        plastic_strains[i] = plastic_strain
+        back_stresses[i] = back_stress
+    return plastic_strain, back_stress
+
+
+@njit(cache=True)
+def isotropic_path(E, sigma_y, K, n, strains, plastic_strain, equivalent_plastic_strain, current_yield_stress,
+                   last_increment, tolerance, max_iterations, stresses, plastic_strains, yield_stresses):
+    """
+    Run IsotropicHardeningModel.calculate_stress with the Newton return mapping
+    over a whole strain history.
+
+    Writes into the preallocated output arrays and returns the final
+    (plastic_strain, equivalent_plastic_strain, current_yield_stress,
+    last_increment) together with the (converged, evaluations) of the last
+    plastic step.
+    """
+    converged, evaluations = True, 0
+    for i in range(len(strains)):
+        total_strain = strains[i]
+        trial_stress = E * (total_strain - plastic_strain)
+        if abs(trial_stress) <= current_yield_stress:
+            stresses[i] = trial_stress
+        else:
+            initial = _linearized_increment(E, sigma_y, n, trial_stress, current_yield_stress,
+                                            equivalent_plastic_strain)
+            d_ep, hardening, evaluations, converged = _newton_return_mapping(
+                E, sigma_y, K, n, abs(total_strain - plastic_strain), equivalent_plastic_strain, initial,
+                tolerance, max_iterations)
+            last_increment = d_ep
+            sign = 1.0 if trial_stress > 0 else -1.0
+            plastic_strain += sign * d_ep
+            equivalent_plastic_strain += d_ep
+            current_yield_stress = sigma_y + hardening
+            stresses[i] = sign * current_yield_stress
+        plastic_strains[i] = plastic_strain
+        yield_stresses[i] = current_yield_stress
+    return plastic_strain, equivalent_plastic_strain, current_yield_stress, last_increment, converged, evaluations
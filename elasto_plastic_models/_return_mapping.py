@@ -0,0 +1,56 @@
+"""
+Vectorized return mapping shared by the batch isotropic and J2 models.
+"""
+import numpy as np
+
+
+def active_set_return_mapping(limit, stiffness, factor, sigma_y, K, n, equivalent_plastic_strain,
+                              initial_increment, tolerance, max_iterations):
+    """
+    Safeguarded Newton iteration on the consistency conditions
+
+        g(d) = stiffness * (limit - d) - factor * (sigma_y + K * (alpha + factor * d)**n) = 0
+
+    of many yielding points at once, where alpha is the equivalent plastic strain
+    and d the plastic increment in [0, limit]. g is strictly decreasing, so every
+    evaluation shrinks the bracket of each point and Newton steps leaving it are
+    replaced by bisection. Points are retired from the active set as they converge.
+
+    BatchIsotropicHardeningModel uses stiffness E and factor 1, with limit the
+    strain excess; J2PlasticityModel uses stiffness 2 G + 2/3 H and factor
+    sqrt(2/3), with limit the perfectly plastic multiplier.
+
+    Returns:
+        tuple: (increments, converged flags)
+    """
+    lower = np.zeros(limit.shape)
+    upper = limit.copy()
+    d = np.clip(initial_increment, lower, upper)
+    converged = np.zeros(limit.shape, dtype=bool)
+    active = np.arange(limit.size)
+
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        d_a = d[active]
+        accumulated = equivalent_plastic_strain[active] + factor * d_a
+        hardening = K * accumulated**n
+        g = stiffness * (limit[active] - d_a) - factor * (sigma_y + hardening)
+
+        lower_a = np.where(g > 0, d_a, lower[active])
+        upper_a = np.where(g > 0, upper[active], d_a)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d_new = d_a + g / (stiffness + factor**2 * n * hardening / accumulated)
+        # Infinite slope at the origin or a step outside the bracket: bisect instead
+        outside = ~((lower_a < d_new) & (d_new < upper_a)) | ~(accumulated > 0)
+        d_new = np.where(outside, 0.5 * (lower_a + upper_a), d_new)
+
+        done = (np.abs(g) < tolerance) | (d_new == d_a)
+        converged[active[done]] = True
+        keep = ~done
+        active = active[keep]
+        d[active] = d_new[keep]
+        lower[active] = lower_a[keep]
+        upper[active] = upper_a[keep]
+
+    return d, converged
@@ -0,0 +1,64 @@
+"""
+Adaptive sub-stepping of a strain increment with a step-doubling error estimate.
+
+A return mapping over one large increment and over the same increment taken
+in pieces need not end in the same state. `adaptive_step` splits an increment only where the two
+disagree: every trial substep is taken once whole and once as two halves, the
+stress difference is the local error estimate, and the substep grows or
+shrinks to keep that estimate below the tolerance. Elastic substeps are
+accepted without the extra halves.
+"""
+import math
+
+SAFETY = 0.9
+MIN_FACTOR = 0.1
+MAX_FACTOR = 2.0
+
+
+def adaptive_step(model, state, total_strain, tolerance, max_substeps):
+    """
+    Advance a model state from state.total_strain to total_strain in adaptive substeps.
+
+    The model provides `sigma_y` and `_step(total_strain, state)`, a single
+    return-mapping step without side effects that returns the stress, tangent,
+    new state and return mapping status (None for an elastic step). States
+    have `total_strain` and `plastic_strain` fields. The error is measured
+    relative to max(|stress|, sigma_y).
+
+    Returns:
+        tuple: Stress, tangent of the last substep, state at total_strain, the
+        number of accepted substeps and the status of the last plastic step
+    """
+    start = state.total_strain
+    increment = total_strain - start
+    min_fraction = 1.0 / max_substeps
+    position, fraction = 0.0, 1.0
+    stress, tangent, status, substeps = None, None, None, 0
+
+    while position < 1.0:
+        fraction = min(fraction, 1.0 - position)
+        end = 1.0 if position + fraction >= 1.0 else position + fraction
+        whole, tangent, accepted, step_status = model._step(start + end * increment, state)
+
+        if accepted.plastic_strain == state.plastic_strain:
+            # Elastic along the whole substep: the single step is exact
+            error = 0.0
+            stress = whole
+        else:
+            _, _, halfway, half_status = model._step(start + 0.5 * (position + end) * increment, state)
+            stress, tangent, accepted, step_status = model._step(start + end * increment, halfway)
+            step_status = half_status if step_status is None else step_status
+            error = abs(stress - whole) / max(abs(stress), model.sigma_y)
+
+            if error > tolerance and fraction > min_fraction:
+                fraction = max(fraction * max(MIN_FACTOR, SAFETY * math.sqrt(tolerance / error)), min_fraction)
+                continue
+
+        state = accepted
+        status = status if step_status is None else step_status
+        position = end
+        substeps += 1
+        growth = MAX_FACTOR if error == 0 else min(MAX_FACTOR, SAFETY * math.sqrt(tolerance / error))
+        fraction = max(fraction * growth, min_fraction)
+
+    return stress, tangent, state._replace(total_strain=total_strain), substeps, status
@@ -0,0 +1,211 @@
+import numpy as np
+import scipy.sparse
+from typing import NamedTuple, Optional, Sequence
+from root_finding_methods import NewtonMethodSolver
+
+
+class BarSolution(NamedTuple):
+    """Converged load steps of ElastoPlasticBar.solve."""
+    load_factors: np.ndarray
+    displacements: np.ndarray
+    stresses: np.ndarray
+    reactions: np.ndarray
+    iterations: np.ndarray
+    converged: bool
+
+
+class ElastoPlasticBar:
+    def __init__(self,
+                 nodes: Sequence[float],
+                 material,
+                 areas=1.0,
+                 elements: Optional[np.ndarray] = None,
+                 fixed_nodes: Sequence[int] = (0,),
+                 solver: Optional[NewtonMethodSolver] = None,
+                 max_cutbacks: int = 8):
+        """
+        Finite-element model of 1D bars and collinear trusses made of a hardening material.
+
+        Each two-node element has constant strain and one material point of a batch
+        hardening model. Internal forces and the tangent stiffness are assembled
+        with scatter-adds into a sparse matrix, which is banded when the nodes are
+        numbered along the bar. The equilibrium equations of every load step are
+        solved by NewtonMethodSolver with that stiffness as the Jacobian, so each
+        iteration costs one material update and one sparse LU solve. The residual
+        is divided by a reference force, the largest of the applied nodal forces,
+        the committed axial forces and sigma_y times the largest area, so the
+        solver tolerance is relative and independent of the mesh size and units.
+
+        Args:
+            nodes (Sequence[float]): Node coordinates along the bar axis
+            material: BatchKinematicHardeningModel or BatchIsotropicHardeningModel with one
+                point per element
+            areas (float or array-like): Cross-section area of every element
+            elements (Optional[np.ndarray]): (n_elements, 2) node indices of each element,
+                in either order. Defaults to a chain of consecutive nodes
+            fixed_nodes (Sequence[int]): Nodes with prescribed displacement
+            solver (Optional[NewtonMethodSolver]): Equilibrium solver. Defaults to
+                NewtonMethodSolver(max_iterations=25, tolerance=1e-6)
+            max_cutbacks (int): Times a failed load step may be halved
+
+        Raises:
+            ValueError: If the mesh, material or boundary conditions are invalid
+        """
+        self.nodes = np.asarray(nodes, dtype=float)
+        n_nodes = len(self.nodes)
+        if elements is None:
+            elements = np.column_stack([np.arange(n_nodes - 1), np.arange(1, n_nodes)])
+        self.elements = np.array(elements, dtype=int)
+        if self.elements.ndim != 2 or self.elements.shape[1] != 2 or len(self.elements) == 0:
+            raise ValueError("Elements must have shape (n_elements, 2)")
+        # Order every element from its left to its right node so lengths and tensile stresses are positive
+        reversed_elements = self.nodes[self.elements[:, 1]] < self.nodes[self.elements[:, 0]]
+        self.elements[reversed_elements] = self.elements[reversed_elements, ::-1]
+        self.lengths = self.nodes[self.elements[:, 1]] - self.nodes[self.elements[:, 0]]
+        if not np.all(self.lengths != 0):
+            raise ValueError("Elements must have nonzero length")
+        if material.n_points != len(self.elements):
+            raise ValueError("Material must have one point per element")
+        fixed_nodes = np.unique(np.asarray(fixed_nodes, dtype=int))
+        if fixed_nodes.size == 0:
+            raise ValueError("At least one node must be fixed")
+
+        self.material = material
+        self.areas = np.broadcast_to(np.asarray(areas, dtype=float), self.lengths.shape).copy()
+        self.fixed_nodes = fixed_nodes
+        self.free_nodes = np.setdiff1d(np.arange(n_nodes), fixed_nodes)
+        self.solver = solver if solver is not None else NewtonMethodSolver(max_iterations=25, tolerance=1e-6)
+        self.max_cutbacks = max_cutbacks
+        self.displacements = np.zeros(n_nodes)
+        self.stresses = np.zeros(len(self.elements))
+
+        # Stiffness entries coupling two free nodes, in COO order: ii, jj, ij, ji for every element
+        free_index = np.full(n_nodes, -1)
+        free_index[self.free_nodes] = np.arange(self.free_nodes.size)
+        first, second = free_index[self.elements[:, 0]], free_index[self.elements[:, 1]]
+        rows = np.concatenate([first, second, first, second])
+        cols = np.concatenate([first, second, second, first])
+        self._stiffness_entries = (rows >= 0) & (cols >= 0)
+        self._stiffness_rows = rows[self._stiffness_entries]
+        self._stiffness_cols = cols[self._stiffness_entries]
+
+    def strains(self, displacements: np.ndarray) -> np.ndarray:
+        """Element strains for the given nodal displacements."""
+        return (displacements[self.elements[:, 1]] - displacements[self.elements[:, 0]]) / self.lengths
+
+    def internal_forces(self, stresses: np.ndarray) -> np.ndarray:
+        """Assemble nodal internal forces from element stresses."""
+        axial_forces = stresses * self.areas
+        n_nodes = len(self.nodes)
+        return (np.bincount(self.elements[:, 1], axial_forces, n_nodes)
+                - np.bincount(self.elements[:, 0], axial_forces, n_nodes))
+
+    def tangent_stiffness(self, tangents: np.ndarray) -> scipy.sparse.csc_matrix:
+        """Assemble the free-free block of the tangent stiffness from element tangent moduli."""
+        k = tangents * self.areas / self.lengths
+        values = np.concatenate([k, k, -k, -k])[self._stiffness_entries]
+        n = self.free_nodes.size
+        return scipy.sparse.csc_matrix((values, (self._stiffness_rows, self._stiffness_cols)), shape=(n, n))
+
+    def solve(self,
+              load_factors: Sequence[float],
+              forces: Optional[np.ndarray] = None,
+              prescribed_displacements: Optional[np.ndarray] = None) -> BarSolution:
+        """
+        Incremental-iterative solution for proportional loading.
+
+        At load factor t the nodal forces are t * forces and the fixed nodes are
+        displaced by t * prescribed_displacements. Each step starts from the last
+        converged state. Newton iterations only evaluate material trials, the
+        material is committed once equilibrium is found, and a step that fails is
+        split in half up to `max_cutbacks` times.
+
+        Args:
+            load_factors (Sequence[float]): Load factors of the requested steps
+            forces (Optional[np.ndarray]): Reference nodal forces, shape (n_nodes,)
+            prescribed_displacements (Optional[np.ndarray]): Reference displacements of
+                the fixed nodes, shape (n_fixed,)
+
+        Returns:
+            BarSolution: Displacements (n_steps, n_nodes), element stresses (n_steps,
+            n_elements), reactions at the fixed nodes (n_steps, n_fixed) and Newton
+            iterations of the converged steps. `converged` is False if a step failed,
+            in which case only the steps before it are returned
+        """
+        n_nodes = len(self.nodes)
+        forces = np.zeros(n_nodes) if forces is None else np.asarray(forces, dtype=float)
+        prescribed = (np.zeros(self.fixed_nodes.size) if prescribed_displacements is None
+                      else np.asarray(prescribed_displacements, dtype=float))
+        if forces.shape != (n_nodes,):
+            raise ValueError(f"Forces must have shape ({n_nodes},)")
+        if prescribed.shape != self.fixed_nodes.shape:
+            raise ValueError(f"Prescribed displacements must have shape ({self.fixed_nodes.size},)")
+
+        steps, displacements, stresses, reactions, iterations = [], [], [], [], []
+        current = 0.0
+        converged = True
+        for target in load_factors:
+            increment = target - current
+            cutbacks = 0
+            spent = 0
+            while current != target:
+                step_target = current + increment if abs(increment) < abs(target - current) else target
+                ok, its = self._load_step(step_target, forces, prescribed)
+                spent += its
+                if not ok:
+                    if cutbacks == self.max_cutbacks:
+                        converged = False
+                        break
+                    cutbacks += 1
+                    increment /= 2
+                    continue
+                current = step_target
+            if not converged:
+                break
+            steps.append(target)
+            displacements.append(self.displacements.copy())
+            stresses.append(self.stresses.copy())
+            reactions.append(self.internal_forces(self.stresses)[self.fixed_nodes] - target * forces[self.fixed_nodes])
+            iterations.append(spent)
+
+        n_steps = len(steps)
+        return BarSolution(np.array(steps), np.array(displacements).reshape(n_steps, n_nodes),
+                           np.array(stresses).reshape(n_steps, len(self.elements)),
+                           np.array(reactions).reshape(n_steps, self.fixed_nodes.size),
+                           np.array(iterations, dtype=int), converged)
+
+    def _load_step(self, load_factor, forces, prescribed):
+        """Find equilibrium at one load factor and commit it. Returns whether it converged and the iterations."""
+        displacements = self.displacements.copy()
+        displacements[self.fixed_nodes] = load_factor * prescribed
+        external = load_factor * forces[self.free_nodes]
+        scale = max(np.abs(load_factor * forces).max(), np.abs(self.stresses * self.areas).max(),
+                    self.material.sigma_y * self.areas.max())
+        trial = {}
+
+        # Every evaluation is a trial from the committed state, so failed steps need no rollback
+        def residual(u_free):
+            displacements[self.free_nodes] = u_free
+            stress, tangent, state = self.material.trial(self.strains(displacements))
+            trial.update(x=u_free.copy(), stress=stress, tangent=tangent, state=state)
+            return (self.internal_forces(stress)[self.free_nodes] - external) / scale
+
+        def evaluated(u_free):
+            if "x" not in trial or not np.array_equal(trial["x"], u_free):
+                residual(u_free)
+            return trial
+
+        def jacobian(u_free):
+            return self.tangent_stiffness(evaluated(u_free)["tangent"] / scale)
+
+        try:
+            u_free, its = self.solver.solve(residual, displacements[self.free_nodes], jacobian=jacobian)
+        except ValueError as error:
+            return False, error.result.iterations if hasattr(error, "result") else 0
+
+        converged = evaluated(u_free)
+        self.material.commit(converged["state"])
+        displacements[self.free_nodes] = u_free
+        self.displacements = displacements
+        self.stresses = converged["stress"]
+        return True, its
@@ -0,0 +1,166 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, NamedTuple, Optional, Sequence
+from root_finding_methods import NewtonMethodSolver
+
+class ExperimentalCurve(NamedTuple):
+    """Measured stress response to a strain history."""
+    strains: np.ndarray
+    stresses: np.ndarray
+
+
+class CalibrationResult(NamedTuple):
+    """Best fit found by HardeningModelCalibrator.fit."""
+    parameters: Dict[str, float]
+    cost: float
+    iterations: int
+    converged: bool
+
+
+def _curve_residuals(task):
+    """Stress residuals, model minus measured, of one (model_class, parameters, curve) replay."""
+    model_class, parameters, curve = task
+    stresses, _, _ = model_class(**parameters).calculate_stress_path(curve.strains)
+    return stresses - curve.stresses
+
+
+class HardeningModelCalibrator:
+    def __init__(self,
+                 model_class,
+                 curves: Sequence[ExperimentalCurve],
+                 parameter_names: Sequence[str],
+                 fixed_parameters: Optional[Dict[str, float]] = None,
+                 n_workers: Optional[int] = None,
+                 max_iterations: int = 50,
+                 tolerance: float = 1e-10,
+                 h: float = 1e-6):
+        """
+        Least-squares calibration of a hardening model against measured curves.
+
+        Parameters are fitted in log space with a Levenberg-Marquardt iteration.
+        The residual Jacobian comes from the batched central differences of
+        NewtonMethodSolver, and every (candidate, curve) replay is an independent
+        task that can be spread across a process pool. The replayed stresses are
+        only piecewise smooth in the parameters, so passing several starts to
+        `fit` is the usual guard against local minima.
+
+        Args:
+            model_class: Model to calibrate, e.g. IsotropicHardeningModel
+            curves (Sequence[ExperimentalCurve]): Measured strain/stress histories
+            parameter_names (Sequence[str]): Positive constructor arguments to fit
+            fixed_parameters (Optional[Dict[str, float]]): Constructor arguments held fixed
+            n_workers (Optional[int]): Worker processes for the replays; None runs serially
+            max_iterations (int): Levenberg-Marquardt iteration limit per start
+            tolerance (float): Relative cost reduction below which a start has converged
+            h (float): Finite-difference step in log-parameter space
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        if not curves:
+            raise ValueError("At least one experimental curve is required")
+        if not parameter_names:
+            raise ValueError("At least one parameter must be fitted")
+        if max_iterations <= 0:
+            raise ValueError("Max iterations must be positive")
+        if tolerance <= 0:
+            raise ValueError("Tolerance must be positive")
+
+        self.model_class = model_class
+        self.curves = [ExperimentalCurve(np.asarray(c.strains, dtype=float), np.asarray(c.stresses, dtype=float))
+                       for c in curves]
+        self.parameter_names = list(parameter_names)
+        self.fixed_parameters = dict(fixed_parameters or {})
+        self.n_workers = n_workers
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.jacobian_solver = NewtonMethodSolver(h=h, vectorized=True)
+        self._executor = None
+
+    def _parameters(self, log_values: np.ndarray) -> Dict[str, float]:
+        parameters = dict(self.fixed_parameters)
+        parameters.update(zip(self.parameter_names, np.exp(log_values).tolist()))
+        return parameters
+
+    def _batch_residuals(self, log_values: np.ndarray) -> np.ndarray:
+        """Residuals of every candidate row of log_values, one replay task per (candidate, curve)."""
+        log_values = np.atleast_2d(log_values)
+        tasks = [(self.model_class, self._parameters(row), curve) for row in log_values for curve in self.curves]
+        if self._executor is None:
+            results = list(map(_curve_residuals, tasks))
+        else:
+            results = list(self._executor.map(_curve_residuals, tasks,
+                                              chunksize=max(1, len(tasks) // (4 * self.n_workers))))
+        n_curves = len(self.curves)
+        return np.array([np.concatenate(results[i:i + n_curves]) for i in range(0, len(results), n_curves)])
+
+    def residuals(self, parameters: Dict[str, float]) -> np.ndarray:
+        """
+        Stacked model-minus-measured stresses over all curves.
+
+        Args:
+            parameters (Dict[str, float]): Values of the fitted parameters
+
+        Returns:
+            np.ndarray: Residual vector
+        """
+        log_values = np.log([parameters[name] for name in self.parameter_names])
+        return self._batch_residuals(log_values)[0]
+
+    def fit(self, initial_guesses) -> CalibrationResult:
+        """
+        Calibrate from one or several starting points and keep the best fit.
+
+        Args:
+            initial_guesses (dict or list of dict): Starting values of the fitted parameters
+
+        Returns:
+            CalibrationResult: Best parameters, cost 0.5 * |r|^2, iterations and convergence flag
+        """
+        if isinstance(initial_guesses, dict):
+            initial_guesses = [initial_guesses]
+
+        if self.n_workers is None:
+            return min((self._fit_start(guess) for guess in initial_guesses), key=lambda result: result.cost)
+        with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
+            self._executor = executor
+            try:
+                return min((self._fit_start(guess) for guess in initial_guesses), key=lambda result: result.cost)
+            finally:
+                self._executor = None
+
+    def _fit_start(self, initial_guess: Dict[str, float]) -> CalibrationResult:
+        """Levenberg-Marquardt iteration in log-parameter space from one start."""
+        x = np.log([initial_guess[name] for name in self.parameter_names])
+        r = self._batch_residuals(x)[0]
+        cost = initial_cost = 0.5 * r @ r
+        damping = 1e-3
+
+        for iterations in range(1, self.max_iterations + 1):
+            J = self.jacobian_solver.numerical_jacobian(self._batch_residuals, x)
+            gradient = J.T @ r
+            normal_matrix = J.T @ J
+            scaling = np.diag(np.diag(normal_matrix)) + np.finfo(float).eps * np.eye(len(x))
+
+            while True:
+                try:
+                    step = np.linalg.solve(normal_matrix + damping * scaling, -gradient)
+                except np.linalg.LinAlgError:
+                    step = None
+                if step is not None:
+                    r_new = self._batch_residuals(x + step)[0]
+                    cost_new = 0.5 * r_new @ r_new
+                    if np.isfinite(cost_new) and cost_new < cost:
+                        break
+                damping *= 10
+                if damping > 1e12:
+                    # No descent left: either the data is matched exactly or this is a local minimum
+                    return CalibrationResult(self._parameters(x), cost, iterations, cost <= self.tolerance * initial_cost)
+
+            reduction = cost - cost_new
+            x, r, cost = x + step, r_new, cost_new
+            damping = max(damping / 10, 1e-12)
+            if reduction <= self.tolerance * cost or cost == 0:
+                return CalibrationResult(self._parameters(x), cost, iterations, True)
+
+        return CalibrationResult(self._parameters(x), cost, self.max_iterations, False)
@@ -1,60 +1,253 @@
 import numpy as np
-from root_finding_methods import BisectionSolver
+from typing import NamedTuple
+from root_finding_methods import BrentSolver
+from ._kernels import linearized_increment, newton_return_mapping, isotropic_path, kernel_input
+from ._return_mapping import active_set_return_mapping
+from ._substepping import adaptive_step
+from .strain_sources import iter_strain_chunks
+
+class ReturnMappingStatus(NamedTuple):
+    """Outcome of the return mapping of the last plastic step."""
+    converged: bool
+    iterations: int
+    function_evaluations: int
+
+
+class IsotropicState(NamedTuple):
+    """Committed history of an IsotropicHardeningModel."""
+    total_strain: float
+    plastic_strain: float
+    equivalent_plastic_strain: float
+    yield_stress: float
+    last_increment: float
+
 
 class IsotropicHardeningModel:
-    def __init__(self, E, sigma_y, K, n):
+    RETURN_MAPPINGS = ("newton", "bracketed")
+    PATH_FIELDS = ("stress", "plastic_strain", "yield_stress")
+
+    def __init__(self, E, sigma_y, K, n, solver=None, return_mapping="newton", substep_tolerance=None,
+                 max_substeps=1000):
         """
         Initialize the Isotropic Hardening Model.
-        
+
+        The history of the model is an immutable IsotropicState in `state`, so a
+        snapshot is the state object itself and rolling back is `commit(snapshot)`.
+        The yield stress hardens with the equivalent plastic strain, the sum of all
+        plastic increment magnitudes, so it never softens when the load reverses.
+
         Args:
         E (float): Young's modulus
         sigma_y (float): Initial yield stress
         K (float): Strength coefficient
         n (float): Strain hardening exponent
+        solver (BisectionSolver, optional): Bracketed root finder for the plastic
+            increment. Defaults to BrentSolver(max_iterations=1000, tolerance=1e-6)
+        return_mapping (str): "newton" for a linearized, bracket-safeguarded Newton
+            iteration on the consistency condition, or "bracketed" to use the solver
+        substep_tolerance (float, optional): Relative stress error per increment. When set,
+            each increment is split into adaptive substeps; None takes it in one step
+        max_substeps (int): Upper bound on the substeps of one increment
         """
+        if return_mapping not in self.RETURN_MAPPINGS:
+            raise ValueError(f"Return mapping must be one of {self.RETURN_MAPPINGS}")
+        if substep_tolerance is not None and substep_tolerance <= 0:
+            raise ValueError("Substep tolerance must be a positive float")
+        if max_substeps <= 0:
+            raise ValueError("Max substeps must be a positive integer")
+
         self.E = E
         self.sigma_y = sigma_y
         self.K = K
         self.n = n
-        self.plastic_strain = 0
-        self.current_yield_stress = sigma_y
-        self.solver = BisectionSolver(max_iterations=1000, tolerance=1e-6)
+        self.solver = solver if solver is not None else BrentSolver(max_iterations=1000, tolerance=1e-6)
+        self.return_mapping = return_mapping
+        self.substep_tolerance = substep_tolerance
+        self.max_substeps = max_substeps
+        self.reset()
+
+    @property
+    def total_strain(self):
+        return self.state.total_strain
+
+    @property
+    def plastic_strain(self):
+        return self.state.plastic_strain
+
+    @property
+    def equivalent_plastic_strain(self):
+        return self.state.equivalent_plastic_strain
+
+    @property
+    def current_yield_stress(self):
+        return self.state.yield_stress
 
+    @property
+    def last_increment(self):
+        return self.state.last_increment
 
-    def calculate_stress(self, total_strain):
-        trial_stress = self.E * (total_strain - self.plastic_strain)
+    def calculate_stress(self, total_strain, return_tangent=False):
+        """
+        Update the model to a new total strain.
+
+        Args:
+        total_strain (float): Total strain
+        return_tangent (bool): Also return the consistent tangent d(stress)/d(total_strain)
+            of this update. With sub-stepping it is the tangent of the last substep
+
+        Returns:
+        float or tuple: Stress, or stress and tangent modulus
+        """
+        stress, self.tangent, state, self.substeps, status = self._trial(total_strain, self.state)
+        self.commit(state)
+        if status is not None:
+            self.status = status
+        if return_tangent:
+            return stress, self.tangent
+        return stress
+
+    def trial(self, total_strain, state=None):
+        """
+        Evaluate the model at a new total strain without changing it.
+
+        Global Newton iterations and line searches can evaluate any number of
+        trials and `commit` only the accepted one. Unlike `calculate_stress`,
+        a trial does not update `tangent`, `status` or `substeps`.
+
+        Args:
+        total_strain (float): Total strain
+        state (IsotropicState, optional): State to start from instead of the committed one
+
+        Returns:
+        tuple: Stress, consistent tangent and the IsotropicState after the update
+        """
+        return self._trial(total_strain, self.state if state is None else state)[:3]
+
+    def _trial(self, total_strain, state):
+        """Trial update that also returns the number of substeps and the last return mapping status."""
+        if self.substep_tolerance is None:
+            stress, tangent, state, status = self._step(total_strain, state)
+            return stress, tangent, state, 1, status
+        return adaptive_step(self, state, total_strain, self.substep_tolerance, self.max_substeps)
+
+    def commit(self, state):
+        """Make a state returned by `trial` or `snapshot` the current state."""
+        self.state = state
+
+    def snapshot(self):
+        """Current state; it is immutable, so keeping it is enough to restore it later with `commit`."""
+        return self.state
+
+    def _step(self, total_strain, state):
+        trial_stress = self.E * (total_strain - state.plastic_strain)
         
-        if abs(trial_stress) <= self.current_yield_stress:
-            return trial_stress
+        if abs(trial_stress) <= state.yield_stress:
+            return trial_stress, self.E, IsotropicState(total_strain, *state[1:]), None
+
+        strain_excess = abs(total_strain - state.plastic_strain)
+        accumulated = state.equivalent_plastic_strain
+        if self.return_mapping == "newton":
+            initial = linearized_increment(self.E, self.sigma_y, self.n, trial_stress, state.yield_stress,
+                                           accumulated)
+            d_ep, hardening, evaluations, converged = newton_return_mapping(
+                self.E, self.sigma_y, self.K, self.n, strain_excess, accumulated, initial,
+                self.solver.tolerance, self.solver.max_iterations)
+            status = ReturnMappingStatus(converged, evaluations, evaluations)
         else:
             def yield_function(d_ep):
-                return abs(self.E * (total_strain - self.plastic_strain - d_ep)) - (self.sigma_y + self.K * (abs(self.plastic_strain) + abs(d_ep))**self.n)
-            
+                return self.E * (strain_excess - d_ep) - (self.sigma_y + self.K * (accumulated + d_ep)**self.n)
+
             try:
-                d_ep, _ = self.solver.solve(yield_function, 0, abs(total_strain - self.plastic_strain))
-            except ValueError as e:
-                print(f"Error in bisection solver: {e}")
-                # Use a simple iterative method as fallback
-                d_ep = 0
-                step = abs(total_strain - self.plastic_strain) / 1000
-                for _ in range(1000):  # Limit iterations to prevent infinite loop
-                    if yield_function(d_ep) <= 0:
-                        break
-                    d_ep += step
-                else:
-                    print("Failed to find valid plastic strain increment")
-                    return np.sign(trial_stress) * self.current_yield_stress
-            
-            d_ep *= np.sign(total_strain - self.plastic_strain)
-            self.plastic_strain += d_ep
-            self.current_yield_stress = self.sigma_y + self.K * abs(self.plastic_strain)**self.n
-            
-            return np.sign(trial_stress) * self.current_yield_stress
+                result = self.solver.solve(yield_function, 0, strain_excess)
+            except ValueError:
+                status = ReturnMappingStatus(False, 0, self.solver.function_evaluations)
+                return np.sign(trial_stress) * state.yield_stress, 0.0, IsotropicState(total_strain, *state[1:]), status
+            d_ep = result.root
+            hardening = self.K * (accumulated + d_ep)**self.n
+            status = ReturnMappingStatus(result.converged, result.iterations, result.function_evaluations)
+
+        accumulated += d_ep
+        yield_stress = self.sigma_y + hardening
+        new_plastic_strain = state.plastic_strain + np.sign(trial_stress) * d_ep
+
+        return (np.sign(trial_stress) * yield_stress, self._plastic_tangent(accumulated),
+                IsotropicState(total_strain, new_plastic_strain, accumulated, yield_stress, d_ep), status)
+
+    def _plastic_tangent(self, accumulated):
+        """
+        Consistent tangent E h / (E + h) of a plastic step, with the hardening
+        modulus h = n K accumulated**(n - 1) at the new equivalent plastic strain.
+        """
+        if accumulated == 0:
+            return self.E
+        h = self.n * self.K * accumulated**(self.n - 1)
+        return h * self.E / (self.E + h)
+
+    def calculate_stress_path(self, strains):
+        """
+        Drive the model through a whole strain history in one tight loop.
+
+        Equivalent to calling `calculate_stress` for every strain in turn. With
+        the Newton return mapping and no sub-stepping the loop runs in a kernel
+        that is JIT-compiled when numba is installed.
+
+        Args:
+        strains (array-like): Total strain history
+
+        Returns:
+        tuple: Stress, plastic strain and yield stress arrays, one entry per step
+        """
+        strains = np.asarray(strains, dtype=float)
+        stresses = np.empty(strains.shape)
+        plastic_strains = np.empty(strains.shape)
+        yield_stresses = np.empty(strains.shape)
+
+        if self.return_mapping == "newton" and self.substep_tolerance is None:
+            (plastic_strain, equivalent_plastic_strain, yield_stress, last_increment,
+             converged, evaluations) = isotropic_path(
+                self.E, self.sigma_y, self.K, self.n, kernel_input(strains),
+                float(self.plastic_strain), float(self.equivalent_plastic_strain),
+                float(self.current_yield_stress), float(self.last_increment),
+                self.solver.tolerance, self.solver.max_iterations,
+                stresses.reshape(-1), plastic_strains.reshape(-1), yield_stresses.reshape(-1))
+            if evaluations:
+                self.status = ReturnMappingStatus(converged, evaluations, evaluations)
+            total_strain = float(strains.flat[-1]) if strains.size else self.total_strain
+            self.commit(IsotropicState(total_strain, plastic_strain, equivalent_plastic_strain, yield_stress,
+                                       last_increment))
+        else:
+            for i, strain in enumerate(strains.flat):
+                stresses.flat[i] = self.calculate_stress(strain)
+                plastic_strains.flat[i] = self.plastic_strain
+                yield_stresses.flat[i] = self.current_yield_stress
+
+        return stresses, plastic_strains, yield_stresses
+
+    def calculate_stress_stream(self, source, chunk_size=65536, **source_options):
+        """
+        Drive the model through a strain history read chunk by chunk.
+
+        Model state carries across chunk boundaries, so concatenating the yielded
+        chunks gives the same result as `calculate_stress_path` on the whole
+        history while memory use stays bounded by the chunk size.
+
+        Args:
+        source: Strain array, iterator or file, see `iter_strain_chunks`
+        chunk_size (int): Maximum number of strains per chunk
+        **source_options: Passed on to `iter_strain_chunks`, e.g. column or dtype
+
+        Yields:
+        tuple: Stress, plastic strain and yield stress arrays of each chunk
+        """
+        for strains in iter_strain_chunks(source, chunk_size, **source_options):
+            yield self.calculate_stress_path(strains)
 
     def reset(self):
         """Reset the model to its initial state."""
-        self.plastic_strain = 0
-        self.current_yield_stress = self.sigma_y
+        self.state = IsotropicState(0.0, 0.0, 0.0, self.sigma_y, 0.0)
+        self.status = None
+        self.substeps = 0
+        self.tangent = self.E
 
     def get_current_yield_stress(self):
         """
@@ -72,4 +265,144 @@ class IsotropicHardeningModel:
         Returns:
         float: Current plastic strain
         """
-        return self.plastic_strain
\ No newline at end of file
+        return self.plastic_strain
+
+
+class BatchIsotropicHardeningModel:
+    STATE_FIELDS = ("plastic_strain", "equivalent_plastic_strain", "yield_stress", "last_increment")
+
+    def __init__(self, E, sigma_y, K, n, n_points, tolerance=1e-6, max_iterations=1000):
+        """
+        Isotropic hardening model for many independent material points.
+
+        Each increment computes all trial stresses at once and runs the
+        safeguarded Newton return mapping of IsotropicHardeningModel only on the
+        yielding subset, retiring points from the active set as they converge.
+        State is held in one (len(STATE_FIELDS), n_points) array, with
+        `plastic_strain`, `current_yield_stress` and `last_increment` as views
+        of its rows. As in IsotropicHardeningModel the yield stress hardens with
+        the equivalent plastic strain.
+
+        Args:
+        E (float): Young's modulus
+        sigma_y (float): Initial yield stress
+        K (float): Strength coefficient
+        n (float): Strain hardening exponent
+        n_points (int): Number of material points
+        tolerance (float): Convergence threshold on the consistency condition
+        max_iterations (int): Iteration limit of the return mapping
+        """
+        self.E = E
+        self.sigma_y = sigma_y
+        self.K = K
+        self.n = n
+        self.n_points = n_points
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.state = np.zeros((len(self.STATE_FIELDS), n_points))
+        self.state[2] = sigma_y
+        self.converged = np.ones(n_points, dtype=bool)
+
+    @property
+    def plastic_strain(self):
+        return self.state[0]
+
+    @property
+    def equivalent_plastic_strain(self):
+        return self.state[1]
+
+    @property
+    def current_yield_stress(self):
+        return self.state[2]
+
+    @property
+    def last_increment(self):
+        return self.state[3]
+
+    def calculate_stress(self, total_strain, return_tangent=False):
+        """
+        Apply one strain increment to all points.
+
+        Points whose return mapping did not converge are flagged in `converged`.
+
+        Args:
+        total_strain (np.ndarray): Total strain of every point, shape (n_points,)
+        return_tangent (bool): Also return the consistent tangent moduli, as IsotropicHardeningModel
+
+        Returns:
+        np.ndarray or tuple: Stress of every point, or stresses and tangent moduli
+        """
+        stress, tangent, state, self.converged = self._trial(total_strain, self.state)
+        self.commit(state)
+        if return_tangent:
+            return stress, tangent
+        return stress
+
+    def trial(self, total_strain, state=None):
+        """
+        Evaluate all points at new total strains without changing the model.
+
+        Unlike `calculate_stress`, a trial does not update `converged`.
+
+        Args:
+        total_strain (np.ndarray): Total strain of every point, shape (n_points,)
+        state (np.ndarray, optional): State array to start from instead of the committed one
+
+        Returns:
+        tuple: Stresses, consistent tangent moduli and the new state array
+        """
+        return self._trial(total_strain, self.state if state is None else state)[:3]
+
+    def _trial(self, total_strain, state):
+        """Trial update that also returns the convergence flags of the return mappings."""
+        total_strain = np.asarray(total_strain, dtype=float)
+        state = state.copy()
+        plastic_strain, equivalent_plastic_strain, yield_stress, last_increment = state
+        stress = self.E * (total_strain - plastic_strain)
+        all_converged = np.ones(stress.shape, dtype=bool)
+
+        plastic = np.flatnonzero(np.abs(stress) > yield_stress)
+        tangent = np.full(stress.shape, float(self.E))
+        if plastic.size == 0:
+            return stress, tangent, state, all_converged
+
+        trial_stress = stress[plastic]
+        strain_excess = np.abs(total_strain[plastic] - plastic_strain[plastic])
+        # Vectorized linearized_increment
+        committed = equivalent_plastic_strain[plastic]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            h = np.where(committed > 0, self.n * (yield_stress[plastic] - self.sigma_y) / committed, 0.0)
+        initial = (np.abs(trial_stress) - yield_stress[plastic]) / (self.E + h)
+        d_ep, converged = active_set_return_mapping(strain_excess, self.E, 1.0, self.sigma_y, self.K, self.n,
+                                                    equivalent_plastic_strain[plastic], initial,
+                                                    self.tolerance, self.max_iterations)
+
+        sign = np.where(trial_stress > 0, 1.0, -1.0)
+        accumulated = committed + d_ep
+        last_increment[plastic] = d_ep
+        all_converged[plastic] = converged
+        plastic_strain[plastic] += sign * d_ep
+        equivalent_plastic_strain[plastic] = accumulated
+        yield_stress[plastic] = self.sigma_y + self.K * accumulated**self.n
+        stress[plastic] = sign * yield_stress[plastic]
+
+        # Consistent tangent of the plastic points, as IsotropicHardeningModel._plastic_tangent
+        with np.errstate(divide="ignore", invalid="ignore"):
+            h = self.n * self.K * accumulated**(self.n - 1)
+            plastic_tangent = h * self.E / (self.E + h)
+        tangent[plastic] = np.where(accumulated == 0, self.E, plastic_tangent)
+        return stress, tangent, state, all_converged
+
+    def commit(self, state):
+        """Copy a state array returned by `trial` or `snapshot` into the model."""
+        self.state[...] = state
+
+    def snapshot(self):
+        """Copy of the state array, to be restored later with `commit`."""
+        return self.state.copy()
+
+    def reset(self):
+        """Reset all points to their initial state."""
+        self.state[...] = 0
+        self.state[2] = self.sigma_y
+        self.converged[:] = True
@@ -0,0 +1,131 @@
+import numpy as np
+from ._return_mapping import active_set_return_mapping
+
+SQRT_2_3 = np.sqrt(2 / 3)
+
+
+class J2PlasticityModel:
+    def __init__(self, E, nu, sigma_y, n_points, H=0.0, K=0.0, n=1.0, tolerance=1e-6, max_iterations=100):
+        """
+        Small-strain von Mises (J2) plasticity for many integration points.
+
+        Strains and stresses use Voigt notation in the order xx, yy, zz, yz, xz, xy,
+        with engineering shear strains. Hardening combines the laws of the 1D
+        models: linear kinematic hardening with modulus H (Prager's rule, the back
+        stress moves by 2/3 * H times the plastic strain) and power-law isotropic
+        hardening sigma_y + K * alpha**n in the equivalent plastic strain alpha.
+        Under uniaxial stress this reproduces the 1D stress-strain curves.
+
+        Every call to `calculate_stress` computes all elastic trial states at once
+        and runs the radial return only on the yielding subset, with a vectorized
+        safeguarded Newton iteration on the plastic multiplier.
+
+        Args:
+        E (float): Young's modulus
+        nu (float): Poisson's ratio
+        sigma_y (float): Initial yield stress
+        n_points (int): Number of integration points
+        H (float): Kinematic hardening modulus
+        K (float): Isotropic strength coefficient
+        n (float): Isotropic strain hardening exponent
+        tolerance (float): Convergence threshold on the consistency condition
+        max_iterations (int): Iteration limit of the return mapping
+        """
+        if not -1 < nu < 0.5:
+            raise ValueError("Poisson's ratio must be in (-1, 0.5)")
+        if n_points <= 0:
+            raise ValueError("Number of points must be positive")
+
+        self.E = E
+        self.nu = nu
+        self.sigma_y = sigma_y
+        self.n_points = n_points
+        self.H = H
+        self.K = K
+        self.n = n
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.shear_modulus = E / (2 * (1 + nu))
+        self.bulk_modulus = E / (3 * (1 - 2 * nu))
+        self.reset()
+
+    def yield_stress(self, equivalent_plastic_strain):
+        """Isotropic yield stress for the given equivalent plastic strain."""
+        return self.sigma_y + self.K * equivalent_plastic_strain**self.n
+
+    def calculate_stress(self, strain_increment):
+        """
+        Apply one strain increment to all points.
+
+        Points whose return mapping did not converge are flagged in `converged`.
+
+        Args:
+        strain_increment (np.ndarray): Voigt strain increments, shape (n_points, 6)
+
+        Returns:
+        tuple: Copies of the stress (n_points, 6), plastic strain (n_points, 6), back stress
+            (n_points, 6) and equivalent plastic strain (n_points,) after the increment
+        """
+        strain_increment = np.asarray(strain_increment, dtype=float)
+        if strain_increment.shape != (self.n_points, 6):
+            raise ValueError(f"Strain increment must have shape ({self.n_points}, 6)")
+        self.total_strain += strain_increment
+
+        # Elastic trial state split into pressure and deviatoric tensor components
+        elastic_strain = self.total_strain - self.plastic_strain
+        volumetric = elastic_strain[:, :3].sum(axis=1)
+        deviator = 2 * self.shear_modulus * elastic_strain
+        deviator[:, :3] -= 2 * self.shear_modulus * volumetric[:, np.newaxis] / 3
+        deviator[:, 3:] *= 0.5
+
+        relative = deviator - self.back_stress
+        relative_norm = np.sqrt((relative[:, :3]**2).sum(axis=1) + 2 * (relative[:, 3:]**2).sum(axis=1))
+        self.converged[:] = True
+
+        plastic = np.flatnonzero(relative_norm > SQRT_2_3 * self.yield_stress(self.equivalent_plastic_strain))
+        if plastic.size:
+            multiplier, converged = self._return_mapping(relative_norm[plastic],
+                                                         self.equivalent_plastic_strain[plastic])
+            direction = relative[plastic] / relative_norm[plastic, np.newaxis]
+            step = multiplier[:, np.newaxis] * direction
+
+            deviator[plastic] -= 2 * self.shear_modulus * step
+            self.back_stress[plastic] += 2 / 3 * self.H * step
+            self.equivalent_plastic_strain[plastic] += SQRT_2_3 * multiplier
+            self.plastic_strain[plastic, :3] += step[:, :3]
+            self.plastic_strain[plastic, 3:] += 2 * step[:, 3:]
+            self.converged[plastic] = converged
+
+        self.stress = deviator
+        self.stress[:, :3] += self.bulk_modulus * volumetric[:, np.newaxis]
+        return (self.stress.copy(), self.plastic_strain.copy(), self.back_stress.copy(),
+                self.equivalent_plastic_strain.copy())
+
+    def _return_mapping(self, relative_norm, equivalent_plastic_strain):
+        """
+        Solve the consistency condition of the radial return for the plastic multiplier d:
+
+            g(d) = |xi_trial| - (2 G + 2/3 H) d - sqrt(2/3) * sigma_y(alpha + sqrt(2/3) d) = 0
+
+        on [0, |xi_trial| / (2 G + 2/3 H)], starting from the linearized estimate.
+        """
+        stiffness = 2 * self.shear_modulus + 2 / 3 * self.H
+        limit = relative_norm / stiffness
+        initial = limit * (1 - SQRT_2_3 * self.yield_stress(equivalent_plastic_strain) / relative_norm)
+        return active_set_return_mapping(limit, stiffness, SQRT_2_3, self.sigma_y, self.K, self.n,
+                                         equivalent_plastic_strain, initial, self.tolerance, self.max_iterations)
+
+    def von_mises_stress(self):
+        """Equivalent von Mises stress of every point."""
+        s = self.stress.copy()
+        s[:, :3] -= s[:, :3].mean(axis=1, keepdims=True)
+        return np.sqrt(1.5 * ((s[:, :3]**2).sum(axis=1) + 2 * (s[:, 3:]**2).sum(axis=1)))
+
+    def reset(self):
+        """Reset all points to their initial state."""
+        self.total_strain = np.zeros((self.n_points, 6))
+        self.plastic_strain = np.zeros((self.n_points, 6))
+        self.back_stress = np.zeros((self.n_points, 6))
+        self.equivalent_plastic_strain = np.zeros(self.n_points)
+        self.stress = np.zeros((self.n_points, 6))
+        self.converged = np.ones(self.n_points, dtype=bool)
@@ -1,27 +1,268 @@
 import numpy as np
+from typing import NamedTuple
+from ._kernels import kinematic_path, kernel_input
+from ._substepping import adaptive_step
+from .strain_sources import iter_strain_chunks
+
+class KinematicState(NamedTuple):
+    """Committed history of a KinematicHardeningModel."""
+    total_strain: float
+    plastic_strain: float
+    back_stress: float
+
 
 class KinematicHardeningModel:
-    def __init__(self, E, sigma_y, H):
+    PATH_FIELDS = ("stress", "plastic_strain", "back_stress")
+
+    def __init__(self, E, sigma_y, H, substep_tolerance=None, max_substeps=1000):
+        """
+        Initialize the Kinematic Hardening Model.
+
+        The history of the model is an immutable KinematicState in `state`, so a
+        snapshot is the state object itself and rolling back is `commit(snapshot)`.
+
+        Args:
+        E (float): Young's modulus
+        sigma_y (float): Yield stress
+        H (float): Kinematic hardening modulus
+        substep_tolerance (float, optional): Relative stress error per increment. When set,
+            each increment is split into adaptive substeps; None takes it in one step
+        max_substeps (int): Upper bound on the substeps of one increment
+        """
+        if substep_tolerance is not None and substep_tolerance <= 0:
+            raise ValueError("Substep tolerance must be a positive float")
+        if max_substeps <= 0:
+            raise ValueError("Max substeps must be a positive integer")
+
         self.E = E
         self.sigma_y = sigma_y
         self.H = H
-        self.plastic_strain = 0
-        self.back_stress = 0
+        self.substep_tolerance = substep_tolerance
+        self.max_substeps = max_substeps
+        self.reset()
+
+    @property
+    def total_strain(self):
+        return self.state.total_strain
+
+    @property
+    def plastic_strain(self):
+        return self.state.plastic_strain
+
+    @property
+    def back_stress(self):
+        return self.state.back_stress
+
+    def calculate_stress(self, total_strain, return_tangent=False):
+        """
+        Update the model to a new total strain.
+
+        Args:
+        total_strain (float): Total strain
+        return_tangent (bool): Also return the consistent tangent d(stress)/d(total_strain)
+            of this update. With sub-stepping it is the tangent of the last substep
+
+        Returns:
+        float or tuple: Stress, or stress and tangent modulus
+        """
+        stress, self.tangent, state, self.substeps, _ = self._trial(total_strain, self.state)
+        self.commit(state)
+        if return_tangent:
+            return stress, self.tangent
+        return stress
+
+    def trial(self, total_strain, state=None):
+        """
+        Evaluate the model at a new total strain without changing it.
 
-    def calculate_stress(self, total_strain):
-        elastic_strain = total_strain - self.plastic_strain
+        Global Newton iterations and line searches can evaluate any number of
+        trials and `commit` only the accepted one. Unlike `calculate_stress`,
+        a trial does not update `tangent` or `substeps`.
+
+        Args:
+        total_strain (float): Total strain
+        state (KinematicState, optional): State to start from instead of the committed one
+
+        Returns:
+        tuple: Stress, consistent tangent and the KinematicState after the update
+        """
+        return self._trial(total_strain, self.state if state is None else state)[:3]
+
+    def _trial(self, total_strain, state):
+        """Trial update that also returns the number of substeps and the return mapping status."""
+        if self.substep_tolerance is None:
+            stress, tangent, state, status = self._step(total_strain, state)
+            return stress, tangent, state, 1, status
+        return adaptive_step(self, state, total_strain, self.substep_tolerance, self.max_substeps)
+
+    def commit(self, state):
+        """Make a state returned by `trial` or `snapshot` the current state."""
+        self.state = state
+
+    def snapshot(self):
+        """Current state; it is immutable, so keeping it is enough to restore it later with `commit`."""
+        return self.state
+
+    def _step(self, total_strain, state):
+        elastic_strain = total_strain - state.plastic_strain
         trial_stress = self.E * elastic_strain
-        effective_stress = trial_stress - self.back_stress
+        effective_stress = trial_stress - state.back_stress
         
         if abs(effective_stress) <= self.sigma_y:
-            return trial_stress
+            return trial_stress, self.E, KinematicState(total_strain, state.plastic_strain, state.back_stress), None
         else:
             sign = np.sign(effective_stress)
             plastic_strain_increment = (abs(effective_stress) - self.sigma_y) / (self.E + self.H)
-            self.plastic_strain += sign * plastic_strain_increment
-            self.back_stress += self.H * sign * plastic_strain_increment
-            return self.E * (total_strain - self.plastic_strain) + self.back_stress
+            plastic_strain = state.plastic_strain + sign * plastic_strain_increment
+            back_stress = state.back_stress + self.H * sign * plastic_strain_increment
+            # The returned stress lies on the shifted yield surface |stress - back_stress| = sigma_y
+            tangent = self.E * self.H / (self.E + self.H)
+            return (self.E * (total_strain - plastic_strain), tangent,
+                    KinematicState(total_strain, plastic_strain, back_stress), None)
+
+    def calculate_stress_path(self, strains):
+        """
+        Drive the model through a whole strain history in one tight loop.
+
+        Equivalent to calling `calculate_stress` for every strain in turn, but
+        without sub-stepping the loop runs in a kernel that is JIT-compiled when
+        numba is installed.
+
+        Args:
+        strains (array-like): Total strain history
+
+        Returns:
+        tuple: Stress, plastic strain and back stress arrays, one entry per step
+        """
+        strains = np.asarray(strains, dtype=float)
+        stresses = np.empty(strains.shape)
+        plastic_strains = np.empty(strains.shape)
+        back_stresses = np.empty(strains.shape)
+
+        if self.substep_tolerance is None:
+            plastic_strain, back_stress = kinematic_path(
+                self.E, self.sigma_y, self.H, kernel_input(strains),
+                float(self.plastic_strain), float(self.back_stress),
+                stresses.reshape(-1), plastic_strains.reshape(-1), back_stresses.reshape(-1))
+            total_strain = float(strains.flat[-1]) if strains.size else self.total_strain
+            self.commit(KinematicState(total_strain, plastic_strain, back_stress))
+        else:
+            for i, strain in enumerate(strains.flat):
+                stresses.flat[i] = self.calculate_stress(strain)
+                plastic_strains.flat[i] = self.plastic_strain
+                back_stresses.flat[i] = self.back_stress
+        return stresses, plastic_strains, back_stresses
+
+    def calculate_stress_stream(self, source, chunk_size=65536, **source_options):
+        """
+        Drive the model through a strain history read chunk by chunk.
+
+        Model state carries across chunk boundaries, so concatenating the yielded
+        chunks gives the same result as `calculate_stress_path` on the whole
+        history while memory use stays bounded by the chunk size.
+
+        Args:
+        source: Strain array, iterator or file, see `iter_strain_chunks`
+        chunk_size (int): Maximum number of strains per chunk
+        **source_options: Passed on to `iter_strain_chunks`, e.g. column or dtype
+
+        Yields:
+        tuple: Stress, plastic strain and back stress arrays of each chunk
+        """
+        for strains in iter_strain_chunks(source, chunk_size, **source_options):
+            yield self.calculate_stress_path(strains)
+
+    def reset(self):
+        self.state = KinematicState(0.0, 0.0, 0.0)
+        self.substeps = 0
+        self.tangent = self.E
+
+class BatchKinematicHardeningModel:
+    STATE_FIELDS = ("plastic_strain", "back_stress")
+
+    def __init__(self, E, sigma_y, H, n_points):
+        """
+        Kinematic hardening model for many independent material points.
+
+        State is held in one (len(STATE_FIELDS), n_points) array, with
+        `plastic_strain` and `back_stress` as views of its rows, and every call
+        to `calculate_stress` updates all points with the same arithmetic as
+        KinematicHardeningModel, so results match the scalar model bit for bit.
+
+        Args:
+        E (float): Young's modulus
+        sigma_y (float): Yield stress
+        H (float): Kinematic hardening modulus
+        n_points (int): Number of material points
+        """
+        self.E = E
+        self.sigma_y = sigma_y
+        self.H = H
+        self.n_points = n_points
+        self.state = np.zeros((len(self.STATE_FIELDS), n_points))
+
+    @property
+    def plastic_strain(self):
+        return self.state[0]
+
+    @property
+    def back_stress(self):
+        return self.state[1]
+
+    def calculate_stress(self, total_strain, return_tangent=False):
+        """
+        Apply one strain increment to all points.
+
+        Args:
+        total_strain (np.ndarray): Total strain of every point, shape (n_points,)
+        return_tangent (bool): Also return the consistent tangent moduli, as KinematicHardeningModel
+
+        Returns:
+        np.ndarray or tuple: Stress of every point, or stresses and tangent moduli
+        """
+        stress, tangent, state = self.trial(total_strain)
+        self.commit(state)
+        if return_tangent:
+            return stress, tangent
+        return stress
+
+    def trial(self, total_strain, state=None):
+        """
+        Evaluate all points at new total strains without changing the model.
+
+        Args:
+        total_strain (np.ndarray): Total strain of every point, shape (n_points,)
+        state (np.ndarray, optional): State array to start from instead of the committed one
+
+        Returns:
+        tuple: Stresses, consistent tangent moduli and the new state array
+        """
+        total_strain = np.asarray(total_strain, dtype=float)
+        state = (self.state if state is None else state).copy()
+        plastic_strain, back_stress = state
+        elastic_strain = total_strain - plastic_strain
+        stress = self.E * elastic_strain
+        effective_stress = stress - back_stress
+
+        plastic = np.flatnonzero(np.abs(effective_stress) > self.sigma_y)
+        tangent = np.full(stress.shape, float(self.E))
+        tangent[plastic] = self.E * self.H / (self.E + self.H)
+        if plastic.size:
+            effective_stress = effective_stress[plastic]
+            sign = np.sign(effective_stress)
+            plastic_strain_increment = (np.abs(effective_stress) - self.sigma_y) / (self.E + self.H)
+            plastic_strain[plastic] += sign * plastic_strain_increment
+            back_stress[plastic] += self.H * sign * plastic_strain_increment
+            stress[plastic] = self.E * (total_strain[plastic] - plastic_strain[plastic])
+        return stress, tangent, state
+
+    def commit(self, state):
+        """Copy a state array returned by `trial` or `snapshot` into the model."""
+        self.state[...] = state
+
+    def snapshot(self):
+        """Copy of the state array, to be restored later with `commit`."""
+        return self.state.copy()
 
     def reset(self):
-        self.plastic_strain = 0
-        self.back_stress = 0
\ No newline at end of file
+        self.state[...] = 0
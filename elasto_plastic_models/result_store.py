@@ -0,0 +1,207 @@
+"""
+Memory-mapped storage for per-step results of long simulations.
+
+A result directory holds one raw column file `<field>.bin` per output field and
+a `metadata.json` describing the fields, their dtype and the number of stored
+steps. ResultWriter appends chunks into growable memory maps and rewrites the
+metadata on every flush, so a run that stops early stays readable up to the
+last flush. ResultReader opens the columns as read-only memory maps, so any
+slice can be read without loading the whole run.
+"""
+import json
+import os
+import numpy as np
+from typing import Dict, Iterable, Optional, Sequence
+from .strain_sources import iter_strain_chunks
+
+METADATA_FILE = "metadata.json"
+
+
+class ResultWriter:
+    def __init__(self,
+                 directory: str,
+                 fields: Sequence[str],
+                 dtype=np.float64,
+                 initial_capacity: int = 65536,
+                 flush_every: int = 1048576,
+                 attributes: Optional[Dict] = None):
+        """
+        Open a new result directory for writing.
+
+        Args:
+            directory (str): Directory to create or overwrite
+            fields (Sequence[str]): Names of the stored columns
+            dtype: Element type of every column
+            initial_capacity (int): Steps preallocated per column; capacity doubles when full
+            flush_every (int): Steps appended between flushes to disk
+            attributes (Optional[Dict]): JSON-serializable data stored with the run, e.g. model parameters
+
+        Raises:
+            ValueError: If the fields or sizes are invalid
+        """
+        if not fields or len(set(fields)) != len(fields):
+            raise ValueError("Fields must be a non-empty sequence of unique names")
+        if initial_capacity <= 0:
+            raise ValueError("Initial capacity must be a positive integer")
+        if flush_every <= 0:
+            raise ValueError("Flush interval must be a positive integer")
+
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.fields = tuple(fields)
+        self.dtype = np.dtype(dtype)
+        self.flush_every = flush_every
+        self.attributes = dict(attributes or {})
+        self.length = 0
+        self.capacity = 0
+        self._unflushed = 0
+        self._columns = {}
+        self._resize(initial_capacity)
+        self._write_metadata()
+
+    def _path(self, field: str) -> str:
+        return os.path.join(self.directory, f"{field}.bin")
+
+    def _resize(self, capacity: int) -> None:
+        """Grow or shrink every column file and map it again."""
+        self._columns = {}
+        for field in self.fields:
+            with open(self._path(field), "ab") as f:
+                f.truncate(capacity * self.dtype.itemsize)
+            self._columns[field] = np.memmap(self._path(field), dtype=self.dtype, mode="r+", shape=(capacity,))
+        self.capacity = capacity
+
+    def append(self, **chunks) -> None:
+        """
+        Append the same number of steps to every field.
+
+        Args:
+            **chunks: One scalar or 1-D array per field
+        """
+        if set(chunks) != set(self.fields):
+            raise ValueError(f"Expected values for exactly the fields {self.fields}")
+        chunks = {field: np.atleast_1d(np.asarray(values, dtype=self.dtype)).reshape(-1)
+                  for field, values in chunks.items()}
+        size = len(chunks[self.fields[0]])
+        if any(len(values) != size for values in chunks.values()):
+            raise ValueError("All fields must receive the same number of steps")
+
+        if self.length + size > self.capacity:
+            self.flush()
+            self._resize(max(2 * self.capacity, self.length + size))
+        for field, values in chunks.items():
+            self._columns[field][self.length:self.length + size] = values
+        self.length += size
+
+        self._unflushed += size
+        if self._unflushed >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the mapped columns and the current length to disk."""
+        for column in self._columns.values():
+            column.flush()
+        self._write_metadata()
+        self._unflushed = 0
+
+    def close(self) -> None:
+        """Flush and trim the column files to the stored length."""
+        if not self._columns:
+            return
+        self.flush()
+        self._columns = {}
+        for field in self.fields:
+            with open(self._path(field), "r+b") as f:
+                f.truncate(self.length * self.dtype.itemsize)
+        self.capacity = self.length
+
+    def _write_metadata(self) -> None:
+        metadata = {"fields": list(self.fields), "dtype": self.dtype.str, "length": self.length,
+                    "attributes": self.attributes}
+        path = os.path.join(self.directory, METADATA_FILE)
+        with open(path + ".tmp", "w") as f:
+            json.dump(metadata, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ResultReader:
+    def __init__(self, directory: str):
+        """
+        Open a result directory written by ResultWriter.
+
+        Columns are memory-mapped read-only and sliced lazily; only the steps
+        that are indexed are read from disk.
+
+        Args:
+            directory (str): Result directory
+        """
+        with open(os.path.join(directory, METADATA_FILE)) as f:
+            metadata = json.load(f)
+        self.directory = directory
+        self.fields = tuple(metadata["fields"])
+        self.dtype = np.dtype(metadata["dtype"])
+        self.length = metadata["length"]
+        self.attributes = metadata["attributes"]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        """Read-only memory map of one column, limited to the stored steps."""
+        if field not in self.fields:
+            raise KeyError(field)
+        if self.length == 0:
+            return np.empty(0, dtype=self.dtype)
+        return np.memmap(os.path.join(self.directory, f"{field}.bin"), dtype=self.dtype, mode="r",
+                         shape=(self.length,))
+
+    def read(self, start: int = 0, stop: Optional[int] = None, step: int = 1,
+             fields: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Load a slice of several columns into memory.
+
+        Args:
+            start (int): First step
+            stop (Optional[int]): End of the slice, None for the last stored step
+            step (int): Stride, e.g. to thin a long run for plotting
+            fields (Optional[Iterable[str]]): Columns to read, all by default
+
+        Returns:
+            Dict[str, np.ndarray]: In-memory copies of the selected slice of each column
+        """
+        fields = self.fields if fields is None else fields
+        return {field: np.array(self[field][start:stop:step]) for field in fields}
+
+
+def record_stress_stream(model, source, directory: str, chunk_size: int = 65536,
+                         flush_every: int = 1048576, **source_options) -> ResultReader:
+    """
+    Drive a hardening model through a strain history straight into a result store.
+
+    The stored fields are "strain" followed by the model's PATH_FIELDS, one
+    step per strain. Memory use is bounded by the chunk size.
+
+    Args:
+        model: KinematicHardeningModel or IsotropicHardeningModel
+        source: Strain array, iterator or file, see `iter_strain_chunks`
+        directory (str): Result directory to write
+        chunk_size (int): Strains processed per chunk
+        flush_every (int): Steps appended between flushes to disk
+        **source_options: Passed on to `iter_strain_chunks`
+
+    Returns:
+        ResultReader: Reader on the finished run
+    """
+    fields = ("strain",) + tuple(model.PATH_FIELDS)
+    with ResultWriter(directory, fields, initial_capacity=chunk_size, flush_every=flush_every,
+                      attributes={"model": type(model).__name__}) as writer:
+        for strains in iter_strain_chunks(source, chunk_size, **source_options):
+            outputs = model.calculate_stress_path(strains)
+            writer.append(**dict(zip(fields, (strains,) + tuple(outputs))))
+    return ResultReader(directory)
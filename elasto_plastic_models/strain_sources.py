@@ -0,0 +1,97 @@
+"""
+Chunked readers for strain histories too long to hold in memory.
+
+`iter_strain_chunks` turns an in-memory array, an iterator, a CSV file, a
+`.npy` file or a raw binary file into a sequence of 1-D float arrays of at most
+`chunk_size` strains. Files are read incrementally (NumPy files through a
+read-only memory map), so memory use is bounded by the chunk size rather than
+by the length of the history.
+"""
+import itertools
+import os
+import numpy as np
+from typing import Iterable, Iterator, Union
+
+CSV_SUFFIXES = (".csv", ".txt")
+NPY_SUFFIXES = (".npy",)
+
+StrainSource = Union[str, os.PathLike, np.ndarray, Iterable]
+
+
+def iter_strain_chunks(source: StrainSource,
+                       chunk_size: int = 65536,
+                       dtype=np.float64,
+                       column: int = 0,
+                       delimiter: str = ",",
+                       skip_header: int = 0,
+                       offset: int = 0) -> Iterator[np.ndarray]:
+    """
+    Yield a strain history as consecutive float arrays of at most chunk_size entries.
+
+    Args:
+        source: A NumPy array, an iterable of strains or of strain arrays, or the
+            path of a `.csv`/`.txt` file, a `.npy` file or a raw binary file
+            (any other suffix)
+        chunk_size (int): Maximum number of strains per chunk
+        dtype: Element type of raw binary files
+        column (int): Column holding the strain in CSV files
+        delimiter (str): Field separator of CSV files
+        skip_header (int): Lines to skip at the top of CSV files
+        offset (int): Bytes to skip at the start of raw binary files
+
+    Raises:
+        ValueError: If chunk_size is not positive
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be a positive integer")
+
+    if isinstance(source, (str, os.PathLike)):
+        suffix = os.path.splitext(os.fspath(source))[1].lower()
+        if suffix in CSV_SUFFIXES:
+            yield from _csv_chunks(source, chunk_size, column, delimiter, skip_header)
+            return
+        if suffix in NPY_SUFFIXES:
+            source = np.load(source, mmap_mode="r")
+        else:
+            source = np.memmap(source, dtype=dtype, mode="r", offset=offset)
+
+    if isinstance(source, np.ndarray):
+        flat = source.reshape(-1)
+        for start in range(0, flat.size, chunk_size):
+            yield np.array(flat[start:start + chunk_size], dtype=float)
+        return
+
+    yield from _iterator_chunks(iter(source), chunk_size)
+
+
+def _csv_chunks(path, chunk_size: int, column: int, delimiter: str, skip_header: int) -> Iterator[np.ndarray]:
+    with open(path) as f:
+        lines = itertools.islice(f, skip_header, None)
+        while True:
+            raw = list(itertools.islice(lines, chunk_size))
+            if not raw:
+                return
+            block = [line for line in raw if line.strip()]
+            if not block:
+                continue
+            yield np.loadtxt(block, delimiter=delimiter, usecols=column, ndmin=1, dtype=float)
+
+
+def _iterator_chunks(items: Iterator, chunk_size: int) -> Iterator[np.ndarray]:
+    """Group scalars into chunks; array items are split to chunk_size and passed through."""
+    buffer = []
+    for item in items:
+        if np.ndim(item) == 0:
+            buffer.append(float(item))
+            if len(buffer) == chunk_size:
+                yield np.array(buffer)
+                buffer = []
+            continue
+        if buffer:
+            yield np.array(buffer)
+            buffer = []
+        flat = np.asarray(item, dtype=float).reshape(-1)
+        for start in range(0, flat.size, chunk_size):
+            yield flat[start:start + chunk_size]
+    if buffer:
+        yield np.array(buffer)
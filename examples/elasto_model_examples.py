@@ -1,6 +1,7 @@
+import tempfile
 import numpy as np
 import matplotlib.pyplot as plt
-from elasto_plastic_models import KinematicHardeningModel, IsotropicHardeningModel
+from elasto_plastic_models import KinematicHardeningModel, IsotropicHardeningModel, record_stress_stream
 
 def print_results(strains, stresses, title):
     # Function to print formatted results
@@ -32,7 +33,7 @@ def example_1():
     # Generate strain values from 0 to 0.02
     strains = np.linspace(0, 0.02, 100)
     # Calculate stresses for each strain value
-    stresses = [model.calculate_stress(strain) for strain in strains]
+    stresses, _, _ = model.calculate_stress_path(strains)
     
     print_results(strains, stresses, "Uniaxial Tension - Kinematic Hardening")
     plot_results(strains, stresses, "Uniaxial Tension - Kinematic Hardening", "Strain", "Stress (MPa)")
@@ -58,7 +59,7 @@ def example_2():
     strains = np.array(strains)
     
     # Calculate stresses for each strain value
-    stresses = [model.calculate_stress(strain) for strain in strains]
+    stresses, _, _ = model.calculate_stress_path(strains)
     
     print_results(strains, stresses, "Cyclic Loading - Kinematic Hardening")
     plot_results(strains, stresses, "Cyclic Loading - Kinematic Hardening", "Strain", "Stress (MPa)")
@@ -98,7 +99,7 @@ def example_3():
     # Generate strain values from 0 to 0.05
     strains = np.linspace(0, 0.05, 100)
     # Calculate stresses for each strain value
-    stresses = [model.calculate_stress(strain) for strain in strains]
+    stresses, _, _ = model.calculate_stress_path(strains)
     
     print_results(strains, stresses, "Uniaxial Tension - Isotropic Hardening")
     plot_results(strains, stresses, "Uniaxial Tension - Isotropic Hardening", "Strain", "Stress (MPa)")
@@ -129,8 +130,8 @@ def example_5():
     # Generate strain values from 0 to 0.05
     strains = np.linspace(0, 0.05, 100)
     # Calculate stresses for each model
-    kin_stresses = [kin_model.calculate_stress(strain) for strain in strains]
-    iso_stresses = [iso_model.calculate_stress(strain) for strain in strains]
+    kin_stresses, _, _ = kin_model.calculate_stress_path(strains)
+    iso_stresses, _, _ = iso_model.calculate_stress_path(strains)
     
     # Print comparison results
     print("\nComparison of Hardening Models")
@@ -154,10 +155,29 @@ def example_5():
     plt.grid(True)
     plt.show()
 
+# Example 6: Long cyclic run recorded to disk and plotted from a slice
+def example_6():
+    model = KinematicHardeningModel(E=200e3, sigma_y=250, H=10e3)
+    cycles = 1000
+    points_per_cycle = 200
+    # Generate the strain history lazily, one cycle at a time
+    cycle = 0.02 * np.sin(np.linspace(0, 2 * np.pi, points_per_cycle, endpoint=False))
+    strains = (cycle for _ in range(cycles))
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Stresses and state go to memory-mapped files instead of lists
+        results = record_stress_stream(model, strains, directory)
+        print(f"\nRecorded {len(results)} steps to {directory}")
+        # Only the last cycle is read back for plotting
+        last_cycle = results.read(start=len(results) - points_per_cycle)
+        plot_results(last_cycle["strain"], last_cycle["stress"], "Last Cycle - Kinematic Hardening",
+                     "Strain", "Stress (MPa)")
+
 if __name__ == "__main__":
     # Run all examples when the script is executed
     example_1()
     example_2()
     example_3()
     example_4()
-    example_5()
\ No newline at end of file
+    example_5()
+    example_6()
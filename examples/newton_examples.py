@@ -104,5 +104,35 @@ def run_tutorial_examples():
     except ValueError as e:
         print(f"5. Beam with Spring: Error - {str(e)}")
 
+    # 6. Load sweep: Nonlinear spring under increasing force
+    def hardening_spring_system(x, F):
+        """
+        Two springs in series, the second stiffening with its stretch
+        F = applied force (swept)
+        x[0] = u1 (displacement of the middle node)
+        x[1] = u2 (displacement of the loaded end)
+        """
+        k1 = 1000  # N/m
+        k2 = 500  # N/m
+        k3 = 5e4  # N/m^3
+        stretch = x[1] - x[0]
+        return np.array([
+            k1 * x[0] - (k2 * stretch + k3 * stretch**3),  # Equilibrium of the middle node
+            k2 * stretch + k3 * stretch**3 - F  # Equilibrium of the loaded end
+        ])
+
+    forces = np.linspace(0, 5000, 11)
+    solutions, iterations, converged = solver.solve_sequence(hardening_spring_system, forces, np.zeros(2))
+    print(f"6. Load sweep: {converged.sum()} of {len(forces)} load steps solved with {solver.function_evaluations} evaluations")
+    for F, (u1, u2) in zip(forces[converged], solutions[converged]):
+        print(f"   F = {F:7.1f} N: u1 = {u1:.4f} m, u2 = {u2:.4f} m")
+
+    # 7. Multi-start: Chemical equilibrium from many random guesses
+    guesses = np.random.default_rng(0).uniform(-2, 2, (100, 3))
+    roots, starts, converged = solver.solve_multistart(chemical_equilibrium, guesses, mode="thread", n_workers=4)
+    print(f"7. Multi-start: {converged.sum()} of {len(guesses)} starts converged to {len(roots)} distinct root(s)")
+    for root, start in zip(roots, starts):
+        print(f"   [A] = {root[0]:.4f}, [B] = {root[1]:.4f}, [C] = {root[2]:.4f} (first found from start {start})")
+
 if __name__ == "__main__":
     run_tutorial_examples()
\ No newline at end of file
@@ -1,4 +1,8 @@
 from .newton_method.newton_solver import NewtonMethodSolver
 from .bisection_method.bisection_solver import BisectionSolver
+from .brent_method.brent_solver import BrentSolver
+from .function_evaluator import FunctionEvaluator, EvaluationBudgetExceeded
+from .solver_result import SolverResult
 
-__all__ = ['NewtonMethodSolver', 'BisectionSolver']
\ No newline at end of file
+__all__ = ['NewtonMethodSolver', 'BisectionSolver', 'BrentSolver', 'FunctionEvaluator', 'EvaluationBudgetExceeded',
+           'SolverResult']
\ No newline at end of file
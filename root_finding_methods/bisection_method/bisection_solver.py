@@ -1,34 +1,95 @@
 import math
+import numpy as np
 from typing import Callable, Optional, Tuple
+from ..function_evaluator import FunctionEvaluator, EvaluationBudgetExceeded
+from ..solver_result import SolverResult, SolveMonitor
 
 class BisectionSolver:
-    def __init__(self, max_iterations: int = 100, tolerance: float = 1e-6):
+    def __init__(self, max_iterations: int = 100, tolerance: float = 1e-6,
+                 cache_size: int = 16, max_evaluations: Optional[int] = None, max_time: Optional[float] = None,
+                 instrument: bool = False):
+        """
+        Initialize the bisection solver.
+
+        Args:
+            max_iterations (int): Maximum iteration limit
+            tolerance (float): Convergence threshold
+            cache_size (int): Recent evaluations cached per solve, so repeated points are free
+            max_evaluations (Optional[int]): Hard limit on function evaluations per solve
+            max_time (Optional[float]): Wall-clock limit in seconds per solve
+            instrument (bool): Record the residual history and the time spent in function evaluation
+
+        Exceeding a budget raises EvaluationBudgetExceeded, a ValueError.
+        """
         if max_iterations <= 0:
             raise ValueError("Max iterations must be a positive integer")
         if tolerance <= 0:
             raise ValueError("Tolerance must be a positive float")
+        FunctionEvaluator.validate_limits(cache_size, max_evaluations, max_time)
 
         self.max_iterations = max_iterations
         self.tolerance = tolerance
+        self.cache_size = cache_size
+        self.max_evaluations = max_evaluations
+        self.max_time = max_time
+        self.instrument = instrument
+        self.callbacks = []
+        self.function_evaluations = 0
+
+    def _evaluator(self, func: Callable, cache: bool = True) -> FunctionEvaluator:
+        return FunctionEvaluator(func, self.cache_size if cache else 0, self.max_evaluations, self.max_time,
+                                 self.instrument)
+
+    def register_callback(self, callback: Callable[[int, float, float], Optional[bool]]) -> None:
+        """
+        Register a function called as callback(iteration, x, abs(f(x))) at every iterate.
+
+        Returning True from the callback stops the solve; the result is then
+        returned with termination_reason "callback".
+        """
+        if not callable(callback):
+            raise TypeError("Callback must be callable")
+        self.callbacks.append(callback)
+
+    def solve(self, func: Callable[[float], float], a: float, b: float) -> SolverResult:
+        """
+        Find a root of func in [a, b], repairing the bracket if both ends have the same sign.
+
+        The number of function evaluations made by the last call is stored in
+        `function_evaluations`; repeated points are served from the cache.
 
-    def solve(self, func: Callable[[float], float], a: float, b: float) -> Tuple[float, int]:
+        Returns:
+            SolverResult: The root and the number of iterations, which unpack as a tuple,
+            plus evaluation counts, the termination reason and optional instrumentation
+        """
         if not callable(func):
             raise TypeError("Input must be a callable function")
 
+        evaluator = self._evaluator(func)
+        monitor = SolveMonitor(evaluator, self.instrument, self.callbacks)
+        try:
+            return self._solve(evaluator, a, b, monitor)
+        except EvaluationBudgetExceeded as error:
+            error.result = monitor.result(monitor.last_x, monitor.last_iteration, False, "budget_exceeded")
+            raise
+        finally:
+            self.function_evaluations = evaluator.calls
+
+    def _solve(self, func: Callable[[float], float], a: float, b: float, monitor: SolveMonitor) -> SolverResult:
         fa = func(a)
         fb = func(b)
 
         # If one of the endpoints is a root, return it
         if abs(fa) < self.tolerance:
-            return a, 0
+            return monitor.result(a, 0, True, "converged")
         if abs(fb) < self.tolerance:
-            return b, 0
+            return monitor.result(b, 0, True, "converged")
 
         # If the function has the same sign at both endpoints, try to find a bracket
         if fa * fb > 0:
             c = self._find_bracket(func, a, b)
             if c is None:
-                raise ValueError(f"Root cannot be bracketed: f({a})={fa}, f({b})={fb}")
+                raise monitor.failure("no_bracket", f"Root cannot be bracketed: f({a})={fa}, f({b})={fb}", None, 0)
             if abs(a - c) < abs(b - c):
                 a, fa = c, func(c)
             else:
@@ -39,14 +100,21 @@ class BisectionSolver:
             a, b = b, a
             fa, fb = fb, fa
 
-        # Bisection method
+        return self._iterate(func, a, fa, b, fb, monitor)
+
+    def _iterate(self, func: Callable[[float], float], a: float, fa: float, b: float, fb: float,
+                 monitor: SolveMonitor) -> SolverResult:
+        """Bisection method on a bracket with f(a) and f(b) of opposite sign"""
         iterations = 0
         while iterations < self.max_iterations:
             c = (a + b) / 2
             fc = func(c)
+            stop = monitor.iteration(iterations, c, abs(fc))
 
             if abs(fc) < self.tolerance or (b - a) / 2 < self.tolerance:
-                return c, iterations
+                return monitor.result(c, iterations, True, "converged")
+            if stop:
+                return monitor.result(c, iterations, False, "callback")
 
             if fa * fc < 0:
                 b = c
@@ -58,7 +126,202 @@ class BisectionSolver:
             iterations += 1
 
         # If max iterations reached, return the best approximation
-        return (a + b) / 2, iterations
+        return monitor.result((a + b) / 2, iterations, False, "max_iterations")
+
+    def solve_batch(self,
+                    func: Callable[[np.ndarray], np.ndarray],
+                    a_array: np.ndarray,
+                    b_array: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Bisect many independent brackets at once with a vectorized function.
+
+        Every element follows the same rules as `solve`, but all intervals are halved
+        together with per-element convergence masks. `func` is always called with an
+        array shaped like the brackets, so it may close over per-element parameters;
+        converged elements simply stop being updated.
+
+        Args:
+            func (Callable[[np.ndarray], np.ndarray]): Element-wise vectorized function
+            a_array (np.ndarray): Left ends of the brackets
+            b_array (np.ndarray): Right ends of the brackets
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Roots, iteration counts and
+            convergence flags. Elements that cannot be bracketed get a NaN root.
+        """
+        if not callable(func):
+            raise TypeError("Input must be a callable function")
+
+        evaluator = self._evaluator(func, cache=False)
+        try:
+            return self._solve_batch(evaluator, a_array, b_array)
+        finally:
+            self.function_evaluations = evaluator.calls
+
+    def _solve_batch(self, func: Callable[[np.ndarray], np.ndarray],
+                     a_array: np.ndarray, b_array: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        a, b = np.broadcast_arrays(np.asarray(a_array, dtype=float), np.asarray(b_array, dtype=float))
+        a, b = a.copy(), b.copy()
+        fa = np.asarray(func(a), dtype=float)
+        fb = np.asarray(func(b), dtype=float)
+
+        roots = np.full(a.shape, np.nan)
+        iterations = np.zeros(a.shape, dtype=int)
+        converged = np.zeros(a.shape, dtype=bool)
+
+        # If one of the endpoints is a root, take it
+        at_a = np.abs(fa) < self.tolerance
+        at_b = ~at_a & (np.abs(fb) < self.tolerance)
+        roots[at_a] = a[at_a]
+        roots[at_b] = b[at_b]
+        converged |= at_a | at_b
+
+        # Where the function has the same sign at both endpoints, try to find a bracket
+        unbracketed = ~converged & (fa * fb > 0)
+        if unbracketed.any():
+            c, fc, found = self._find_bracket_batch(func, a, fa, b, fb, unbracketed)
+            near_a = found & (np.abs(a - c) < np.abs(b - c))
+            near_b = found & ~near_a
+            a, fa = np.where(near_a, c, a), np.where(near_a, fc, fa)
+            b, fb = np.where(near_b, c, b), np.where(near_b, fc, fb)
+            unbracketed &= ~found
+
+        # Ensure a < b
+        swap = a > b
+        a, b = np.where(swap, b, a), np.where(swap, a, b)
+        fa, fb = np.where(swap, fb, fa), np.where(swap, fa, fb)
+
+        # Bisection method on every unfinished element
+        active = ~converged & ~unbracketed
+        for iteration in range(self.max_iterations):
+            if not active.any():
+                break
+            c = (a + b) / 2
+            fc = np.asarray(func(c), dtype=float)
+
+            done = active & ((np.abs(fc) < self.tolerance) | ((b - a) / 2 < self.tolerance))
+            roots[done] = c[done]
+            iterations[done] = iteration
+            converged |= done
+            active &= ~done
+
+            go_left = active & (fa * fc < 0)
+            go_right = active & ~go_left
+            b, fb = np.where(go_left, c, b), np.where(go_left, fc, fb)
+            a, fa = np.where(go_right, c, a), np.where(go_right, fc, fa)
+
+        # If max iterations reached, return the best approximation
+        roots[active] = ((a + b) / 2)[active]
+        iterations[active] = self.max_iterations
+
+        return roots, iterations, converged
+
+    def find_all_roots(self,
+                       func: Callable[[np.ndarray], np.ndarray],
+                       a: float,
+                       b: float,
+                       n_samples: int = 256,
+                       max_refinements: int = 8) -> np.ndarray:
+        """
+        Find every root of a vectorized function on [a, b].
+
+        `func` is sampled on a uniform grid in one call. Grid points where |f|
+        has a local minimum without a sign change are refined with extra samples
+        on both sides, all candidates together, so that close root pairs show up
+        as sign changes. Sampled zeros are kept as roots and refined the same
+        way. Every sign change is then refined by `solve_batch`, and the
+        remaining minima are located by a batched golden-section search and
+        accepted as tangent roots if |f| drops below `tolerance` there.
+
+        The number of function calls is stored in `function_evaluations`.
+
+        Args:
+            func (Callable[[np.ndarray], np.ndarray]): Element-wise vectorized function
+            a (float): Left end of the interval
+            b (float): Right end of the interval
+            n_samples (int): Points of the initial grid
+            max_refinements (int): Refinement passes around suspected roots
+
+        Returns:
+            np.ndarray: Sorted roots found in [a, b]
+
+        Raises:
+            TypeError: If the function is not callable
+            ValueError: If the interval or sampling parameters are invalid
+        """
+        if not callable(func):
+            raise TypeError("Input must be a callable function")
+        if not a < b:
+            raise ValueError("Interval must satisfy a < b")
+        if n_samples < 3:
+            raise ValueError("Number of samples must be at least 3")
+        if max_refinements < 0:
+            raise ValueError("Max refinements must be non-negative")
+
+        evaluator = self._evaluator(func, cache=False)
+        try:
+            return self._find_all_roots(evaluator, a, b, n_samples, max_refinements)
+        finally:
+            self.function_evaluations = evaluator.calls
+
+    def _find_all_roots(self, func: Callable[[np.ndarray], np.ndarray], a: float, b: float,
+                        n_samples: int, max_refinements: int) -> np.ndarray:
+        def evaluate(points):
+            return np.asarray(func(points), dtype=float) * np.ones(points.shape)
+
+        def local_minima(x, f, zeros):
+            """Interior local minima of |f| without a sign change on either side, optionally including zeros"""
+            magnitude = np.abs(f)
+            i = np.arange(1, len(x) - 1)
+            no_change = (f[i - 1] * f[i] >= 0) & (f[i] * f[i + 1] >= 0) & (zeros | (f[i] != 0))
+            return i[no_change & (magnitude[i] <= magnitude[i - 1]) & (magnitude[i] <= magnitude[i + 1])]
+
+        x = np.linspace(a, b, n_samples)
+        f = evaluate(x)
+
+        # Sample more densely around suspected tangencies, sampled zeros and close root pairs
+        for _ in range(max_refinements):
+            i = local_minima(x, f, zeros=True)
+            i = i[x[i + 1] - x[i - 1] > 4 * self.tolerance]
+            if i.size == 0:
+                break
+            new = np.concatenate([(x[i - 1] + x[i]) / 2, (x[i] + x[i + 1]) / 2])
+            x = np.concatenate([x, new])
+            f = np.concatenate([f, evaluate(new)])
+            order = np.argsort(x, kind="stable")
+            x, f = x[order], f[order]
+
+        roots = [x[f == 0]]
+
+        # Refine every sign change together
+        change = np.flatnonzero(f[:-1] * f[1:] < 0)
+        if change.size:
+            bracket_roots, _, _ = self._solve_batch(func, x[change], x[change + 1])
+            roots.append(bracket_roots[np.isfinite(bracket_roots)])
+
+        # Golden-section search for the minimum of |f| around each remaining candidate
+        i = local_minima(x, f, zeros=False)
+        if i.size:
+            lo, hi = x[i - 1], x[i + 1]
+            ratio = (math.sqrt(5) - 1) / 2
+            c, d = hi - ratio * (hi - lo), lo + ratio * (hi - lo)
+            fc, fd = np.abs(evaluate(c)), np.abs(evaluate(d))
+            for _ in range(self.max_iterations):
+                if not (hi - lo > self.tolerance).any():
+                    break
+                left = fc < fd
+                hi, lo = np.where(left, d, hi), np.where(left, lo, c)
+                c, d = np.where(left, hi - ratio * (hi - lo), d), np.where(left, c, lo + ratio * (hi - lo))
+                value = np.abs(evaluate(np.where(left, c, d)))
+                fc, fd = np.where(left, value, fd), np.where(left, fc, value)
+            minimum = np.where(fc < fd, c, d)
+            roots.append(minimum[np.minimum(fc, fd) < self.tolerance])
+
+        roots = np.sort(np.concatenate(roots))
+        if roots.size:
+            # Drop duplicates, e.g. a sampled zero next to a sign change
+            roots = roots[np.concatenate([[True], np.diff(roots) > self.tolerance])]
+        return roots
 
     def _find_bracket(self, func: Callable[[float], float], a: float, b: float) -> Optional[float]:
         """Attempt to find a point c where func(c) has opposite sign of func(a) and func(b)"""
@@ -72,4 +335,33 @@ class BisectionSolver:
                 a, fa = c, fc
             else:
                 b, fb = c, fc
-        return None
\ No newline at end of file
+        return None
+
+    def _find_bracket_batch(self, func: Callable[[np.ndarray], np.ndarray],
+                            a: np.ndarray, fa: np.ndarray, b: np.ndarray, fb: np.ndarray,
+                            mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized `_find_bracket` over the elements selected by mask, reusing the
+        endpoint values fa and fb. Returns the bracketing points, the function
+        values there and the mask of elements where one was found.
+        """
+        c = np.full(a.shape, np.nan)
+        fc = np.full(a.shape, np.nan)
+        found = np.zeros(a.shape, dtype=bool)
+        searching = mask.copy()
+        for _ in range(50):  # Limit the number of attempts
+            if not searching.any():
+                break
+            mid = (a + b) / 2
+            fmid = np.asarray(func(mid), dtype=float)
+            hit = searching & ((fmid * fa < 0) | (fmid * fb < 0))
+            c[hit] = mid[hit]
+            fc[hit] = fmid[hit]
+            found |= hit
+            searching &= ~hit
+
+            move_a = searching & (np.abs(fmid) < np.abs(fa))
+            move_b = searching & ~move_a
+            a, fa = np.where(move_a, mid, a), np.where(move_a, fmid, fa)
+            b, fb = np.where(move_b, mid, b), np.where(move_b, fmid, fb)
+        return c, fc, found
@@ -0,0 +1,3 @@
+from .brent_solver import BrentSolver
+
+__all__ = ['BrentSolver']
@@ -0,0 +1,70 @@
+import math
+import sys
+from typing import Callable
+from ..bisection_method.bisection_solver import BisectionSolver
+from ..solver_result import SolverResult, SolveMonitor
+
+class BrentSolver(BisectionSolver):
+    """
+    Brent's bracketed root finder.
+
+    Shares the `solve(func, a, b)` contract, the bracket repair and the
+    `function_evaluations` count of BisectionSolver, but combines inverse
+    quadratic interpolation and secant steps with a bisection safeguard, so it
+    converges superlinearly on smooth functions while never leaving the bracket.
+    `solve_batch` is inherited unchanged and still bisects.
+    """
+
+    def _iterate(self, func: Callable[[float], float], a: float, fa: float, b: float, fb: float,
+                 monitor: SolveMonitor) -> SolverResult:
+        """Brent's method on a bracket with f(a) and f(b) of opposite sign"""
+        c, fc = b, fb
+        d = e = b - a
+        for iterations in range(self.max_iterations):
+            # Keep c on the other side of the root from b
+            if fb * fc > 0:
+                c, fc = a, fa
+                d = e = b - a
+            # Keep b as the best estimate
+            if abs(fc) < abs(fb):
+                a, b, c = b, c, b
+                fa, fb, fc = fb, fc, fb
+
+            stop = monitor.iteration(iterations, b, abs(fb))
+            tol = 2 * sys.float_info.epsilon * abs(b) + 0.5 * self.tolerance
+            m = 0.5 * (c - b)
+            if abs(fb) < self.tolerance or abs(m) <= tol:
+                return monitor.result(b, iterations, True, "converged")
+            if stop:
+                return monitor.result(b, iterations, False, "callback")
+
+            if abs(e) >= tol and abs(fa) > abs(fb):
+                s = fb / fa
+                if a == c:
+                    # Secant step
+                    p = 2 * m * s
+                    q = 1 - s
+                else:
+                    # Inverse quadratic interpolation
+                    q = fa / fc
+                    r = fb / fc
+                    p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+                if p > 0:
+                    q = -q
+                else:
+                    p = -p
+                # Accept the interpolation only if it stays well inside the bracket
+                if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                    e, d = d, p / q
+                else:
+                    d = e = m
+            else:
+                d = e = m
+
+            a, fa = b, fb
+            b += d if abs(d) > tol else math.copysign(tol, m)
+            fb = func(b)
+
+        # If max iterations reached, return the best approximation
+        return monitor.result(b, self.max_iterations, False, "max_iterations")
@@ -0,0 +1,87 @@
+import time
+import numbers
+from collections import OrderedDict
+from typing import Callable, Optional
+import numpy as np
+
+class EvaluationBudgetExceeded(ValueError):
+    """Raised when a solve runs out of its evaluation or wall-clock budget."""
+
+
+class FunctionEvaluator:
+    def __init__(self,
+                 func: Callable,
+                 cache_size: int = 0,
+                 max_evaluations: Optional[int] = None,
+                 max_time: Optional[float] = None,
+                 timed: bool = False):
+        """
+        Wrap a function for one solve: count calls, cache recent evaluations and enforce budgets.
+
+        Only scalar inputs and single points (1-D arrays) are cached, in a bounded
+        LRU keyed on their value, so repeated evaluations at the same point are free.
+
+        Args:
+            func (Callable): The function to evaluate
+            cache_size (int): Number of recent evaluations to keep; 0 disables caching
+            max_evaluations (Optional[int]): Hard limit on actual calls of func
+            max_time (Optional[float]): Wall-clock limit in seconds, measured from construction
+            timed (bool): Accumulate the time spent inside func in `elapsed`
+
+        Raises:
+            ValueError: If the limits are invalid
+        """
+        self.validate_limits(cache_size, max_evaluations, max_time)
+
+        self.func = func
+        self.cache_size = cache_size
+        self.max_evaluations = max_evaluations
+        self.max_time = max_time
+        self.calls = 0
+        self.cache_hits = 0
+        self.timed = timed
+        self.elapsed = 0.0
+        self._cache = OrderedDict()
+        self._start = time.perf_counter() if max_time is not None else None
+
+    @staticmethod
+    def validate_limits(cache_size: int, max_evaluations: Optional[int], max_time: Optional[float]) -> None:
+        """Check cache and budget settings, so solvers can reject them at construction."""
+        if cache_size < 0:
+            raise ValueError("Cache size must be non-negative")
+        if max_evaluations is not None and max_evaluations <= 0:
+            raise ValueError("Max evaluations must be positive")
+        if max_time is not None and max_time <= 0:
+            raise ValueError("Max time must be positive")
+
+    def _key(self, x):
+        if isinstance(x, numbers.Number):
+            return float(x)
+        if isinstance(x, np.ndarray) and x.ndim == 1:
+            return (x.dtype.str, x.tobytes())
+        return None
+
+    def __call__(self, x, *args):
+        key = self._key(x) if self.cache_size and not args else None
+        if key is not None and key in self._cache:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return self._cache[key]
+
+        if self.max_evaluations is not None and self.calls >= self.max_evaluations:
+            raise EvaluationBudgetExceeded(f"Evaluation budget of {self.max_evaluations} calls exhausted")
+        if self._start is not None and time.perf_counter() - self._start > self.max_time:
+            raise EvaluationBudgetExceeded(f"Time budget of {self.max_time} s exhausted after {self.calls} calls")
+
+        if self.timed:
+            start = time.perf_counter()
+            value = self.func(x, *args)
+            self.elapsed += time.perf_counter() - start
+        else:
+            value = self.func(x, *args)
+        self.calls += 1
+        if key is not None:
+            self._cache[key] = value
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return value
@@ -1,13 +1,76 @@
+import copy
 import math
+import threading
+import warnings
 import numpy as np
-from typing import Callable, Tuple
+import scipy.linalg
+import scipy.sparse
+import scipy.sparse.linalg
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Callable, Optional, Sequence, Tuple
+from ..function_evaluator import FunctionEvaluator, EvaluationBudgetExceeded
+from ..solver_result import SolverResult, SolveMonitor
+
+def _multistart_task(solver, func, guess, screen_iterations, stop_event=None):
+    """
+    Screen and solve one start of `solve_multistart`. Top level so it can be sent to worker processes.
+
+    Returns:
+        tuple: The root or None, and the number of residual evaluations
+    """
+    solver = copy.copy(solver)
+    solver.callbacks = []
+    solver._perturbations = None
+    if stop_event is not None:
+        solver.register_callback(lambda iteration, x, residual_norm: stop_event.is_set())
+
+    x = np.asarray(guess, dtype=float)
+    initial_norm = np.linalg.norm(func(x))
+    evaluations = 1
+    if not np.isfinite(initial_norm):
+        return None, evaluations
+
+    max_iterations = solver.max_iterations
+    stages = [max_iterations]
+    if 0 < screen_iterations < max_iterations:
+        stages = [screen_iterations, max_iterations - screen_iterations]
+    for stage, iterations in enumerate(stages):
+        solver.max_iterations = iterations
+        try:
+            result = solver.solve(func, x)
+        except ValueError as error:
+            result = getattr(error, "result", None)
+        evaluations += solver.function_evaluations
+        if result is None or result.termination_reason not in ("converged", "max_iterations"):
+            return None, evaluations
+        if result.converged:
+            return result.root, evaluations
+        if stage == 0 and len(stages) > 1:
+            # Screening: keep only starts that reduced the residual
+            x = result.root
+            evaluations += 1
+            if not np.linalg.norm(func(x)) < initial_norm:
+                return None, evaluations
+    return None, evaluations
+
 
 class NewtonMethodSolver:
+    METHODS = ("newton", "broyden", "chord")
+    MULTISTART_MODES = ("serial", "thread", "process", "batch")
+
     def __init__(self,
                  max_iterations: int = 100,
                  tolerance: float = 1e-6,
                  divergence_threshold: float = 1e10,
-                 h: float = 1e-7):
+                 h: float = 1e-7,
+                 method: str = "newton",
+                 refresh_ratio: float = 0.5,
+                 sparsity=None,
+                 vectorized: bool = False,
+                 cache_size: int = 0,
+                 max_evaluations: Optional[int] = None,
+                 max_time: Optional[float] = None,
+                 instrument: bool = False):
         """
         Initialize Newton's method solver for systems of equations with divergence detection and numerical differentiation.
 
@@ -16,6 +79,25 @@ class NewtonMethodSolver:
             tolerance (float): Convergence threshold
             divergence_threshold (float): Maximum value before considering divergence
             h (float): Step size for numerical differentiation
+            method (str): "newton" to difference the Jacobian every iteration, "broyden"
+                to difference it once and apply rank-one inverse updates afterwards, or
+                "chord" to reuse one LU factorization over several iterations
+            refresh_ratio (float): Residual reduction ratio above which the broyden and
+                chord modes recompute a finite-difference Jacobian
+            sparsity (array-like or scipy.sparse matrix, optional): (n, n) structural
+                nonzero pattern of the Jacobian. When given, structurally independent
+                columns are differenced together and the Jacobian is kept sparse
+            vectorized (bool): Declare that func also accepts an (m, n) stack of points
+                and returns an (m, n) stack of residuals, so all finite-difference
+                perturbations are evaluated in a single call
+            cache_size (int): Recent single-point evaluations cached per solve
+            max_evaluations (Optional[int]): Hard limit on residual evaluations per solve
+            max_time (Optional[float]): Wall-clock limit in seconds per solve
+            instrument (bool): Record residual-norm history and time spent in function
+                evaluation, Jacobian construction, condition check and linear solve.
+                Function calls made while building a Jacobian count as function time only
+
+        Exceeding a budget raises EvaluationBudgetExceeded, a ValueError.
 
         Raises:
             ValueError: If parameters are invalid
@@ -26,23 +108,80 @@ class NewtonMethodSolver:
             raise ValueError("Tolerance must be positive")
         if h <= 0:
             raise ValueError("Step size h must be positive")
+        if method not in self.METHODS:
+            raise ValueError(f"Method must be one of {self.METHODS}")
+        if not 0 < refresh_ratio < 1:
+            raise ValueError("Refresh ratio must be between 0 and 1")
+        FunctionEvaluator.validate_limits(cache_size, max_evaluations, max_time)
+        if sparsity is not None and method == "broyden":
+            raise ValueError("Broyden updates do not preserve a sparsity pattern")
 
         self.max_iterations = max_iterations
         self.tolerance = tolerance
         self.divergence_threshold = divergence_threshold
         self.h = h
+        self.method = method
+        self.refresh_ratio = refresh_ratio
+        self.function_evaluations = 0
+        self.vectorized = vectorized
+        self._perturbations = None
+        self.cache_size = cache_size
+        self.max_evaluations = max_evaluations
+        self.max_time = max_time
+        self.instrument = instrument
+        self.callbacks = []
 
-    def numerical_jacobian(self, func: Callable[[np.ndarray], np.ndarray], x: np.ndarray) -> np.ndarray:
+        self.sparsity = None
+        if sparsity is not None:
+            self.sparsity = scipy.sparse.csc_matrix(sparsity, dtype=bool)
+            self.sparsity.eliminate_zeros()
+            self.column_colors = self.color_columns(self.sparsity)
+
+    @staticmethod
+    def color_columns(pattern) -> np.ndarray:
+        """
+        Greedily color the columns of a sparsity pattern so that no two columns of
+        the same color share a nonzero row.
+
+        Args:
+            pattern (scipy.sparse matrix): Structural nonzero pattern
+
+        Returns:
+            np.ndarray: Color index of every column
+        """
+        csc = scipy.sparse.csc_matrix(pattern, dtype=bool)
+        csr = csc.tocsr()
+        colors = np.full(csc.shape[1], -1)
+        for j in range(csc.shape[1]):
+            rows = csc.indices[csc.indptr[j]:csc.indptr[j + 1]]
+            if rows.size == 0:
+                colors[j] = 0
+                continue
+            neighbour_colors = colors[np.concatenate([csr.indices[csr.indptr[r]:csr.indptr[r + 1]] for r in rows])]
+            used = np.zeros(colors.max() + 2, dtype=bool)
+            used[neighbour_colors[neighbour_colors >= 0]] = True
+            colors[j] = np.argmin(used)
+        return colors
+
+    def numerical_jacobian(self, func: Callable[[np.ndarray], np.ndarray], x: np.ndarray):
         """
         Calculate the numerical Jacobian of the function at point x.
 
+        With a sparsity pattern, each color group of columns is perturbed together,
+        so only two residual evaluations per color are needed.
+
         Args:
             func (Callable[[np.ndarray], np.ndarray]): The system of equations
             x (np.ndarray): The point at which to calculate the Jacobian
 
         Returns:
-            np.ndarray: The numerical Jacobian
+            np.ndarray or scipy.sparse.csc_matrix: The numerical Jacobian
         """
+        if self.vectorized:
+            return self._vectorized_jacobian(func, x)
+        if self.sparsity is not None:
+            return self._colored_jacobian(func, x)
+
         n = len(x)
         J = np.zeros((n, n))
         for i in range(n):
@@ -53,52 +192,651 @@ class NewtonMethodSolver:
             J[:, i] = (func(x_plus) - func(x_minus)) / (2 * self.h)
         return J
 
+    def _colored_jacobian(self, func: Callable[[np.ndarray], np.ndarray], x: np.ndarray) -> scipy.sparse.csc_matrix:
+        """Central differences over column color groups, scattered into the sparsity pattern."""
+        n_colors = self.column_colors.max() + 1
+        differences = np.empty((n_colors, len(x)))
+        for color in range(n_colors):
+            step = np.where(self.column_colors == color, self.h, 0.0)
+            differences[color] = (func(x + step) - func(x - step)) / (2 * self.h)
+
+        pattern = self.sparsity.tocoo()
+        values = differences[self.column_colors[pattern.col], pattern.row]
+        return scipy.sparse.csc_matrix((values, (pattern.row, pattern.col)), shape=self.sparsity.shape)
+
+    def _vectorized_jacobian(self, func: Callable[[np.ndarray], np.ndarray], x: np.ndarray):
+        """
+        Central differences from one call of a batch-capable func.
+
+        The (2k, n) stack of perturbed points (k = n columns, or k colors with a
+        sparsity pattern) is written into a buffer that is reused across iterations.
+        """
+        n = len(x)
+        k = n if self.sparsity is None else self.column_colors.max() + 1
+        if self._perturbations is None or self._perturbations.shape != (2 * k, n):
+            self._perturbations = np.empty((2 * k, n))
+        points = self._perturbations
+        points[:] = x
+        if self.sparsity is None:
+            columns = np.arange(n)
+            points[columns, columns] += self.h
+            points[k + columns, columns] -= self.h
+        else:
+            points[self.column_colors, np.arange(n)] += self.h
+            points[k + self.column_colors, np.arange(n)] -= self.h
+
+        residuals = np.asarray(func(points))
+        differences = (residuals[:k] - residuals[k:]) / (2 * self.h)
+        if self.sparsity is None:
+            return differences.T
+
+        pattern = self.sparsity.tocoo()
+        values = differences[self.column_colors[pattern.col], pattern.row]
+        return scipy.sparse.csc_matrix((values, (pattern.row, pattern.col)), shape=self.sparsity.shape)
+
+    def register_callback(self, callback: Callable[[int, np.ndarray, float], Optional[bool]]) -> None:
+        """
+        Register a function called as callback(iteration, x, residual_norm) at every iterate.
+
+        Returning True from the callback stops the solve; the result is then
+        returned with termination_reason "callback".
+        """
+        if not callable(callback):
+            raise TypeError("Callback must be callable")
+        self.callbacks.append(callback)
+
     def solve(self,
             func: Callable[[np.ndarray], np.ndarray],
-            initial_guess: np.ndarray) -> Tuple[np.ndarray, int]:
+            initial_guess: np.ndarray,
+            jacobian: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> SolverResult:
         """
         Find root of a system of equations using Newton's method with divergence detection and numerical differentiation.
 
+        The number of residual evaluations made by the last call is stored in `function_evaluations`.
+
         Args:
             func (Callable[[np.ndarray], np.ndarray]): The system of equations to solve
             initial_guess (np.ndarray): The initial guess for the solution
+            jacobian (Optional[Callable[[np.ndarray], np.ndarray]]): Analytical Jacobian of func,
+                returning a dense array or a scipy.sparse matrix. Replaces finite differences,
+                so no residual evaluations are spent on it
 
         Returns:
-            Tuple[np.ndarray, int]: The solution and the number of iterations
+            SolverResult: The solution and the number of iterations, which unpack as a tuple,
+            plus evaluation counts, the termination reason and optional instrumentation
 
         Raises:
             TypeError: If the function is not callable
-            ValueError: If the solution diverges, fails to converge, or encounters a singular Jacobian
+            ValueError: If the solution diverges, fails to converge, or encounters a singular Jacobian.
+                The partial SolverResult is attached as `error.result`
         """
         if not callable(func):
             raise TypeError("Function must be callable")
+        if jacobian is not None and not callable(jacobian):
+            raise TypeError("Jacobian must be callable")
+
+        evaluator = FunctionEvaluator(func, self.cache_size, self.max_evaluations, self.max_time, self.instrument)
+        monitor = SolveMonitor(evaluator, self.instrument, self.callbacks)
+        try:
+            if self.method == "newton":
+                return self._solve_newton(evaluator, initial_guess, monitor, jacobian)
+            return self._solve_reusing_jacobian(evaluator, initial_guess, monitor, jacobian)
+        except EvaluationBudgetExceeded as error:
+            error.result = monitor.result(monitor.last_x, monitor.last_iteration, False, "budget_exceeded")
+            raise
+        finally:
+            self.function_evaluations = evaluator.calls
+
+    def _jacobian(self, func: Callable[[np.ndarray], np.ndarray], x: np.ndarray,
+                  jacobian: Optional[Callable[[np.ndarray], np.ndarray]]):
+        """User-supplied Jacobian at x if given, otherwise finite differences of func."""
+        if jacobian is None:
+            return self.numerical_jacobian(func, x)
+        J = jacobian(x)
+        return J if scipy.sparse.issparse(J) else np.atleast_2d(np.asarray(J, dtype=float))
 
+    def _solve_newton(self,
+                      func: Callable[[np.ndarray], np.ndarray],
+                      initial_guess: np.ndarray,
+                      monitor: SolveMonitor,
+                      jacobian: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> SolverResult:
+        """Full Newton iteration with a fresh finite-difference Jacobian every step."""
         x = initial_guess
         for iterations in range(self.max_iterations):
             fx = func(x)
+            residual_norm = np.linalg.norm(fx)
+            stop = monitor.iteration(iterations, x, residual_norm)
 
             # Check convergence
-            if np.linalg.norm(fx) < self.tolerance:
-                return x, iterations
+            if residual_norm < self.tolerance:
+                return monitor.result(x, iterations, True, "converged")
+            if stop:
+                return monitor.result(x, iterations, False, "callback")
 
             # Check divergence
             if np.linalg.norm(x) > self.divergence_threshold:
-                raise ValueError(f"Solution diverged after {iterations} iterations")
+                raise monitor.failure("diverged", f"Solution diverged after {iterations} iterations", x, iterations)
 
-            # Compute Jacobian numerically
-            J = self.numerical_jacobian(func, x)
+            # Compute Jacobian numerically unless it was supplied
+            with monitor.timer("jacobian"):
+                J = self._jacobian(func, x, jacobian)
+
+            if scipy.sparse.issparse(J):
+                with monitor.timer("linear_solve"):
+                    linear_solve = self._factor(J)
+                    if linear_solve is None:
+                        raise monitor.failure("singular_jacobian", f"Encountered singular Jacobian at iteration {iterations}",
+                                              x, iterations)
+                    x = x + linear_solve(-fx)
+                continue
 
             # Check for singular Jacobian
-            if np.linalg.cond(J) > 1 / np.finfo(float).eps:
-                raise ValueError(f"Encountered singular Jacobian at iteration {iterations}")
+            with monitor.timer("condition"):
+                singular = np.linalg.cond(J) > 1 / np.finfo(float).eps
+            if singular:
+                raise monitor.failure("singular_jacobian", f"Encountered singular Jacobian at iteration {iterations}",
+                                      x, iterations)
 
             # Solve linear system J * delta_x = -fx
             try:
-                delta_x = np.linalg.solve(J, -fx)
+                with monitor.timer("linear_solve"):
+                    delta_x = np.linalg.solve(J, -fx)
             except np.linalg.LinAlgError:
-                raise ValueError(f"Failed to solve linear system at iteration {iterations}")
+                raise monitor.failure("linear_solve_failed", f"Failed to solve linear system at iteration {iterations}",
+                                      x, iterations)
 
             # Newton's method update
             x = x + delta_x
 
-        raise ValueError(f"Failed to converge after {self.max_iterations} iterations")
\ No newline at end of file
+        raise monitor.failure("max_iterations", f"Failed to converge after {self.max_iterations} iterations",
+                              x, self.max_iterations)
+
+    def _factor(self, J) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+        """
+        LU-factor a dense or sparse Jacobian and return a solve function for it,
+        or None if the Jacobian is singular.
+
+        Singularity is read off the pivots of U rather than from a separate
+        condition-number computation.
+        """
+        if scipy.sparse.issparse(J):
+            try:
+                lu = scipy.sparse.linalg.splu(scipy.sparse.csc_matrix(J))
+            except RuntimeError:
+                return None
+            pivots = np.abs(lu.U.diagonal())
+            solve = lu.solve
+        else:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", scipy.linalg.LinAlgWarning)
+                factors = scipy.linalg.lu_factor(J, check_finite=False)
+            pivots = np.abs(np.diag(factors[0]))
+
+            def solve(rhs):
+                return scipy.linalg.lu_solve(factors, rhs, check_finite=False)
+
+        if not pivots.min() > J.shape[0] * np.finfo(float).eps * pivots.max():
+            return None
+        return solve
+
+    def _solve_reusing_jacobian(self,
+                                func: Callable[[np.ndarray], np.ndarray],
+                                initial_guess: np.ndarray,
+                                monitor: SolveMonitor,
+                                jacobian: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> SolverResult:
+        """
+        Newton-type iteration that keeps one Jacobian across several steps.
+
+        In "chord" mode the dense or sparse LU factors are reused unchanged; in "broyden" mode the
+        inverse is corrected with good-Broyden Sherman-Morrison rank-one updates.
+        Either way a fresh finite-difference Jacobian is taken whenever the
+        residual fails to drop by `refresh_ratio`.
+        """
+        broyden = self.method == "broyden"
+
+        def refresh_jacobian(x, iterations):
+            with monitor.timer("jacobian"):
+                J = self._jacobian(func, x, jacobian)
+            with monitor.timer("linear_solve"):
+                linear_solve = self._factor(J)
+                if linear_solve is None:
+                    raise monitor.failure("singular_jacobian", f"Encountered singular Jacobian at iteration {iterations}",
+                                          x, iterations)
+                return linear_solve, linear_solve(np.eye(len(x))) if broyden else None
+
+        x = np.asarray(initial_guess, dtype=float)
+        fx = func(x)
+        residual_norm = np.linalg.norm(fx)
+        stop = monitor.iteration(0, x, residual_norm)
+        if residual_norm < self.tolerance:
+            return monitor.result(x, 0, True, "converged")
+        if stop:
+            return monitor.result(x, 0, False, "callback")
+        if np.linalg.norm(x) > self.divergence_threshold:
+            raise monitor.failure("diverged", "Solution diverged after 0 iterations", x, 0)
+        linear_solve, B_inv = refresh_jacobian(x, 0)
+
+        for iterations in range(1, self.max_iterations):
+            with monitor.timer("linear_solve"):
+                delta_x = -B_inv @ fx if broyden else linear_solve(-fx)
+            x_new = x + delta_x
+            f_new = func(x_new)
+            new_norm = np.linalg.norm(f_new)
+            stop = monitor.iteration(iterations, x_new, new_norm)
+
+            # Check convergence
+            if new_norm < self.tolerance:
+                return monitor.result(x_new, iterations, True, "converged")
+            if stop:
+                return monitor.result(x_new, iterations, False, "callback")
+
+            # Check divergence
+            if np.linalg.norm(x_new) > self.divergence_threshold:
+                raise monitor.failure("diverged", f"Solution diverged after {iterations} iterations", x_new, iterations)
+
+            # Refresh the Jacobian when the contraction rate degrades
+            refresh = new_norm > self.refresh_ratio * residual_norm
+            if broyden and not refresh:
+                with monitor.timer("linear_solve"):
+                    B_df = B_inv @ (f_new - fx)
+                    denominator = delta_x @ B_df
+                    if abs(denominator) < np.finfo(float).eps * np.linalg.norm(delta_x)**2:
+                        refresh = True
+                    else:
+                        B_inv += np.outer(delta_x - B_df, delta_x @ B_inv) / denominator
+            if refresh:
+                linear_solve, B_inv = refresh_jacobian(x_new, iterations)
+
+            x, fx, residual_norm = x_new, f_new, new_norm
+
+        raise monitor.failure("max_iterations", f"Failed to converge after {self.max_iterations} iterations",
+                              x, self.max_iterations)
+
+    def solve_sequence(self,
+                       func: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                       parameters: Sequence,
+                       initial_guess: np.ndarray,
+                       target_iterations: int = 4,
+                       min_step: float = 1e-4,
+                       jacobian: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]] = None
+                       ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Solve func(x, p) = 0 for a sequence of parameter values by natural-parameter continuation.
+
+        Each solve starts from a secant extrapolation of the last two solutions and
+        reuses the LU factorization of the last Jacobian, which is only refreshed
+        when the contraction rate degrades (see `refresh_ratio`). Between two
+        requested values the parameter is interpolated linearly in adaptive steps:
+        a step doubles when its corrector needed at most `target_iterations`
+        iterations and is halved and retried when the corrector fails. A slow
+        corrector first gets a fresh Jacobian for the next step, and only a slow
+        corrector with a fresh Jacobian shrinks the step. `function_evaluations` covers
+        the whole sequence. Registered callbacks are not run and `instrument` has no
+        effect, since no per-solve SolverResult is returned.
+
+        Args:
+            func (Callable[[np.ndarray, np.ndarray], np.ndarray]): Residual of the system
+                at x for the parameter value p, a float or an array
+            parameters (Sequence): Parameter values, in the order they are swept
+            initial_guess (np.ndarray): Starting point for the first parameter value
+            target_iterations (int): Corrector iterations per step the step size aims for
+            min_step (float): Smallest step, as a fraction of the gap between two values
+            jacobian (Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]]): Analytical
+                Jacobian of func at (x, p), used instead of finite differences
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Solutions (m, n), corrector
+            iterations spent reaching each value and convergence flags. Values after
+            a failure are left as NaN and not converged.
+
+        Raises:
+            TypeError: If the function is not callable
+            ValueError: If parameters are invalid
+        """
+        if not callable(func):
+            raise TypeError("Function must be callable")
+        if target_iterations <= 0:
+            raise ValueError("Target iterations must be positive")
+        if not 0 < min_step <= 1:
+            raise ValueError("Min step must be in (0, 1]")
+        parameters = np.asarray(parameters, dtype=float)
+        if parameters.ndim == 0 or len(parameters) == 0:
+            raise ValueError("Parameters must be a non-empty sequence")
+
+        evaluator = FunctionEvaluator(func, 0, self.max_evaluations, self.max_time)
+        try:
+            return self._solve_sequence(evaluator, parameters, np.array(initial_guess, dtype=float),
+                                        target_iterations, min_step, jacobian)
+        finally:
+            self.function_evaluations = evaluator.calls
+
+    def _solve_sequence(self,
+                        func: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                        parameters: np.ndarray,
+                        initial_guess: np.ndarray,
+                        target_iterations: int,
+                        min_step: float,
+                        jacobian: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]]
+                        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        n_values = len(parameters)
+        solutions = np.full((n_values, initial_guess.size), np.nan)
+        iterations = np.zeros(n_values, dtype=int)
+        converged = np.zeros(n_values, dtype=bool)
+
+        def at(p):
+            return (lambda y: func(y, p)), (None if jacobian is None else lambda y: jacobian(y, p))
+
+        x, iterations[0], linear_solve, ok = self._correct(*at(parameters[0]), initial_guess, None)
+        if not ok:
+            return solutions, iterations, converged
+        solutions[0], converged[0] = x, True
+
+        # Continuation position s: integer s is parameters[s], fractions interpolate
+        history = [(0.0, x)]
+        s, step, spent = 0.0, 1.0, 0
+        while s < n_values - 1:
+            k = math.floor(s)
+            target = float(k + 1) if s + step >= k + 1 else s + step
+            p = parameters[k] + (target - k) * (parameters[k + 1] - parameters[k])
+
+            # Secant predictor through the last two accepted points
+            if len(history) > 1:
+                (s0, x0), (s1, x1) = history
+                guess = x1 + (x1 - x0) * (target - s1) / (s1 - s0)
+            else:
+                guess = x
+
+            x_new, its, new_solve, ok = self._correct(*at(p), guess, linear_solve)
+            spent += its
+            if not ok:
+                if step <= min_step:
+                    iterations[k + 1] = spent
+                    break
+                step = max(step / 2, min_step)
+                linear_solve = None
+                continue
+
+            reused = linear_solve is not None
+            s, x, linear_solve = target, x_new, new_solve
+            history = [history[-1], (s, x)]
+            if its <= target_iterations:
+                step *= 2.0
+            elif reused:
+                # Slow because the Jacobian is stale rather than the step too long
+                linear_solve = None
+            else:
+                step = max(step * max(0.5, target_iterations / its), min_step)
+            if target == k + 1:
+                solutions[k + 1], iterations[k + 1], converged[k + 1] = x, spent, True
+                spent = 0
+
+        return solutions, iterations, converged
+
+    def _correct(self,
+                 func: Callable[[np.ndarray], np.ndarray],
+                 jacobian: Optional[Callable[[np.ndarray], np.ndarray]],
+                 x: np.ndarray,
+                 linear_solve: Optional[Callable[[np.ndarray], np.ndarray]]):
+        """
+        Chord corrector for `solve_sequence` starting from a possibly stale factorization.
+
+        Returns:
+            tuple: Last iterate, iterations, the factorization to pass on and a convergence flag
+        """
+        fx = func(x)
+        residual_norm = np.linalg.norm(fx)
+        fresh = False
+        for iterations in range(self.max_iterations):
+            if residual_norm < self.tolerance:
+                return x, iterations, linear_solve, True
+            if not np.isfinite(residual_norm) or np.linalg.norm(x) > self.divergence_threshold:
+                break
+            if linear_solve is None:
+                linear_solve = self._factor(self._jacobian(func, x, jacobian))
+                fresh = True
+                if linear_solve is None:
+                    break
+
+            x_new = x + linear_solve(-fx)
+            f_new = func(x_new)
+            new_norm = np.linalg.norm(f_new)
+            if not new_norm < residual_norm and not fresh:
+                # The reused Jacobian made no progress: refactor here and retry
+                linear_solve = None
+                continue
+            if not new_norm < self.refresh_ratio * residual_norm:
+                linear_solve = None
+            fresh = False
+            x, fx, residual_norm = x_new, f_new, new_norm
+        else:
+            iterations = self.max_iterations
+
+        return x, iterations, None, residual_norm < self.tolerance
+
+    def solve_multistart(self,
+                         func: Callable[[np.ndarray], np.ndarray],
+                         initial_guesses: np.ndarray,
+                         mode: str = "serial",
+                         n_workers: Optional[int] = None,
+                         max_roots: Optional[int] = None,
+                         screen_iterations: int = 3,
+                         root_tolerance: float = 1e-6) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Solve from many initial guesses and collect the distinct roots.
+
+        Every start first gets a screening pass of `screen_iterations` iterations.
+        Starts that diverge, hit a singular Jacobian or end the pass with a larger
+        residual than they began with are dropped. The other starts continue with
+        the remaining iteration budget. Roots closer than
+        root_tolerance * (1 + |root|) are reported once.
+
+        Args:
+            func (Callable[[np.ndarray], np.ndarray]): The system of equations. In "batch"
+                mode it maps an (m, n) array of points to an (m, n) array of residuals
+            initial_guesses (np.ndarray): Starting points, shape (N, n)
+            mode (str): "serial", "thread" or "process" pool over the starts, or "batch"
+                for one vectorized solve_batch. "process" needs a picklable func
+            n_workers (Optional[int]): Pool size for the thread and process modes
+            max_roots (Optional[int]): Stop once this many distinct roots are found.
+                Pending starts are cancelled, and in thread mode running solves stop
+                at their next iteration
+            screen_iterations (int): Iterations of the screening pass, 0 to disable
+            root_tolerance (float): Relative distance below which two roots are the same
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Distinct roots (k, n) ordered by
+            the start that found them, the index of that start, and per-start
+            convergence flags that are False for failed, screened-out and cancelled starts
+
+        Raises:
+            TypeError: If the function is not callable
+            ValueError: If parameters are invalid
+        """
+        if not callable(func):
+            raise TypeError("Function must be callable")
+        if mode not in self.MULTISTART_MODES:
+            raise ValueError(f"Mode must be one of {self.MULTISTART_MODES}")
+        if max_roots is not None and max_roots <= 0:
+            raise ValueError("Max roots must be positive")
+        if screen_iterations < 0:
+            raise ValueError("Screen iterations must be non-negative")
+        if root_tolerance <= 0:
+            raise ValueError("Root tolerance must be positive")
+        guesses = np.array(initial_guesses, dtype=float)
+        if guesses.ndim != 2:
+            raise ValueError("Initial guesses must have shape (N, n)")
+
+        if mode == "batch":
+            roots = self._multistart_batch(func, guesses, screen_iterations)
+        else:
+            roots = self._multistart_pool(func, guesses, mode, n_workers, max_roots, screen_iterations,
+                                          root_tolerance)
+        converged = np.array([root is not None for root in roots], dtype=bool)
+
+        distinct, starts = [], []
+        for index in np.flatnonzero(converged):
+            root = roots[index]
+            if any(np.linalg.norm(root - other) <= root_tolerance * (1 + np.linalg.norm(other)) for other in distinct):
+                continue
+            if max_roots is not None and len(distinct) == max_roots:
+                break
+            distinct.append(root)
+            starts.append(index)
+        return (np.array(distinct).reshape(len(distinct), guesses.shape[1]), np.array(starts, dtype=int),
+                converged)
+
+    def _multistart_pool(self, func, guesses, mode, n_workers, max_roots, screen_iterations, root_tolerance):
+        """Run `_multistart_task` per start, serially or in a pool, stopping early once max_roots are found."""
+        roots = [None] * len(guesses)
+        distinct = []
+        self.function_evaluations = 0
+
+        def record(index, root, evaluations):
+            self.function_evaluations += evaluations
+            roots[index] = root
+            if root is not None and not any(
+                    np.linalg.norm(root - other) <= root_tolerance * (1 + np.linalg.norm(other)) for other in distinct):
+                distinct.append(root)
+            return max_roots is not None and len(distinct) >= max_roots
+
+        if mode == "serial":
+            for index, guess in enumerate(guesses):
+                if record(index, *_multistart_task(self, func, guess, screen_iterations)):
+                    break
+            return roots
+
+        stop_event = threading.Event() if mode == "thread" else None
+        executor_class = ThreadPoolExecutor if mode == "thread" else ProcessPoolExecutor
+        executor = executor_class(max_workers=n_workers)
+        try:
+            pending = {executor.submit(_multistart_task, self, func, guess, screen_iterations, stop_event): index
+                       for index, guess in enumerate(guesses)}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                stop = False
+                for future in done:
+                    stop |= record(pending.pop(future), *future.result())
+                if stop:
+                    if stop_event is not None:
+                        stop_event.set()
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return roots
+
+    def _multistart_batch(self, func, guesses, screen_iterations):
+        """Screen all starts with one short solve_batch, then finish the survivors together."""
+        solver = copy.copy(self)
+        evaluator = FunctionEvaluator(func, 0, self.max_evaluations, self.max_time)
+        try:
+            x, active = guesses.copy(), np.arange(len(guesses))
+            converged = np.zeros(len(guesses), dtype=bool)
+            initial_norm = np.linalg.norm(np.asarray(evaluator(x), dtype=float), axis=1)
+            active = active[np.isfinite(initial_norm)]
+            if 0 < screen_iterations < self.max_iterations and active.size:
+                solver.max_iterations = screen_iterations
+                x[active], _, converged[active] = solver._solve_batch(evaluator, x[active], None)
+                screened_norm = np.linalg.norm(np.asarray(evaluator(x[active]), dtype=float), axis=1)
+                active = active[~converged[active] & (screened_norm < initial_norm[active])]
+                solver.max_iterations = self.max_iterations - screen_iterations
+            if active.size:
+                x[active], _, converged[active] = solver._solve_batch(evaluator, x[active], None)
+        finally:
+            self.function_evaluations = evaluator.calls
+        return [x[i] if converged[i] else None for i in range(len(guesses))]
+
+    def solve_batch(self,
+                    func: Callable[..., np.ndarray],
+                    initial_guesses: np.ndarray,
+                    parameters: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Solve many independent systems of equations with one vectorized Newton iteration.
+
+        The Jacobians of all unfinished systems are built as an (m, n, n) stack by
+        finite differences and solved with a broadcast `np.linalg.solve`. Systems
+        that converge, diverge or hit a singular Jacobian are retired immediately,
+        so later iterations only evaluate `func` on the active subset.
+
+        Args:
+            func (Callable[..., np.ndarray]): Vectorized residual mapping an (m, n) array
+                of points to an (m, n) array of residuals. If `parameters` is given it is
+                called as func(x, parameters) with the rows matching x.
+            initial_guesses (np.ndarray): Initial guesses, shape (N, n)
+            parameters (Optional[np.ndarray]): Per-system parameters with leading dimension N
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Solutions (N, n), iteration counts
+            and convergence flags. Failed systems keep their last iterate.
+
+        Raises:
+            TypeError: If the function is not callable
+            ValueError: If the initial guesses are not a 2D array
+        """
+        if not callable(func):
+            raise TypeError("Function must be callable")
+
+        x = np.array(initial_guesses, dtype=float)
+        if x.ndim != 2:
+            raise ValueError("Initial guesses must have shape (N, n)")
+        if parameters is not None:
+            parameters = np.asarray(parameters)
+
+        evaluator = FunctionEvaluator(func, 0, self.max_evaluations, self.max_time)
+        try:
+            return self._solve_batch(evaluator, x, parameters)
+        finally:
+            self.function_evaluations = evaluator.calls
+
+    def _solve_batch(self,
+                     func: Callable[..., np.ndarray],
+                     x: np.ndarray,
+                     parameters: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        n_systems, n = x.shape
+
+        def residual(idx, points):
+            if parameters is None:
+                return np.asarray(func(points), dtype=float)
+            return np.asarray(func(points, parameters[idx]), dtype=float)
+
+        iterations = np.full(n_systems, self.max_iterations)
+        converged = np.zeros(n_systems, dtype=bool)
+        active = np.arange(n_systems)
+        singular_limit = 1 / np.finfo(float).eps
+
+        for iteration in range(self.max_iterations):
+            if active.size == 0:
+                break
+            xa = x[active]
+            fx = residual(active, xa)
+
+            # Retire converged and diverged systems
+            done = np.linalg.norm(fx, axis=1) < self.tolerance
+            diverged = np.linalg.norm(xa, axis=1) > self.divergence_threshold
+            converged[active[done]] = True
+            iterations[active[done | diverged]] = iteration
+            keep = ~(done | diverged)
+            active, xa, fx = active[keep], xa[keep], fx[keep]
+            if active.size == 0:
+                break
+
+            # Stacked central-difference Jacobians, one column per residual pair
+            J = np.empty((active.size, n, n))
+            for i in range(n):
+                x_plus = xa.copy()
+                x_minus = xa.copy()
+                x_plus[:, i] += self.h
+                x_minus[:, i] -= self.h
+                J[:, :, i] = (residual(active, x_plus) - residual(active, x_minus)) / (2 * self.h)
+
+            # Retire systems with a singular Jacobian
+            singular = ~(np.linalg.cond(J) <= singular_limit)
+            iterations[active[singular]] = iteration
+            active, xa, fx, J = active[~singular], xa[~singular], fx[~singular], J[~singular]
+            if active.size == 0:
+                break
+
+            delta_x = np.linalg.solve(J, -fx[..., np.newaxis])[..., 0]
+            x[active] = xa + delta_x
+
+        return x, iterations, converged
+
@@ -0,0 +1,118 @@
+import time
+from contextlib import nullcontext
+from typing import Callable, Dict, List, Optional, Sequence
+
+class SolverResult:
+    """
+    Outcome of a scalar or system solve.
+
+    Unpacks as `root, iterations = result`, like the tuples the solvers used to
+    return. `residual_history` and `timings` are only filled in when the solver
+    was created with `instrument=True`.
+    """
+
+    def __init__(self,
+                 root,
+                 iterations: int,
+                 converged: bool,
+                 termination_reason: str,
+                 function_evaluations: int = 0,
+                 residual_history: Optional[List[float]] = None,
+                 timings: Optional[Dict[str, float]] = None):
+        self.root = root
+        self.iterations = iterations
+        self.converged = converged
+        self.termination_reason = termination_reason
+        self.function_evaluations = function_evaluations
+        self.residual_history = residual_history
+        self.timings = timings
+
+    def __iter__(self):
+        yield self.root
+        yield self.iterations
+
+    def __getitem__(self, index):
+        return (self.root, self.iterations)[index]
+
+    def __len__(self):
+        return 2
+
+    def __repr__(self):
+        return (f"SolverResult(root={self.root!r}, iterations={self.iterations}, converged={self.converged}, "
+                f"termination_reason={self.termination_reason!r}, function_evaluations={self.function_evaluations})")
+
+
+class _Timer:
+    __slots__ = ("timings", "key", "evaluator", "start", "function_start")
+
+    def __init__(self, timings: Dict[str, float], key: str, evaluator):
+        self.timings = timings
+        self.key = key
+        self.evaluator = evaluator
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        self.function_start = self.evaluator.elapsed
+
+    def __exit__(self, *exc):
+        function_time = self.evaluator.elapsed - self.function_start
+        elapsed = time.perf_counter() - self.start - function_time
+        self.timings[self.key] = self.timings.get(self.key, 0.0) + elapsed
+
+
+_NO_TIMER = nullcontext()
+
+
+class SolveMonitor:
+    """
+    Per-solve bookkeeping shared by the solvers: iteration callbacks, optional
+    residual history and section timings, and construction of the result.
+
+    With instrumentation off, timers are a shared no-op context manager and
+    nothing is recorded, so the monitor can stay in every solve.
+    """
+
+    def __init__(self, evaluator, instrument: bool = False, callbacks: Sequence[Callable] = ()):
+        self.evaluator = evaluator
+        self.callbacks = callbacks
+        self.residual_history = [] if instrument else None
+        self.timings = {} if instrument else None
+        self.last_x = None
+        self.last_iteration = 0
+
+    def timer(self, key: str):
+        """
+        Context manager accumulating wall time under `key` when instrumented.
+
+        Time spent inside the evaluated function, e.g. the finite differences of a
+        Jacobian, is left out: it is reported under "function" only, so the
+        sections do not overlap.
+        """
+        if self.timings is None:
+            return _NO_TIMER
+        return _Timer(self.timings, key, self.evaluator)
+
+    def iteration(self, iteration: int, x, residual_norm: float) -> bool:
+        """Record an iterate and run the callbacks. Returns True if a callback asked to stop."""
+        self.last_x = x
+        self.last_iteration = iteration
+        if self.residual_history is not None:
+            self.residual_history.append(float(residual_norm))
+        stop = False
+        for callback in self.callbacks:
+            if callback(iteration, x, residual_norm):
+                stop = True
+        return stop
+
+    def result(self, root, iterations: int, converged: bool, termination_reason: str) -> SolverResult:
+        timings = self.timings
+        if timings is not None:
+            timings = dict(timings, function=self.evaluator.elapsed)
+        return SolverResult(root, iterations, converged, termination_reason, self.evaluator.calls,
+                            self.residual_history, timings)
+
+    def failure(self, termination_reason: str, message: str, root, iterations: int) -> ValueError:
+        """Build the ValueError for a failed solve, carrying the partial result as `error.result`."""
+        error = ValueError(message)
+        error.result = self.result(root, iterations, False, termination_reason)
+        return error
@@ -0,0 +1,8 @@
+import pytest
+from elasto_plastic_models import KinematicHardeningModel, IsotropicHardeningModel
+
+@pytest.fixture(params=["kinematic", "isotropic"])
+def model_factory(request):
+    if request.param == "kinematic":
+        return lambda: KinematicHardeningModel(E=200e3, sigma_y=250, H=10e3)
+    return lambda: IsotropicHardeningModel(E=200e3, sigma_y=250, K=500, n=0.1)
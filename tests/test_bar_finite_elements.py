@@ -0,0 +1,132 @@
+import time
+import numpy as np
+import pytest
+from root_finding_methods import NewtonMethodSolver
+from elasto_plastic_models import (ElastoPlasticBar, BatchKinematicHardeningModel,
+                                   BatchIsotropicHardeningModel)
+
+E, SIGMA_Y = 200000.0, 250.0
+
+def tip_forces(n_nodes, force=1.0):
+    forces = np.zeros(n_nodes)
+    forces[-1] = force
+    return forces
+
+def test_elastic_tip_displacement():
+    n = 20
+    nodes = np.linspace(0, 100, n + 1)
+    bar = ElastoPlasticBar(nodes, BatchKinematicHardeningModel(E, SIGMA_Y, 10000.0, n), areas=2.0)
+    solution = bar.solve([100.0, 200.0], forces=tip_forces(n + 1))
+
+    assert solution.converged
+    assert np.allclose(solution.displacements[:, -1], np.array([100.0, 200.0]) * 100 / (E * 2.0))
+    assert np.allclose(solution.displacements[-1], nodes * 200 / (E * 2.0))
+    assert np.allclose(solution.stresses[-1], 100.0)
+    assert np.allclose(solution.reactions[:, 0], [-100.0, -200.0])
+
+def test_determinate_power_law_bar_matches_analytical_strains():
+    K, n_exp, n = 500.0, 0.5, 50
+    nodes = np.linspace(0, 1000, n + 1)
+    areas = np.linspace(1.0, 2.0, n)
+    bar = ElastoPlasticBar(nodes, BatchIsotropicHardeningModel(E, SIGMA_Y, K, n_exp, n, tolerance=1e-12),
+                           areas=areas, solver=NewtonMethodSolver(max_iterations=25, tolerance=1e-11))
+    solution = bar.solve(np.linspace(0, 400, 9)[1:], forces=tip_forces(n + 1))
+
+    assert solution.converged
+    stress = 400 / areas
+    plastic_strain = (np.clip(stress - SIGMA_Y, 0, None) / K)**(1 / n_exp)
+    assert np.allclose(solution.stresses[-1], stress)
+    assert solution.displacements[-1, -1] == pytest.approx(np.sum((stress / E + plastic_strain) * 20), rel=1e-8)
+
+def test_indeterminate_bar_redistributes_load():
+    # Both ends fixed and a force at the third point: the short side yields first
+    n, H = 30, 10000.0
+    bar = ElastoPlasticBar(np.linspace(0, 300, n + 1), BatchKinematicHardeningModel(E, SIGMA_Y, H, n),
+                           fixed_nodes=[0, n])
+    forces = np.zeros(n + 1)
+    forces[10] = 1.0
+    solution = bar.solve(np.linspace(0, 600, 13)[1:], forces=forces)
+
+    assert solution.converged
+    assert np.allclose(solution.reactions.sum(axis=1), -np.linspace(0, 600, 13)[1:])
+    # Elastic share of the short side is 2/3 of the load; once it yields the long side takes the rest
+    assert solution.stresses[0, 0] == pytest.approx(2 / 3 * 50.0)
+    assert solution.stresses[-1, 0] < 2 / 3 * 600
+    assert np.allclose(solution.stresses[-1, :10], solution.stresses[-1, 0])
+    assert np.allclose(solution.stresses[-1, 0] - solution.stresses[-1, -1], 600)
+
+@pytest.mark.parametrize("material", [BatchKinematicHardeningModel(E, SIGMA_Y, 10000.0, 30),
+                                      BatchIsotropicHardeningModel(E, SIGMA_Y, 500.0, 0.3, 30)])
+def test_cyclic_load_reversal(material):
+    n = 30
+    bar = ElastoPlasticBar(np.linspace(0, 300, n + 1), material, fixed_nodes=[0, n])
+    forces = np.zeros(n + 1)
+    forces[10] = 1.0
+    loads = [300.0, 600.0, 590.0, 0.0, -600.0, -590.0, 600.0]
+    solution = bar.solve(loads, forces=forces)
+
+    assert solution.converged
+    assert np.allclose(solution.reactions.sum(axis=1), -np.array(loads))
+    # Unloading from a plastic state is elastic and split between the two sides by their stiffness
+    assert solution.stresses[1, 0] - solution.stresses[2, 0] == pytest.approx(2 / 3 * 10.0, abs=1e-3)
+    assert solution.stresses[4, 0] - solution.stresses[5, 0] == pytest.approx(-2 / 3 * 10.0, abs=1e-3)
+    assert solution.stresses[4, 0] < -SIGMA_Y
+
+def test_prescribed_displacement_of_parallel_bars():
+    # Two bars between the same nodes, driven by the displacement of the free end
+    model = BatchKinematicHardeningModel(E, SIGMA_Y, 0.0, 2)
+    bar = ElastoPlasticBar([0.0, 10.0, 10.0], model, areas=[1.0, 3.0], elements=[[0, 1], [0, 2]],
+                           fixed_nodes=[0, 1, 2])
+    strain = 2 * SIGMA_Y / E
+    solution = bar.solve([0.25, 1.0], prescribed_displacements=np.array([0.0, 10 * strain, 10 * strain]))
+
+    assert solution.converged
+    assert np.allclose(solution.stresses, [[SIGMA_Y / 2, SIGMA_Y / 2], [SIGMA_Y, SIGMA_Y]])
+    assert np.allclose(solution.reactions[-1], [-4 * SIGMA_Y, SIGMA_Y, 3 * SIGMA_Y])
+
+def test_reversed_element_matches_forward_element():
+    forward = ElastoPlasticBar([0.0, 1.0], BatchKinematicHardeningModel(E, SIGMA_Y, 10000.0, 1))
+    backward = ElastoPlasticBar([0.0, 1.0], BatchKinematicHardeningModel(E, SIGMA_Y, 10000.0, 1),
+                                elements=np.array([[1, 0]]))
+    expected = forward.solve([100.0, 400.0], forces=tip_forces(2))
+    solution = backward.solve([100.0, 400.0], forces=tip_forces(2))
+
+    assert solution.converged
+    assert solution.displacements[0, -1] == pytest.approx(100.0 / E)
+    assert np.allclose(solution.displacements, expected.displacements)
+    assert np.allclose(solution.stresses, expected.stresses)
+    assert np.allclose(backward.lengths, 1.0)
+
+def test_failed_step_is_cut_back():
+    # Perfectly plastic elements cannot carry more than sigma_y: the limit load is never reached
+    n = 5
+    bar = ElastoPlasticBar(np.linspace(0, 5, n + 1), BatchKinematicHardeningModel(E, SIGMA_Y, 0.0, n),
+                           max_cutbacks=2)
+    solution = bar.solve([200.0, 300.0], forces=tip_forces(n + 1))
+
+    assert not solution.converged
+    assert np.allclose(solution.load_factors, [200.0])
+    # The halved step reached the limit load before the rest of the step failed
+    assert np.allclose(bar.stresses, SIGMA_Y)
+
+def test_invalid_model_raises():
+    with pytest.raises(ValueError):
+        ElastoPlasticBar([0.0, 1.0, 2.0], BatchKinematicHardeningModel(E, SIGMA_Y, 0.0, 3))
+    with pytest.raises(ValueError):
+        ElastoPlasticBar([0.0, 1.0, 1.0], BatchKinematicHardeningModel(E, SIGMA_Y, 0.0, 2))
+    with pytest.raises(ValueError):
+        ElastoPlasticBar([0.0, 1.0], BatchKinematicHardeningModel(E, SIGMA_Y, 0.0, 1), fixed_nodes=[])
+    bar = ElastoPlasticBar([0.0, 1.0], BatchKinematicHardeningModel(E, SIGMA_Y, 0.0, 1))
+    with pytest.raises(ValueError):
+        bar.solve([1.0], forces=np.ones(3))
+
+def test_large_bar_solves_quickly():
+    n = 100000
+    bar = ElastoPlasticBar(np.linspace(0, 1000, n + 1), BatchKinematicHardeningModel(E, SIGMA_Y, 10000.0, n),
+                           areas=np.linspace(1.0, 2.0, n))
+    start = time.perf_counter()
+    solution = bar.solve([200.0, 400.0], forces=tip_forces(n + 1))
+
+    assert solution.converged
+    assert np.allclose(solution.stresses[-1], 400 / np.linspace(1.0, 2.0, n))
+    assert time.perf_counter() - start < 10
@@ -0,0 +1,28 @@
+import pytest
+from benchmarks.run_benchmarks import run_benchmarks, compare_results
+
+def test_run_benchmarks_records_timings():
+    results = run_benchmarks({"noop": lambda: None}, repeat=3)
+    timing = results["results"]["noop"]
+    assert timing["repeat"] == 3
+    assert 0 <= timing["best"] <= timing["mean"]
+    assert "numpy" in results["metadata"]
+
+def test_run_benchmarks_invalid_repeat():
+    with pytest.raises(ValueError):
+        run_benchmarks({"noop": lambda: None}, repeat=0)
+
+def test_compare_results_flags_regressions():
+    baseline = {"results": {"fast": {"best": 1.0}, "slow": {"best": 1.0}, "removed": {"best": 1.0}}}
+    results = {"results": {"fast": {"best": 1.1}, "slow": {"best": 2.0}, "new": {"best": 5.0}}}
+    comparison = {entry["name"]: entry for entry in compare_results(results, baseline, threshold=1.25)}
+    assert set(comparison) == {"fast", "slow"}
+    assert not comparison["fast"]["regression"]
+    assert comparison["slow"]["regression"]
+    assert comparison["slow"]["ratio"] == pytest.approx(2.0)
+
+def test_compare_results_case_thresholds():
+    baseline = {"results": {"slow": {"best": 1.0}}}
+    results = {"results": {"slow": {"best": 2.0}}}
+    comparison = compare_results(results, baseline, threshold=1.25, case_thresholds={"slow": 2.5})
+    assert not comparison[0]["regression"]
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 import pytest
 from root_finding_methods import BisectionSolver
 
@@ -53,4 +54,61 @@ class TestBisectionSolver:
             BisectionSolver(max_iterations=0)
 
         with pytest.raises(ValueError, match="Tolerance must be a positive float"):
-            BisectionSolver(tolerance=-0.1)
\ No newline at end of file
+            BisectionSolver(tolerance=-0.1)
+
+    def test_batch_matches_scalar_solve(self):
+        """Test that batched bisection reproduces the scalar solver element by element"""
+        targets = np.linspace(1.0, 9.0, 25)
+
+        roots, iterations, converged = self.solver.solve_batch(lambda x: x**2 - targets, np.zeros(25), np.full(25, 4.0))
+
+        assert converged.all()
+        assert np.allclose(roots, np.sqrt(targets), atol=1e-6)
+        for target, root, its in zip(targets, roots, iterations):
+            scalar_root, scalar_its = self.solver.solve(lambda x: x**2 - target, 0, 4)
+            assert root == scalar_root
+            assert its == scalar_its
+
+    def test_batch_unbracketed_elements(self):
+        """Test that elements without a root are flagged instead of raising"""
+        shifts = np.array([-4.0, 1.0])
+        roots, _, converged = self.solver.solve_batch(lambda x: x**2 + shifts, np.array([0.0, -1.0]), np.array([3.0, 1.0]))
+
+        assert converged.tolist() == [True, False]
+        assert math.isclose(roots[0], 2, abs_tol=1e-6)
+        assert np.isnan(roots[1])
+
+    def test_batch_bracket_search_reuses_evaluations(self):
+        """Test that the bracket search of a batch reuses the endpoint and midpoint values"""
+        roots, iterations, converged = self.solver.solve_batch(lambda x: x**2 - 1, np.array([-2.0]), np.array([2.0]))
+
+        assert converged.all()
+        assert math.isclose(abs(roots[0]), 1, abs_tol=1e-6)
+        # Two endpoints, one bracket search step and one evaluation per bisection step
+        assert self.solver.function_evaluations == 2 + 1 + iterations[0] + 1
+
+
+    def test_find_all_roots_sign_changes(self):
+        """Test that every simple root on the interval is found from one sampling pass"""
+        solver = BisectionSolver(tolerance=1e-10)
+        roots = solver.find_all_roots(np.cos, 0, 20)
+
+        assert np.allclose(roots, (np.arange(6) + 0.5) * np.pi, atol=1e-8)
+        assert solver.function_evaluations < 50
+
+    def test_find_all_roots_tangencies_and_close_pairs(self):
+        """Test that double roots and a root next to a sampled zero are found"""
+        solver = BisectionSolver(tolerance=1e-10)
+        roots = solver.find_all_roots(lambda x: (x - 1)**2 * (x - 2) * (x - 2.001) * (x - 2.3)**2, 0, 3)
+
+        assert np.allclose(roots, [1, 2, 2.001, 2.3], atol=1e-5)
+
+    def test_find_all_roots_none_and_invalid(self):
+        """Test an interval without roots and invalid arguments"""
+        assert self.solver.find_all_roots(lambda x: x**2 + 1, -1, 1).size == 0
+        with pytest.raises(ValueError):
+            self.solver.find_all_roots(np.cos, 1, 0)
+        with pytest.raises(ValueError):
+            self.solver.find_all_roots(np.cos, 0, 1, n_samples=2)
+        with pytest.raises(TypeError):
+            self.solver.find_all_roots(None, 0, 1)
@@ -0,0 +1,51 @@
+import math
+import pytest
+from root_finding_methods import BisectionSolver, BrentSolver
+
+class TestBrentSolver:
+    """
+    Test suite for the BrentSolver class.
+
+    Tests cover:
+    - Agreement with bisection on the same brackets
+    - Function evaluation savings
+    - Shared bracket repair and error handling
+    """
+
+    def setup_method(self):
+        """Create a fresh BrentSolver for each test"""
+        self.solver = BrentSolver()
+
+    def test_simple_polynomial_root(self):
+        """Test finding root of a simple polynomial"""
+        root, iterations = self.solver.solve(lambda x: x**2 - 4, 0, 3)
+        assert math.isclose(root, 2, abs_tol=1e-6)
+        assert iterations < 100
+
+    def test_fewer_evaluations_than_bisection(self):
+        """Test that Brent's method needs several times fewer evaluations on smooth functions"""
+        bisection = BisectionSolver()
+        for func, a, b, expected in [
+            (lambda x: math.sin(x), 3, 4, math.pi),
+            (lambda x: math.exp(x) - 3 * x, 0, 1, 0.6190612867),
+            (lambda x: x**3 - x - 2, 1, 2, 1.5213797068),
+        ]:
+            root, _ = self.solver.solve(func, a, b)
+            bisection.solve(func, a, b)
+            assert math.isclose(root, expected, abs_tol=1e-6)
+            assert 2 * self.solver.function_evaluations <= bisection.function_evaluations
+
+    def test_bracket_repair(self):
+        """Test that a same-sign bracket is repaired like in BisectionSolver"""
+        root, _ = self.solver.solve(lambda x: x**2 - 1, -2, 2)
+        assert math.isclose(abs(root), 1, abs_tol=1e-6)
+
+    def test_invalid_interval(self):
+        """Test that an error is raised when root cannot be bracketed"""
+        with pytest.raises(ValueError, match="Root cannot be bracketed"):
+            self.solver.solve(lambda x: x**2 + 1, -1, 1)
+
+    def test_non_callable_input(self):
+        """Test error handling for non-callable input"""
+        with pytest.raises(TypeError, match="Input must be a callable function"):
+            self.solver.solve("not a function", 0, 1)
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from elasto_plastic_models import KinematicHardeningModel, IsotropicHardeningModel
+from elasto_plastic_models import ExperimentalCurve, HardeningModelCalibrator
+
+def cyclic_strains(amplitude, points=200):
+    return amplitude * np.sin(np.linspace(0, 4 * np.pi, points))
+
+def measured_curves(model_class, parameters, amplitudes):
+    curves = []
+    for amplitude in amplitudes:
+        strains = cyclic_strains(amplitude)
+        stresses, _, _ = model_class(**parameters).calculate_stress_path(strains)
+        curves.append(ExperimentalCurve(strains, stresses))
+    return curves
+
+def test_kinematic_calibration_recovers_parameters():
+    true = {"E": 200000.0, "sigma_y": 250.0, "H": 10000.0}
+    calibrator = HardeningModelCalibrator(KinematicHardeningModel, measured_curves(KinematicHardeningModel, true, [0.01, 0.02]),
+                                          ["E", "sigma_y", "H"])
+    result = calibrator.fit([{"E": E, "sigma_y": 300.0, "H": 5000.0} for E in (150000.0, 250000.0)])
+
+    assert result.converged
+    for name, value in true.items():
+        assert np.isclose(result.parameters[name], value, rtol=1e-4)
+
+def test_isotropic_calibration_with_fixed_modulus():
+    true = {"E": 200000.0, "sigma_y": 250.0, "K": 500.0, "n": 0.2}
+    curves = measured_curves(IsotropicHardeningModel, true, [0.01, 0.03])
+    calibrator = HardeningModelCalibrator(IsotropicHardeningModel, curves, ["sigma_y", "K", "n"],
+                                          fixed_parameters={"E": 200000.0})
+    result = calibrator.fit([{"sigma_y": 200.0, "K": 800.0, "n": 0.3}, {"sigma_y": 300.0, "K": 300.0, "n": 0.1}])
+
+    assert result.parameters["E"] == 200000.0
+    assert result.cost < 1e-6 * calibrator.residuals({"sigma_y": 200.0, "K": 800.0, "n": 0.3}).size
+    for name in ("sigma_y", "K", "n"):
+        assert np.isclose(result.parameters[name], true[name], rtol=1e-3)
+
+def test_process_pool_matches_serial():
+    true = {"E": 200000.0, "sigma_y": 250.0, "H": 10000.0}
+    curves = measured_curves(KinematicHardeningModel, true, [0.01, 0.015, 0.02])
+    start = {"sigma_y": 200.0, "H": 20000.0}
+    serial = HardeningModelCalibrator(KinematicHardeningModel, curves, ["sigma_y", "H"], {"E": 200000.0}).fit(start)
+    parallel = HardeningModelCalibrator(KinematicHardeningModel, curves, ["sigma_y", "H"], {"E": 200000.0},
+                                        n_workers=2).fit(start)
+    assert parallel.parameters == serial.parameters
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError, match="At least one experimental curve"):
+        HardeningModelCalibrator(KinematicHardeningModel, [], ["H"])
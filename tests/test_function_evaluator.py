@@ -0,0 +1,80 @@
+import math
+import time
+import numpy as np
+import pytest
+from root_finding_methods import (BisectionSolver, BrentSolver, NewtonMethodSolver,
+                                  FunctionEvaluator, EvaluationBudgetExceeded)
+
+class TestFunctionEvaluator:
+    def setup_method(self):
+        self.points = []
+
+    def func(self, x):
+        self.points.append(x)
+        return x**2 - 2
+
+    def test_counts_and_caches_scalars(self):
+        evaluator = FunctionEvaluator(self.func, cache_size=2)
+        assert evaluator(1.0) == -1
+        assert evaluator(1.0) == -1
+        evaluator(2.0)
+        evaluator(3.0)  # evicts 1.0
+        evaluator(1.0)
+        assert evaluator.calls == 4
+        assert evaluator.cache_hits == 1
+        assert self.points == [1.0, 2.0, 3.0, 1.0]
+
+    def test_caches_single_points_only(self):
+        evaluator = FunctionEvaluator(self.func, cache_size=4)
+        evaluator(np.array([1.0, 2.0]))
+        evaluator(np.array([1.0, 2.0]))
+        evaluator(np.ones((2, 2)))
+        evaluator(np.ones((2, 2)))
+        assert evaluator.calls == 3
+
+    def test_evaluation_budget(self):
+        evaluator = FunctionEvaluator(self.func, max_evaluations=2)
+        evaluator(1.0)
+        evaluator(2.0)
+        with pytest.raises(EvaluationBudgetExceeded, match="2 calls"):
+            evaluator(3.0)
+
+    def test_time_budget(self):
+        evaluator = FunctionEvaluator(self.func, max_time=0.01)
+        evaluator(1.0)
+        time.sleep(0.02)
+        with pytest.raises(EvaluationBudgetExceeded, match="Time budget"):
+            evaluator(2.0)
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError, match="Cache size"):
+            FunctionEvaluator(self.func, cache_size=-1)
+        with pytest.raises(ValueError, match="Max evaluations"):
+            BisectionSolver(max_evaluations=0)
+        with pytest.raises(ValueError, match="Max time"):
+            NewtonMethodSolver(max_time=-1)
+
+
+class TestSolverEvaluationAccounting:
+    def test_bracket_repair_reuses_evaluations(self):
+        calls = []
+
+        def f(x):
+            calls.append(x)
+            return x**2 - 1
+
+        solver = BisectionSolver()
+        root, _ = solver.solve(f, -2, 2)
+        assert math.isclose(abs(root), 1, abs_tol=1e-6)
+        assert solver.function_evaluations == len(calls) == len(set(calls))
+
+    def test_budgets_cap_runaway_solves(self):
+        with pytest.raises(EvaluationBudgetExceeded):
+            BrentSolver(max_evaluations=3).solve(math.sin, 3, 4)
+        with pytest.raises(ValueError):
+            NewtonMethodSolver(max_evaluations=5).solve(lambda x: np.exp(x) - 1, np.array([100.0, 100.0]))
+
+    def test_newton_batch_counts_calls(self):
+        solver = NewtonMethodSolver()
+        solver.solve_batch(lambda x: x**2 - 4, np.ones((3, 1)))
+        assert solver.function_evaluations > 0
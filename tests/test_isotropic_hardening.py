@@ -1,6 +1,8 @@
+import copy
 import pytest
 import numpy as np
-from elasto_plastic_models import IsotropicHardeningModel
+from elasto_plastic_models import IsotropicHardeningModel, BatchIsotropicHardeningModel, IsotropicState
+from root_finding_methods import BisectionSolver
 @pytest.fixture
 def model():
     return IsotropicHardeningModel(E=200000, sigma_y=250, K=1500, n=0.3)
@@ -52,10 +54,185 @@ def test_cyclic_loading(model):
         stresses.append(model.calculate_stress(strain))
     assert len(set(map(abs, stresses))) > 1  # Check for Bauschinger effect
 
+def test_bracketed_solver_choice():
+    strains = np.linspace(0, 0.05, 50)
+    brent = IsotropicHardeningModel(E=200000, sigma_y=250, K=1500, n=0.3, return_mapping="bracketed")
+    bisection = IsotropicHardeningModel(E=200000, sigma_y=250, K=1500, n=0.3, return_mapping="bracketed",
+                                        solver=BisectionSolver(max_iterations=1000, tolerance=1e-6))
+    for strain in strains:
+        assert np.isclose(brent.calculate_stress(strain), bisection.calculate_stress(strain), rtol=1e-4)
+        if strain > 0.01:
+            assert brent.solver.function_evaluations < bisection.solver.function_evaluations
+
+def test_newton_return_mapping(model, capsys):
+    bracketed = IsotropicHardeningModel(E=200000, sigma_y=250, K=1500, n=0.3, return_mapping="bracketed")
+    strains = np.concatenate([np.linspace(0, 0.05, 50), np.linspace(0.05, -0.05, 100)])
+    evaluations = []
+    for strain in strains:
+        model.status = None
+        stress = model.calculate_stress(strain)
+        assert np.isclose(stress, bracketed.calculate_stress(strain), rtol=1e-4)
+        if model.status is not None:
+            assert model.status.converged
+            evaluations.append(model.status.function_evaluations)
+    assert np.mean(evaluations) <= 4
+    assert capsys.readouterr().out == ""
+
+def test_compressive_loading(model):
+    stress = model.calculate_stress(-0.02)
+    assert stress < -250
+    assert model.get_plastic_strain() < 0
+    assert model.status.converged
+    assert np.isclose(stress, -IsotropicHardeningModel(E=200000, sigma_y=250, K=1500, n=0.3).calculate_stress(0.02))
+
+@pytest.mark.parametrize("return_mapping", ["newton", "bracketed"])
+def test_stress_path_matches_calculate_stress(return_mapping):
+    strains = 0.03 * np.sin(np.linspace(0, 6 * np.pi, 400))
+    reference = IsotropicHardeningModel(E=200000, sigma_y=250, K=1500, n=0.3, return_mapping=return_mapping)
+    model = IsotropicHardeningModel(E=200000, sigma_y=250, K=1500, n=0.3, return_mapping=return_mapping)
+    expected = [reference.calculate_stress(strain) for strain in strains]
+
+    stresses, plastic_strains, yield_stresses = model.calculate_stress_path(strains)
+    assert np.allclose(stresses, expected, rtol=1e-12)
+    assert np.isclose(plastic_strains[-1], reference.get_plastic_strain(), rtol=1e-12)
+    assert np.isclose(yield_stresses[-1], reference.get_current_yield_stress(), rtol=1e-12)
+    assert model.status.converged
+
+def test_batch_matches_scalar():
+    rng = np.random.default_rng(1)
+    n_points, n_steps = 40, 60
+    histories = np.cumsum(rng.normal(0, 0.002, (n_steps, n_points)), axis=0)
+
+    batch = BatchIsotropicHardeningModel(E=200000, sigma_y=250, K=1500, n=0.3, n_points=n_points)
+    scalars = [IsotropicHardeningModel(E=200000, sigma_y=250, K=1500, n=0.3) for _ in range(n_points)]
+    for strains in histories:
+        stresses = batch.calculate_stress(strains)
+        expected = [model.calculate_stress(strain) for model, strain in zip(scalars, strains)]
+        assert np.allclose(stresses, expected, rtol=1e-12)
+        assert batch.converged.all()
+    assert np.allclose(batch.plastic_strain, [model.get_plastic_strain() for model in scalars], rtol=1e-12)
+
+    batch.reset()
+    assert not batch.plastic_strain.any()
+    assert (batch.current_yield_stress == 250).all()
+
+def test_invalid_return_mapping():
+    with pytest.raises(ValueError, match="Return mapping must be one of"):
+        IsotropicHardeningModel(E=200000, sigma_y=250, K=1500, n=0.3, return_mapping="explicit")
+
+def test_adaptive_substepping_converges_to_fine_path():
+    coarse = 0.02 * np.sin(np.linspace(0, 4 * np.pi, 21))
+    fine = np.interp(np.linspace(0, 20, 20001), np.arange(21), coarse)
+    reference = IsotropicHardeningModel(E=200000, sigma_y=250, K=500, n=0.1).calculate_stress_path(fine)[0][::1000]
+    single = IsotropicHardeningModel(E=200000, sigma_y=250, K=500, n=0.1).calculate_stress_path(coarse)[0]
+
+    model = IsotropicHardeningModel(E=200000, sigma_y=250, K=500, n=0.1, substep_tolerance=1e-4)
+    substeps = 0
+    adaptive = []
+    for strain in coarse:
+        adaptive.append(model.calculate_stress(strain))
+        substeps += model.substeps
+    # Hardening with the equivalent plastic strain makes the single backward Euler step exact in 1D
+    assert np.allclose(single, reference, rtol=1e-9)
+    assert np.allclose(adaptive, reference, rtol=1e-9)
+    assert substeps < 1000
+    assert model.total_strain == coarse[-1]
+
+    model.reset()
+    assert np.allclose(model.calculate_stress_path(coarse)[0], adaptive)
+
+def test_tangent_matches_finite_differences():
+    rng = np.random.default_rng(3)
+    model = IsotropicHardeningModel(E=200000, sigma_y=250, K=500, n=0.3)
+    strain = 0.0
+    for _ in range(100):
+        strain += rng.normal(0, 0.003)
+        before = copy.deepcopy(model)
+        stress, tangent = model.calculate_stress(strain, return_tangent=True)
+        assert stress == copy.deepcopy(before).calculate_stress(strain)
+        h = 1e-9
+        difference = (copy.deepcopy(before).calculate_stress(strain + h)
+                      - copy.deepcopy(before).calculate_stress(strain - h)) / (2 * h)
+        assert np.isclose(tangent, difference, rtol=1e-3, atol=1e-3)
+
+def test_batch_tangent_matches_scalar():
+    rng = np.random.default_rng(4)
+    batch = BatchIsotropicHardeningModel(E=200000, sigma_y=250, K=500, n=0.3, n_points=30)
+    scalars = [IsotropicHardeningModel(E=200000, sigma_y=250, K=500, n=0.3) for _ in range(30)]
+    strains = np.zeros(30)
+    for _ in range(30):
+        strains += rng.normal(0, 0.003, 30)
+        _, tangents = batch.calculate_stress(strains, return_tangent=True)
+        expected = [model.calculate_stress(strain, return_tangent=True)[1] for model, strain in zip(scalars, strains)]
+        assert np.allclose(tangents, expected)
+
+def test_invalid_substep_tolerance():
+    with pytest.raises(ValueError, match="Substep tolerance"):
+        IsotropicHardeningModel(E=200000, sigma_y=250, K=1500, n=0.3, substep_tolerance=0)
+
 def test_large_strain(model):
     stress = model.calculate_stress(0.1)  # 10% strain
     assert stress >= model.get_current_yield_stress()
     assert model.get_plastic_strain() > 0.09  # Approximate check
 
+def test_trial_with_substepping_matches_calculate_stress():
+    model = IsotropicHardeningModel(E=200000, sigma_y=250, K=500, n=0.1, substep_tolerance=1e-4)
+    reference = IsotropicHardeningModel(E=200000, sigma_y=250, K=500, n=0.1, substep_tolerance=1e-4)
+    for strain in 0.02 * np.sin(np.linspace(0, 4 * np.pi, 21)):
+        committed = model.snapshot()
+        stress, tangent, state = model.trial(strain)
+        assert model.state is committed
+        assert (stress, tangent) == reference.calculate_stress(strain, return_tangent=True)
+        model.commit(state)
+        assert model.state == reference.state
+
+def test_rollback_and_checkpoint_restart(tmp_path):
+    strains = 0.02 * np.sin(np.linspace(0, 8 * np.pi, 400))
+    uninterrupted = IsotropicHardeningModel(E=200000, sigma_y=250, K=500, n=0.1).calculate_stress_path(strains)[0]
+
+    model = IsotropicHardeningModel(E=200000, sigma_y=250, K=500, n=0.1)
+    first = model.calculate_stress_path(strains[:150])[0]
+    checkpoint = model.snapshot()
+    model.calculate_stress_path(-strains[150:])
+    model.commit(checkpoint)
+    np.save(tmp_path / "checkpoint.npy", np.array(model.snapshot()))
+
+    restarted = IsotropicHardeningModel(E=200000, sigma_y=250, K=500, n=0.1)
+    restarted.commit(IsotropicState(*np.load(tmp_path / "checkpoint.npy")))
+    second = restarted.calculate_stress_path(strains[150:])[0]
+    assert np.array_equal(np.concatenate([first, second]), uninterrupted)
+
+def test_batch_trial_leaves_state_unchanged():
+    rng = np.random.default_rng(5)
+    batch = BatchIsotropicHardeningModel(E=200000, sigma_y=250, K=500, n=0.3, n_points=20)
+    reference = BatchIsotropicHardeningModel(E=200000, sigma_y=250, K=500, n=0.3, n_points=20)
+    strains = np.zeros(20)
+    for _ in range(20):
+        strains += rng.normal(0, 0.003, 20)
+        snapshot = batch.snapshot()
+        for _ in range(3):
+            stress, tangent, state = batch.trial(strains + rng.normal(0, 0.001, 20))
+        stress, tangent, state = batch.trial(strains)
+        assert np.array_equal(batch.state, snapshot)
+        expected_stress, expected_tangent = reference.calculate_stress(strains, return_tangent=True)
+        assert np.array_equal(stress, expected_stress)
+        assert np.array_equal(tangent, expected_tangent)
+        batch.commit(state)
+        assert np.array_equal(batch.current_yield_stress, reference.current_yield_stress)
+
+def test_trial_leaves_diagnostics_unchanged():
+    model = IsotropicHardeningModel(E=200000, sigma_y=250, K=500, n=0.1, substep_tolerance=1e-4)
+    model.calculate_stress(0.0)
+    model.trial(0.02)
+    assert model.status is None
+    assert model.substeps == 1
+    assert model.tangent == 200000
+
+    batch = BatchIsotropicHardeningModel(E=200000, sigma_y=250, K=500, n=0.1, n_points=2, max_iterations=1)
+    batch.trial(np.array([0.02, -0.02]))
+    assert batch.converged.all()
+    batch.calculate_stress(np.array([0.02, -0.02]))
+    assert not batch.converged.all()
+
 if __name__ == "__main__":
-    pytest.main()
\ No newline at end of file
+    pytest.main()
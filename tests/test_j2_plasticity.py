@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from elasto_plastic_models import J2PlasticityModel
+
+E, NU, SIGMA_Y = 200000.0, 0.3, 250.0
+
+def uniaxial_strains(stress, plastic_strain):
+    """Voigt total strain of a uniaxial stress state with the given axial plastic strain"""
+    axial = stress / E + plastic_strain
+    lateral = -NU * stress / E - plastic_strain / 2
+    return np.column_stack([axial, lateral, lateral, 0 * axial, 0 * axial, 0 * axial])
+
+def drive(model, strains):
+    previous = np.zeros((model.n_points, 6))
+    for step in strains:
+        model.calculate_stress(step - previous)
+        previous = step
+    return model.stress
+
+def test_elastic_response():
+    model = J2PlasticityModel(E, NU, SIGMA_Y, n_points=2)
+    drive(model, [uniaxial_strains(np.array([100.0, -200.0]), np.zeros(2))])
+    assert np.allclose(model.stress[:, 0], [100.0, -200.0])
+    assert np.allclose(model.stress[:, 1:], 0, atol=1e-9)
+    assert not model.plastic_strain.any()
+
+def test_uniaxial_kinematic_matches_1d_law():
+    H = 10000.0
+    plastic = np.linspace(0, 0.01, 6)
+    stress = SIGMA_Y + H * plastic
+    model = J2PlasticityModel(E, NU, SIGMA_Y, n_points=6, H=H)
+    stresses = drive(model, [uniaxial_strains(stress * t, plastic * t) for t in np.linspace(0, 1, 11)[1:]])
+
+    assert np.allclose(stresses[:, 0], stress, rtol=1e-8)
+    assert np.allclose(stresses[:, 1:], 0, atol=1e-6)
+    assert np.allclose(model.plastic_strain[:, 0], plastic, atol=1e-12)
+    assert np.allclose(model.back_stress[:, 0], 2 / 3 * H * plastic)
+
+def test_uniaxial_power_law_matches_1d_law():
+    K, n = 500.0, 0.2
+    plastic = np.array([0.0, 1e-4, 0.01, 0.05])
+    stress = SIGMA_Y + K * plastic**n
+    model = J2PlasticityModel(E, NU, SIGMA_Y, n_points=4, K=K, n=n, tolerance=1e-10)
+    stresses = drive(model, [uniaxial_strains(stress, plastic)])
+
+    assert model.converged.all()
+    assert np.allclose(stresses[:, 0], stress, rtol=1e-8)
+    assert np.allclose(model.equivalent_plastic_strain, plastic, atol=1e-12)
+    assert np.allclose(model.von_mises_stress(), stress, rtol=1e-8)
+
+def test_random_increments_stay_on_yield_surface():
+    rng = np.random.default_rng(0)
+    n_points = 500
+    model = J2PlasticityModel(E, NU, SIGMA_Y, n_points=n_points, H=5000.0, K=800.0, n=0.3, tolerance=1e-9)
+    for _ in range(20):
+        model.calculate_stress(rng.normal(0, 2e-3, (n_points, 6)))
+        relative = model.stress - model.back_stress
+        relative[:, :3] -= relative[:, :3].mean(axis=1, keepdims=True)
+        norm = np.sqrt((relative[:, :3]**2).sum(axis=1) + 2 * (relative[:, 3:]**2).sum(axis=1))
+        radius = np.sqrt(2 / 3) * model.yield_stress(model.equivalent_plastic_strain)
+        assert model.converged.all()
+        assert (norm <= radius * (1 + 1e-8)).all()
+
+    # Rows are independent: a single point follows the same history
+    single = J2PlasticityModel(E, NU, SIGMA_Y, n_points=1, H=5000.0, K=800.0, n=0.3, tolerance=1e-9)
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        single.calculate_stress(rng.normal(0, 2e-3, (n_points, 6))[:1])
+    assert np.allclose(single.stress, model.stress[:1])
+
+def test_returned_arrays_are_not_updated_by_later_calls():
+    model = J2PlasticityModel(E, NU, SIGMA_Y, n_points=1, K=500.0, n=0.2)
+    increment = uniaxial_strains(np.array([300.0]), np.array([0.003]))
+    first = model.calculate_stress(increment)
+    saved = [array.copy() for array in first]
+    model.calculate_stress(increment)
+    for array, expected in zip(first, saved):
+        assert np.array_equal(array, expected)
+    assert model.equivalent_plastic_strain[0] > first[3][0]
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        J2PlasticityModel(E, 0.5, SIGMA_Y, n_points=1)
+    model = J2PlasticityModel(E, NU, SIGMA_Y, n_points=2)
+    with pytest.raises(ValueError):
+        model.calculate_stress(np.zeros((3, 6)))
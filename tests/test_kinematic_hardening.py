@@ -1,8 +1,9 @@
 # tests/test_kinematic_hardening.py
 
+import copy
 import pytest
 import numpy as np
-from elasto_plastic_models import KinematicHardeningModel
+from elasto_plastic_models import KinematicHardeningModel, BatchKinematicHardeningModel, KinematicState
 
 @pytest.fixture
 def model():
@@ -66,5 +67,117 @@ def test_bauschinger_effect_magnitude(model):
     reverse_stress = abs(model.calculate_stress(-0.02))
     assert reverse_stress <= forward_stress
 
+def test_batch_matches_scalar_bit_for_bit():
+    rng = np.random.default_rng(0)
+    n_points, n_steps = 40, 60
+    histories = np.cumsum(rng.normal(0, 0.002, (n_steps, n_points)), axis=0)
+
+    batch = BatchKinematicHardeningModel(E=200000, sigma_y=250, H=10000, n_points=n_points)
+    scalars = [KinematicHardeningModel(E=200000, sigma_y=250, H=10000) for _ in range(n_points)]
+    for strains in histories:
+        stresses = batch.calculate_stress(strains)
+        expected = [model.calculate_stress(strain) for model, strain in zip(scalars, strains)]
+        assert np.array_equal(stresses, expected)
+    assert np.array_equal(batch.plastic_strain, [model.plastic_strain for model in scalars])
+    assert np.array_equal(batch.back_stress, [model.back_stress for model in scalars])
+
+def test_stress_path_matches_calculate_stress(model):
+    strains = 0.03 * np.sin(np.linspace(0, 6 * np.pi, 400))
+    reference = KinematicHardeningModel(E=200000, sigma_y=250, H=10000)
+    expected = [reference.calculate_stress(strain) for strain in strains]
+
+    stresses, plastic_strains, back_stresses = model.calculate_stress_path(strains)
+    assert np.array_equal(stresses, expected)
+    assert plastic_strains[-1] == model.plastic_strain == reference.plastic_strain
+    assert back_stresses[-1] == model.back_stress == reference.back_stress
+
+def test_stress_path_continues_state(model):
+    strains = np.linspace(0, 0.02, 50)
+    full = KinematicHardeningModel(E=200000, sigma_y=250, H=10000).calculate_stress_path(strains)[0]
+    first = model.calculate_stress_path(strains[:20])[0]
+    second = model.calculate_stress_path(strains[20:])[0]
+    assert np.array_equal(np.concatenate([first, second]), full)
+
+def test_adaptive_substepping_keeps_exact_linear_return():
+    strains = 0.02 * np.sin(np.linspace(0, 4 * np.pi, 20))
+    single = KinematicHardeningModel(E=200000, sigma_y=250, H=10000)
+    adaptive = KinematicHardeningModel(E=200000, sigma_y=250, H=10000, substep_tolerance=1e-6)
+    for strain in strains:
+        assert np.isclose(adaptive.calculate_stress(strain), single.calculate_stress(strain))
+        assert adaptive.substeps == 1
+        assert np.isclose(adaptive.plastic_strain, single.plastic_strain)
+    with pytest.raises(ValueError):
+        KinematicHardeningModel(E=200000, sigma_y=250, H=10000, max_substeps=0)
+
+def test_tangent_matches_finite_differences():
+    model = KinematicHardeningModel(E=200000, sigma_y=250, H=10000)
+    batch = BatchKinematicHardeningModel(E=200000, sigma_y=250, H=10000, n_points=1)
+    for strain in 0.02 * np.sin(np.linspace(0.1, 4 * np.pi, 23)):
+        before = copy.deepcopy(model)
+        _, tangent = model.calculate_stress(strain, return_tangent=True)
+        _, batch_tangent = batch.calculate_stress(np.array([strain]), return_tangent=True)
+        h = 1e-9
+        difference = (copy.deepcopy(before).calculate_stress(strain + h)
+                      - copy.deepcopy(before).calculate_stress(strain - h)) / (2 * h)
+        assert np.isclose(tangent, difference, rtol=1e-4)
+        assert batch_tangent[0] == tangent
+
+def test_uniaxial_law_and_continuous_unloading(model):
+    # sigma = sigma_y + H * plastic_strain on loading, elastic slope E on unloading
+    loaded = model.calculate_stress(0.003)
+    assert loaded == pytest.approx(250 + 10000 * model.plastic_strain)
+    assert loaded == pytest.approx(250 + 200000 * 10000 / 210000 * (0.003 - 250 / 200000))
+    assert model.calculate_stress(0.00299) == pytest.approx(loaded - 200000 * 1e-5)
+    batch = BatchKinematicHardeningModel(E=200000, sigma_y=250, H=10000, n_points=1)
+    path = KinematicHardeningModel(E=200000, sigma_y=250, H=10000).calculate_stress_path([0.003, 0.00299])[0]
+    assert np.allclose([batch.calculate_stress(np.array([0.003]))[0], batch.calculate_stress(np.array([0.00299]))[0]],
+                       path)
+    assert np.allclose(path, [loaded, loaded - 2.0])
+
+def test_batch_reset():
+    batch = BatchKinematicHardeningModel(E=200000, sigma_y=250, H=10000, n_points=3)
+    batch.calculate_stress(np.array([0.0, 0.02, -0.02]))
+    batch.reset()
+    assert not batch.plastic_strain.any()
+    assert not batch.back_stress.any()
+
+def test_trial_does_not_change_state_until_commit(model):
+    model.calculate_stress(0.01)
+    committed = model.snapshot()
+    stress, tangent, state = model.trial(-0.01)
+    assert model.state == committed
+    assert state.total_strain == -0.01
+
+    reference = KinematicHardeningModel(E=200000, sigma_y=250, H=10000)
+    reference.calculate_stress(0.01)
+    assert (stress, tangent) == reference.calculate_stress(-0.01, return_tangent=True)
+    model.commit(state)
+    assert model.state == reference.state
+
+def test_checkpoint_restart_of_cyclic_run(tmp_path):
+    strains = 0.02 * np.sin(np.linspace(0, 8 * np.pi, 400))
+    uninterrupted = KinematicHardeningModel(E=200000, sigma_y=250, H=10000).calculate_stress_path(strains)[0]
+
+    model = KinematicHardeningModel(E=200000, sigma_y=250, H=10000)
+    first = model.calculate_stress_path(strains[:150])[0]
+    np.save(tmp_path / "checkpoint.npy", np.array(model.snapshot()))
+    restarted = KinematicHardeningModel(E=200000, sigma_y=250, H=10000)
+    restarted.commit(KinematicState(*np.load(tmp_path / "checkpoint.npy")))
+    second = restarted.calculate_stress_path(strains[150:])[0]
+    assert np.array_equal(np.concatenate([first, second]), uninterrupted)
+
+def test_batch_trial_and_snapshot():
+    batch = BatchKinematicHardeningModel(E=200000, sigma_y=250, H=10000, n_points=3)
+    batch.calculate_stress(np.array([0.0, 0.02, -0.02]))
+    snapshot = batch.snapshot()
+    stress, tangent, state = batch.trial(np.array([0.03, 0.0, -0.03]))
+    assert np.array_equal(batch.state, snapshot)
+    assert state.shape == (len(BatchKinematicHardeningModel.STATE_FIELDS), 3)
+
+    batch.commit(state)
+    assert np.array_equal(batch.plastic_strain, state[0])
+    batch.commit(snapshot)
+    assert np.array_equal(batch.calculate_stress(np.array([0.03, 0.0, -0.03])), stress)
+
 if __name__ == "__main__":
     pytest.main()
\ No newline at end of file
@@ -2,6 +2,7 @@ import math
 import pytest
 from root_finding_methods import NewtonMethodSolver
 import numpy as np
+import scipy.sparse
 
 
 class TestNewtonMethodSolverSystem:
@@ -58,5 +59,236 @@ class TestNewtonMethodSolverSystem:
             # If it raises an exception, make sure it's related to the singular Jacobian
             assert "singular" in str(e).lower() or "zero" in str(e).lower(), f"Unexpected error: {str(e)}"
 
+    def test_broyden_mode_saves_evaluations(self):
+        def f(x):
+            return np.array([
+                np.sin(x[0]) + x[1]**2 - 1,
+                x[0]**2 + np.cos(x[1]) - 1,
+                x[2]**3 + x[0] - 2
+            ])
+
+        root, _ = self.solver.solve(f, np.array([0.5, 0.5, 0.5]))
+        newton_evaluations = self.solver.function_evaluations
+
+        broyden = NewtonMethodSolver(method="broyden")
+        broyden_root, _ = broyden.solve(f, np.array([0.5, 0.5, 0.5]))
+
+        assert np.allclose(f(broyden_root), np.zeros(3), atol=1e-6)
+        assert np.allclose(broyden_root, root, atol=1e-5)
+        assert broyden.function_evaluations < newton_evaluations
+
+    def test_broyden_mode_errors(self):
+        broyden = NewtonMethodSolver(method="broyden")
+        with pytest.raises(ValueError, match="singular"):
+            broyden.solve(lambda x: np.array([x[0]**2 - x[1]**2, x[0]**2 - x[1]**2]), np.array([1.0, 0.5]))
+        with pytest.raises(ValueError, match="Method must be one of"):
+            NewtonMethodSolver(method="secant")
+
+    def test_chord_mode_reuses_factorization(self):
+        n = 200
+        A = np.eye(n) * 4 + np.diag(np.ones(n - 1), 1) + np.diag(np.ones(n - 1), -1)
+
+        def f(x):
+            return A @ x + 0.1 * x**3 - 1
+
+        chord = NewtonMethodSolver(method="chord", tolerance=1e-10)
+        root, iterations = chord.solve(f, np.zeros(n))
+
+        assert np.allclose(f(root), 0, atol=1e-10)
+        assert chord.function_evaluations < 2 * (2 * n + 1)  # at most one refactorization
+        assert iterations > 1
+
+    def test_chord_mode_detects_singular_pivots(self):
+        chord = NewtonMethodSolver(method="chord")
+        with pytest.raises(ValueError, match="singular"):
+            chord.solve(lambda x: np.array([x[0] + x[1] - 1, 2 * x[0] + 2 * x[1] - 2.5]), np.array([0.0, 0.0]))
+
+    def test_sparse_banded_system(self):
+        n = 10000
+        pattern = scipy.sparse.diags([1.0, 1.0, 1.0], [-1, 0, 1], shape=(n, n))
+
+        def f(x):
+            r = 4 * x + 0.1 * x**3 - 1
+            r[1:] -= x[:-1]
+            r[:-1] -= x[1:]
+            return r
+
+        solver = NewtonMethodSolver(sparsity=pattern)
+        assert solver.column_colors.max() + 1 == 3
+        root, iterations = solver.solve(f, np.zeros(n))
+
+        assert np.linalg.norm(f(root)) < 1e-6
+        assert solver.function_evaluations == iterations * (1 + 2 * 3) + 1
+
+    def test_sparse_jacobian_matches_dense(self):
+        pattern = np.array([[1, 1, 0], [0, 1, 1], [1, 0, 1]])
+
+        def f(x):
+            return np.array([x[0]**2 + x[1], np.sin(x[1]) * x[2], x[0] * x[2]**2])
+
+        x = np.array([0.3, -0.2, 1.1])
+        sparse_J = NewtonMethodSolver(sparsity=pattern).numerical_jacobian(f, x)
+        assert np.allclose(sparse_J.toarray(), self.solver.numerical_jacobian(f, x))
+
+    def test_vectorized_jacobian_single_call(self):
+        def f(x):
+            x = x.T
+            return np.array([
+                np.sin(x[0]) + x[1]**2 - 1,
+                x[0]**2 + np.cos(x[1]) - 1
+            ]).T
+
+        solver = NewtonMethodSolver(vectorized=True)
+        x = np.array([0.5, 0.5])
+        assert np.allclose(solver.numerical_jacobian(f, x), self.solver.numerical_jacobian(f, x))
+
+        root, iterations = solver.solve(f, x)
+        assert np.allclose(f(root), np.zeros(2), atol=1e-6)
+        assert solver.function_evaluations == 2 * iterations + 1
+
+    def test_vectorized_sparse_jacobian(self):
+        n = 50
+        pattern = scipy.sparse.diags([1.0, 1.0, 1.0], [-1, 0, 1], shape=(n, n))
+
+        def f(x):
+            r = 4 * x + 0.1 * x**3 - 1
+            r[..., 1:] -= x[..., :-1]
+            r[..., :-1] -= x[..., 1:]
+            return r
+
+        x = np.linspace(0, 1, n)
+        vectorized = NewtonMethodSolver(sparsity=pattern, vectorized=True)
+        assert np.allclose(vectorized.numerical_jacobian(f, x).toarray(), self.solver.numerical_jacobian(f, x))
+        buffer = vectorized._perturbations
+        vectorized.numerical_jacobian(f, x + 1)
+        assert vectorized._perturbations is buffer
+        assert buffer.shape == (6, n)
+
+    def test_batch_matches_scalar_solve(self):
+        radii = np.linspace(1.0, 3.0, 50)
+
+        def f(x, r):
+            return np.stack([x[:, 0]**2 + x[:, 1]**2 - r**2, x[:, 0] - x[:, 1]], axis=1)
+
+        guesses = np.tile([0.5, 0.5], (50, 1))
+        roots, iterations, converged = self.solver.solve_batch(f, guesses, radii)
+
+        assert converged.all()
+        assert np.allclose(roots, np.outer(radii / np.sqrt(2), [1, 1]), atol=1e-6)
+        root, its = self.solver.solve(lambda x: f(x[np.newaxis], radii[:1])[0], np.array([0.5, 0.5]))
+        assert np.allclose(roots[0], root)
+        assert iterations[0] == its
+
+    def test_batch_retires_failed_systems(self):
+        def f(x):
+            return np.stack([x[:, 0]**2 - 1, x[:, 1]**2 - x[:, 0]**2], axis=1)
+
+        guesses = np.array([[0.5, 0.7], [1.0, 1.0], [0.0, 0.0], [1e11, 1.0]])
+        roots, iterations, converged = self.solver.solve_batch(f, guesses)
+
+        assert converged.tolist() == [True, True, False, False]  # singular and diverged starts fail
+        assert iterations[1:].tolist() == [0, 0, 0]
+        assert np.allclose(f(roots[:2]), 0, atol=1e-6)
+
+    def test_sequence_matches_independent_solves(self):
+        def f(x, p):
+            return np.array([x[0]**3 + x[0] - p, x[1] + 0.5 * np.sin(x[1]) - 0.1 * p + 0.01 * x[0]])
+
+        parameters = np.linspace(0, 100, 51)
+        solutions, iterations, converged = self.solver.solve_sequence(f, parameters, [0.0, 0.0])
+        sequence_evaluations = self.solver.function_evaluations
+
+        assert converged.all()
+        independent_evaluations = 0
+        for p, solution in zip(parameters, solutions):
+            root, _ = self.solver.solve(lambda x: f(x, p), np.zeros(2))
+            independent_evaluations += self.solver.function_evaluations
+            assert np.allclose(root, solution, atol=1e-5)
+        assert sequence_evaluations < independent_evaluations / 4
+
+    def test_sequence_substeps_where_direct_solve_fails(self):
+        def f(x, p):
+            return np.arctan(x - p)
+
+        with pytest.raises(ValueError):
+            self.solver.solve(lambda x: f(x, 10.0), np.array([0.0]))
+        solutions, iterations, converged = self.solver.solve_sequence(f, [0.0, 10.0], [0.0])
+        assert converged.all()
+        assert np.isclose(solutions[1, 0], 10.0)
+
+    def test_sequence_failure_and_invalid_inputs(self):
+        def f(x, p):
+            return np.array([x[0]**2 + p])
+
+        solutions, iterations, converged = self.solver.solve_sequence(f, [-1.0, 0.5, 1.0], [2.0])
+        assert converged.tolist() == [True, False, False]
+        assert np.isnan(solutions[1:]).all()
+        with pytest.raises(ValueError):
+            self.solver.solve_sequence(f, [], [2.0])
+        with pytest.raises(ValueError):
+            self.solver.solve_sequence(f, [1.0], [2.0], target_iterations=0)
+
+    @pytest.mark.parametrize("method", ["newton", "chord"])
+    @pytest.mark.parametrize("sparse", [False, True])
+    def test_user_jacobian_skips_finite_differences(self, method, sparse):
+        def f(x):
+            return np.array([x[0]**2 + x[1]**2 - 4, x[1] - x[0]**2 + 1])
+
+        def jacobian(x):
+            J = np.array([[2 * x[0], 2 * x[1]], [-2 * x[0], 1.0]])
+            return scipy.sparse.csc_matrix(J) if sparse else J
+
+        solver = NewtonMethodSolver(tolerance=1e-12, method=method)
+        root, iterations = solver.solve(f, np.array([1.0, 1.0]), jacobian=jacobian)
+        assert np.allclose(f(root), 0, atol=1e-12)
+        assert solver.function_evaluations == iterations + 1
+        with pytest.raises(TypeError):
+            solver.solve(f, np.array([1.0, 1.0]), jacobian="analytic")
+
+    def test_sequence_with_user_jacobian(self):
+        parameters = np.linspace(0, 10, 5)
+        self.solver.solve_sequence(lambda x, p: x**3 + x - p, parameters, np.zeros(1))
+        finite_difference_evaluations = self.solver.function_evaluations
+        solutions, _, converged = self.solver.solve_sequence(
+            lambda x, p: x**3 + x - p, parameters, np.zeros(1), jacobian=lambda x, p: np.diag(3 * x**2 + 1))
+        assert converged.all()
+        assert np.allclose(solutions[:, 0]**3 + solutions[:, 0], parameters, atol=1e-6)
+        assert self.solver.function_evaluations < finite_difference_evaluations
+
+    @pytest.mark.parametrize("mode", ["serial", "thread", "process", "batch"])
+    def test_multistart_finds_distinct_roots(self, mode):
+        guesses = np.array([[x, y] for x in (-2.0, -0.5, 0.5, 2.0) for y in (-1.5, 1.5)] + [[0.0, 0.0], [1e11, 0.0]])
+        roots, starts, converged = self.solver.solve_multistart(circle_parabola, guesses, mode=mode, n_workers=2)
+
+        y = (np.sqrt(13) - 1) / 2
+        assert len(roots) == 2
+        assert np.allclose(np.sort(roots[:, 0]), [-np.sqrt(y + 1), np.sqrt(y + 1)], atol=1e-5)
+        assert np.allclose(roots[:, 1], y, atol=1e-5)
+        assert starts.tolist() == sorted(starts.tolist())
+        assert converged[starts].all()
+        assert not converged[-2:].any()  # singular and divergent starts are dropped
+
+    @pytest.mark.parametrize("mode", ["serial", "thread"])
+    def test_multistart_stops_after_max_roots(self, mode):
+        guesses = np.tile([[1.0, 1.0]], (40, 1))
+        roots, starts, converged = self.solver.solve_multistart(circle_parabola, guesses, mode=mode, n_workers=2,
+                                                                max_roots=1)
+        assert len(roots) == 1
+        assert converged.sum() < 40
+
+    def test_multistart_invalid_inputs(self):
+        with pytest.raises(ValueError):
+            self.solver.solve_multistart(circle_parabola, [[1.0, 1.0]], mode="gpu")
+        with pytest.raises(ValueError):
+            self.solver.solve_multistart(circle_parabola, [1.0, 1.0])
+        with pytest.raises(ValueError):
+            self.solver.solve_multistart(circle_parabola, [[1.0, 1.0]], max_roots=0)
+
+
+def circle_parabola(x):
+    """x^2 + y^2 = 4 and y = x^2 - 1 for one point or a stack of points; module level so it pickles."""
+    x = np.asarray(x)
+    return np.stack([x[..., 0]**2 + x[..., 1]**2 - 4, x[..., 1] - x[..., 0]**2 + 1], axis=-1)
+
 if __name__ == "__main__":
     pytest.main()
\ No newline at end of file
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from elasto_plastic_models import ResultWriter, ResultReader, record_stress_stream
+
+STRAINS = 0.02 * np.sin(np.linspace(0, 8 * np.pi, 1001))
+
+def test_writer_grows_and_reader_slices(tmp_path):
+    with ResultWriter(tmp_path / "run", ["a", "b"], initial_capacity=4, flush_every=3) as writer:
+        for start in range(0, 50, 7):
+            values = np.arange(start, min(start + 7, 50), dtype=float)
+            writer.append(a=values, b=-values)
+        writer.append(a=50.0, b=-50.0)
+    reader = ResultReader(tmp_path / "run")
+    assert len(reader) == 51
+    np.testing.assert_array_equal(reader["a"], np.arange(51.0))
+    np.testing.assert_array_equal(reader.read(10, 20, 2)["b"], -np.arange(10.0, 20.0, 2))
+    assert (tmp_path / "run" / "a.bin").stat().st_size == 51 * 8
+
+def test_flushed_steps_readable_before_close(tmp_path):
+    writer = ResultWriter(tmp_path / "run", ["a"], initial_capacity=8, flush_every=5)
+    writer.append(a=np.arange(6.0))
+    writer.append(a=np.arange(2.0))
+    reader = ResultReader(tmp_path / "run")
+    assert len(reader) == 6
+    np.testing.assert_array_equal(reader["a"], np.arange(6.0))
+    writer.close()
+    assert len(ResultReader(tmp_path / "run")) == 8
+
+def test_writer_validation(tmp_path):
+    with pytest.raises(ValueError):
+        ResultWriter(tmp_path / "run", [])
+    with pytest.raises(ValueError):
+        ResultWriter(tmp_path / "run", ["a"], initial_capacity=0)
+    with ResultWriter(tmp_path / "run", ["a", "b"]) as writer:
+        with pytest.raises(ValueError):
+            writer.append(a=[1.0])
+        with pytest.raises(ValueError):
+            writer.append(a=[1.0, 2.0], b=[1.0])
+    with pytest.raises(KeyError):
+        ResultReader(tmp_path / "run")["c"]
+
+def test_record_stress_stream_matches_path(tmp_path, model_factory):
+    expected = model_factory().calculate_stress_path(STRAINS)
+    model = model_factory()
+    reader = record_stress_stream(model, STRAINS, tmp_path / "run", chunk_size=128, flush_every=300)
+    assert reader.fields == ("strain",) + model.PATH_FIELDS
+    assert reader.attributes["model"] == type(model).__name__
+    np.testing.assert_array_equal(reader["strain"], STRAINS)
+    for field, reference in zip(model.PATH_FIELDS, expected):
+        np.testing.assert_array_equal(reader[field], reference)
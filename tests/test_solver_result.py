@@ -0,0 +1,88 @@
+import math
+import time
+import numpy as np
+import pytest
+from root_finding_methods import BisectionSolver, BrentSolver, NewtonMethodSolver, SolverResult
+
+def system(x):
+    return np.array([
+        x[0]**2 + x[1]**2 - 1,
+        x[0] - x[1]
+    ])
+
+class TestSolverResult:
+    def test_result_unpacks_like_tuple(self):
+        result = NewtonMethodSolver().solve(system, np.array([0.5, 0.5]))
+        root, iterations = result
+        assert isinstance(result, SolverResult)
+        assert result[0] is root and result[1] == iterations
+        assert result.converged
+        assert result.termination_reason == "converged"
+        assert result.function_evaluations == 5 * iterations + 1
+        assert result.residual_history is None and result.timings is None
+
+    def test_newton_instrumentation(self):
+        solver = NewtonMethodSolver(instrument=True)
+        result = solver.solve(system, np.array([0.5, 0.5]))
+        assert len(result.residual_history) == result.iterations + 1
+        assert result.residual_history[-1] < 1e-6
+        assert set(result.timings) == {"function", "jacobian", "condition", "linear_solve"}
+        assert all(t >= 0 for t in result.timings.values())
+
+    def test_jacobian_timing_excludes_function_calls(self):
+        def slow_system(x):
+            time.sleep(0.005)
+            return system(x)
+
+        result = NewtonMethodSolver(instrument=True).solve(slow_system, np.array([0.5, 0.5]))
+        # Finite-difference calls are counted under "function" only
+        assert result.timings["function"] >= 0.005 * result.function_evaluations
+        assert result.timings["jacobian"] < 0.005
+
+    @pytest.mark.parametrize("method", ["broyden", "chord"])
+    def test_quasi_newton_instrumentation(self, method):
+        result = NewtonMethodSolver(method=method, instrument=True).solve(system, np.array([0.5, 0.5]))
+        assert result.converged
+        assert len(result.residual_history) == result.iterations + 1
+        assert {"function", "jacobian", "linear_solve"} <= set(result.timings)
+
+    def test_bracketed_instrumentation(self):
+        for solver in (BisectionSolver(instrument=True), BrentSolver(instrument=True)):
+            result = solver.solve(math.sin, 3, 4)
+            assert result.converged
+            assert len(result.residual_history) == result.iterations + 1
+            assert set(result.timings) == {"function"}
+
+    def test_bisection_reports_max_iterations(self):
+        result = BisectionSolver(max_iterations=5).solve(math.sin, 3, 4)
+        assert not result.converged
+        assert result.termination_reason == "max_iterations"
+
+    def test_failures_carry_partial_result(self):
+        with pytest.raises(ValueError, match="Failed to converge") as excinfo:
+            NewtonMethodSolver().solve(lambda x: np.exp(x) - 1, np.array([100.0, 100.0]))
+        assert excinfo.value.result.termination_reason == "max_iterations"
+
+        with pytest.raises(ValueError, match="Root cannot be bracketed") as excinfo:
+            BisectionSolver().solve(lambda x: x**2 + 1, -1, 1)
+        assert excinfo.value.result.termination_reason == "no_bracket"
+
+        with pytest.raises(ValueError) as excinfo:
+            NewtonMethodSolver(max_evaluations=3).solve(system, np.array([0.5, 0.5]))
+        assert excinfo.value.result.termination_reason == "budget_exceeded"
+
+    def test_iteration_callbacks(self):
+        seen = []
+        solver = NewtonMethodSolver()
+        solver.register_callback(lambda iteration, x, norm: seen.append((iteration, norm)))
+        result = solver.solve(system, np.array([0.5, 0.5]))
+        assert [iteration for iteration, _ in seen] == list(range(result.iterations + 1))
+
+        brent = BrentSolver()
+        brent.register_callback(lambda iteration, x, residual: iteration == 2)
+        result = brent.solve(math.sin, 3, 4)
+        assert result.termination_reason == "callback"
+        assert result.iterations == 2 and not result.converged
+
+        with pytest.raises(TypeError, match="Callback must be callable"):
+            solver.register_callback("not callable")
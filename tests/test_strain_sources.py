@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from elasto_plastic_models import KinematicHardeningModel, iter_strain_chunks
+
+STRAINS = 0.02 * np.sin(np.linspace(0, 8 * np.pi, 1001))
+
+def stream(model, source, **options):
+    chunks = list(model.calculate_stress_stream(source, chunk_size=97, **options))
+    assert all(len(chunk[0]) <= 97 for chunk in chunks)
+    return [np.concatenate(field) for field in zip(*chunks)]
+
+def test_stream_matches_path(model_factory):
+    expected = model_factory().calculate_stress_path(STRAINS)
+    model = model_factory()
+    for field, reference in zip(stream(model, STRAINS), expected):
+        np.testing.assert_array_equal(field, reference)
+
+def test_npy_source(tmp_path):
+    path = tmp_path / "strains.npy"
+    np.save(path, STRAINS)
+    np.testing.assert_array_equal(np.concatenate(list(iter_strain_chunks(path, 100))), STRAINS)
+
+def test_binary_source(tmp_path):
+    path = tmp_path / "strains.bin"
+    STRAINS.astype(np.float32).tofile(path)
+    chunks = list(iter_strain_chunks(path, 100, dtype=np.float32))
+    assert len(chunks) == 11
+    np.testing.assert_allclose(np.concatenate(chunks), STRAINS, rtol=1e-6)
+
+def test_csv_source(tmp_path):
+    path = tmp_path / "strains.csv"
+    time = np.arange(STRAINS.size)
+    np.savetxt(path, np.column_stack([time, STRAINS]), delimiter=",", header="time,strain", comments="")
+    chunks = list(iter_strain_chunks(path, 100, column=1, skip_header=1))
+    np.testing.assert_allclose(np.concatenate(chunks), STRAINS)
+
+def test_csv_blank_lines_do_not_end_stream(tmp_path):
+    path = tmp_path / "strains.csv"
+    path.write_text("1\n2\n\n\n3\n4\n")
+    chunks = list(iter_strain_chunks(path, 2))
+    assert [chunk.tolist() for chunk in chunks] == [[1.0, 2.0], [3.0, 4.0]]
+
+def test_iterator_source():
+    items = iter([0.0, 0.001, np.array([0.002, 0.003, 0.004]), 0.005])
+    chunks = list(iter_strain_chunks(items, 2))
+    assert [chunk.tolist() for chunk in chunks] == [[0.0, 0.001], [0.002, 0.003], [0.004], [0.005]]
+
+def test_stream_state_carries_across_chunks():
+    model = KinematicHardeningModel(E=200e3, sigma_y=250, H=10e3)
+    stresses = stream(model, (strain for strain in STRAINS))[0]
+    reference = KinematicHardeningModel(E=200e3, sigma_y=250, H=10e3)
+    np.testing.assert_array_equal(stresses, [reference.calculate_stress(strain) for strain in STRAINS])
+    assert model.plastic_strain == reference.plastic_strain
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        list(iter_strain_chunks(STRAINS, 0))